@@ -0,0 +1,285 @@
+"""Re-plan a running project from its progress log.
+
+    checkpoint = load_checkpoint(path) or Checkpoint()
+    with open("progress.csv", "rb") as log:
+        checkpoint = ingest(checkpoint, log)
+    save_checkpoint(path, checkpoint)
+    revised = replan(plan_inputs, checkpoint)
+
+The log is a CSV with one row per event and at least the columns ``event``,
+``category`` and ``minutes``; any other columns (timestamps, ids) are
+ignored. ``event`` is ``accepted`` or ``rejected`` for a finished submission
+(with the annotation minutes spent on it) or ``review`` for a QA review
+(with the review minutes). ``category`` is A, B or C.
+
+The log only grows, so the checkpoint keeps the per-category totals and the
+byte offset read so far, always at a line end. Each update parses only the
+complete lines appended since, in blocks, so memory stays flat. A hash of
+the file's start and of the bytes just before the offset detects a replaced
+or truncated log, which is then read again from the top. A last line without
+its newline is left for the next update.
+
+Failure rates, minutes per submission and minutes per review are
+re-estimated from the log, shrunk towards the plan's values by PRIOR_WEIGHT
+pseudo-observations so a handful of early rows cannot swing the plan. The
+remaining targets are then run through calculator.calculate with those
+rates and the current staffing.
+"""
+import csv
+import hashlib
+import io
+import json
+import math
+import os
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+
+import pandas as pd
+
+from calculator import calculate
+
+# Checkpoints go to a per-user cache, never the working tree; logs are only
+# opened by name from LOG_DIR (unset: uploads only)
+CHECKPOINT_DIR = Path(os.environ.get("LOGISTICS_ACTUALS_DIR")
+                      or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "logistics-calculator" / "actuals")
+LOG_DIR = os.environ.get("LOGISTICS_ACTUALS_LOG_DIR")
+REQUIRED_COLUMNS = ("event", "category", "minutes")
+EVENTS = ("accepted", "rejected", "review")
+CATEGORIES = ("A", "B", "C")
+PRIOR_WEIGHT = 20  # plan values count as this many observations
+MAX_FAIL = 95  # cap on an estimated failure %, so the gross-up stays finite
+BLOCK_BYTES = 8 << 20
+HEAD_BYTES = 64 << 10
+EDGE_BYTES = 4 << 10
+COST_LINES = ["Worker Annotation", "Qualification Testing", "Expert Review", "Tech / Infrastructure"]
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    columns: tuple = ()  # the log's header
+    offset: int = 0  # bytes consumed, always at a line end
+    head: str = ""  # sha256 of the first HEAD_BYTES consumed
+    edge: str = ""  # sha256 of the EDGE_BYTES before offset
+    rows: int = 0
+    skipped: int = 0  # rows with an unknown event or category
+    totals: dict = field(default_factory=dict)  # "event/category" → [rows, rows with minutes, minutes]
+
+    def total(self, event, category):
+        return self.totals.get(f"{event}/{category}", [0, 0, 0.0])
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# CHECKPOINT FILE
+# ══════════════════════════════════════════════════════════════════════════════
+def checkpoint_path(source):
+    """Where the checkpoint of ``source`` (a log path, or an upload's session and name) is kept."""
+    return CHECKPOINT_DIR / f"actuals-{hashlib.sha1(source.encode()).hexdigest()[:16]}.json"
+
+
+def server_logs():
+    """Names of the CSV logs in LOG_DIR."""
+    if not LOG_DIR or not Path(LOG_DIR).is_dir():
+        return []
+    return sorted(p.name for p in Path(LOG_DIR).glob("*.csv") if p.is_file())
+
+
+def server_log_path(name):
+    """The path of log ``name`` in LOG_DIR; ValueError for anything outside it."""
+    if not LOG_DIR:
+        raise ValueError("No server log directory configured (LOGISTICS_ACTUALS_LOG_DIR)")
+    root = Path(LOG_DIR).resolve()
+    path = (root / name).resolve()
+    if path.parent != root or path.suffix.lower() != ".csv":
+        raise ValueError(f"{name!r} is not a CSV log in the server log directory")
+    return path
+
+
+def load_checkpoint(path):
+    """The saved Checkpoint, or None if there is none (or it cannot be read)."""
+    try:
+        data = json.loads(Path(path).read_text())
+        return Checkpoint(**{**data, "columns": tuple(data["columns"])})
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+
+
+def save_checkpoint(path, checkpoint):
+    # Write then rename, so a reader never sees half a file
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(asdict(checkpoint)))
+    os.replace(tmp, path)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# INCREMENTAL INGEST
+# ══════════════════════════════════════════════════════════════════════════════
+def _digest(log, start, end):
+    log.seek(start)
+    return hashlib.sha256(log.read(end - start)).hexdigest()
+
+
+def _fingerprints(log, offset):
+    return _digest(log, 0, min(offset, HEAD_BYTES)), _digest(log, max(offset - EDGE_BYTES, 0), offset)
+
+
+def _aggregate(block, columns, totals):
+    """Add one block of complete CSV lines to ``totals``; returns (rows, skipped)."""
+    df = pd.read_csv(io.BytesIO(block), header=None, names=list(columns), usecols=list(REQUIRED_COLUMNS),
+                     dtype={"event": str, "category": str, "minutes": str}, on_bad_lines="skip")
+    event = df["event"].str.strip().str.lower()
+    category = df["category"].str.strip().str.upper()
+    ok = event.isin(EVENTS) & category.isin(CATEGORIES)
+    minutes = pd.to_numeric(df["minutes"][ok], errors="coerce")
+    groups = minutes.groupby([event[ok], category[ok]]).agg(["size", "count", "sum"])
+    for (ev, cat), (rows, timed, total) in zip(groups.index, groups.itertuples(index=False)):
+        entry = totals.setdefault(f"{ev}/{cat}", [0, 0, 0.0])
+        entry[0] += int(rows)
+        entry[1] += int(timed)
+        entry[2] += float(total)
+    return len(df), int((~ok).sum())
+
+
+def ingest(checkpoint, log):
+    """``checkpoint`` advanced over the complete lines ``log`` (a binary file) gained since.
+
+    Starts over from an empty checkpoint if the log no longer starts with
+    what was read before. Raises ValueError if the header lacks a required column.
+    """
+    size = log.seek(0, io.SEEK_END)
+    if checkpoint.offset and (size < checkpoint.offset
+                              or _fingerprints(log, checkpoint.offset) != (checkpoint.head, checkpoint.edge)):
+        checkpoint = Checkpoint()
+
+    columns, offset = checkpoint.columns, checkpoint.offset
+    if offset == 0:
+        log.seek(0)
+        header = log.readline()
+        if not header.endswith(b"\n"):
+            return checkpoint  # not even a full header yet
+        columns = tuple(c.strip().lower() for c in next(csv.reader([header.decode("utf-8-sig")])))
+        missing = [c for c in REQUIRED_COLUMNS if c not in columns]
+        if missing:
+            raise ValueError(f"Progress log is missing column(s): {', '.join(missing)}")
+        offset = len(header)
+
+    totals = {k: list(v) for k, v in checkpoint.totals.items()}
+    rows, skipped = checkpoint.rows, checkpoint.skipped
+    log.seek(offset)
+    carry = b""
+    while chunk := log.read(BLOCK_BYTES):
+        data = carry + chunk
+        cut = data.rfind(b"\n") + 1
+        block, carry = data[:cut], data[cut:]
+        if block.strip():
+            n, bad = _aggregate(block, columns, totals)
+            rows += n
+            skipped += bad
+        offset += len(block)
+    head, edge = _fingerprints(log, offset)
+    return Checkpoint(columns, offset, head, edge, rows, skipped, totals)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# RE-PLAN
+# ══════════════════════════════════════════════════════════════════════════════
+@dataclass(frozen=True)
+class Replan:
+    inputs: object  # PlanInputs for the remaining work, with re-estimated rates
+    remaining: object  # PlanResults for those inputs
+    original: object  # PlanResults of the plan as entered
+    estimates: object  # DataFrame: planned vs. estimated rates
+    progress: object  # DataFrame: per category target, accepted, remaining, reviews
+    review_backlog_minutes: float  # reviews owed on submissions already in
+    data_days: int
+    qa_days: int
+    remaining_days: int  # data / QA block plus wrap-up (setup is behind us)
+    spent: dict  # cost line → $ so far
+    to_complete: dict  # cost line → $ still to spend
+
+    @property
+    def estimate_at_completion(self):
+        return sum(self.spent.values()) + sum(self.to_complete.values())
+
+
+def _shrunk(observed_total, observations, planned, weight):
+    return (observed_total + weight * planned) / (observations + weight)
+
+
+def replan(inputs, checkpoint, prior_weight=PRIOR_WEIGHT):
+    """Remaining work, cost to complete and revised timeline of ``inputs`` given the log so far."""
+    i, cp = inputs, checkpoint
+    original = calculate(i)
+    v = original.volume
+    targets = dict(zip(CATEGORIES, (v.cat_a_target, v.cat_b_target, v.cat_c_target)))
+    planned_fail = dict(zip(CATEGORIES, (i.fail_a, i.fail_b, i.fail_c)))
+    planned_time = dict(zip(CATEGORIES, (i.time_a, i.time_b, i.time_c)))
+    review_rate = dict(zip(CATEGORIES, (i.review_rate_a, i.review_rate_b, i.review_rate_c)))
+
+    accepted = {c: cp.total("accepted", c)[0] for c in CATEGORIES}
+    rejected = {c: cp.total("rejected", c)[0] for c in CATEGORIES}
+    submitted = {c: accepted[c] + rejected[c] for c in CATEGORIES}
+    fail = {c: min(_shrunk(100 * rejected[c], submitted[c], planned_fail[c], prior_weight), MAX_FAIL)
+            for c in CATEGORIES}
+    minutes = {c: _shrunk(cp.total("accepted", c)[2] + cp.total("rejected", c)[2],
+                          cp.total("accepted", c)[1] + cp.total("rejected", c)[1], planned_time[c], prior_weight)
+               for c in CATEGORIES}
+    reviews = {c: cp.total("review", c)[0] for c in CATEGORIES}
+    review_minutes = sum(cp.total("review", c)[2] for c in CATEGORIES)
+    review_time = _shrunk(review_minutes, sum(cp.total("review", c)[1] for c in CATEGORIES),
+                          i.qa_review_time, prior_weight)
+
+    remaining_target = {c: max(targets[c] - accepted[c], 0) for c in CATEGORIES}
+    total = sum(remaining_target.values())
+    share = {c: 100 * remaining_target[c] / total if total else 0 for c in CATEGORIES}
+    revised = replace(
+        i, total_deliverable=total, cat_a_pct=share["A"], cat_b_pct=share["B"],
+        fail_a=fail["A"], fail_b=fail["B"], fail_c=fail["C"],
+        time_a=minutes["A"], time_b=minutes["B"], time_c=minutes["C"], qa_review_time=review_time,
+        num_evals=None if i.num_evals is None else round(i.num_evals * total / max(i.total_deliverable, 1)),
+    )
+    remaining = calculate(revised)
+    rv, rq = remaining.volume, remaining.qa
+
+    # Reviews owed on what is already in, at the planned review %
+    backlog = {c: max(math.ceil(submitted[c] * review_rate[c] / 100) - reviews[c], 0) for c in CATEGORIES}
+    backlog_minutes = sum(backlog.values()) * review_time
+    qa_minutes = rq.total_qa_time + backlog_minutes
+    qa_days = math.ceil(qa_minutes / max(rq.reviewer_minutes_per_day, 1)) if qa_minutes else 0
+    data_days = remaining.timeline.days_data if rv.total_required else 0
+    remaining_days = max(data_days, qa_days) + i.days_meeting + i.days_compiling + i.days_buffer
+
+    logged_minutes = sum(cp.total(e, c)[2] for e in ("accepted", "rejected") for c in CATEGORIES)
+    llm_per_submission = original.tech.total_llm_cost / max(v.total_required, 1)
+    spent = dict(zip(COST_LINES, (
+        logged_minutes / 60 * i.worker_hourly,
+        original.money.qual_cost,  # workers are recruited up front
+        review_minutes / 60 * i.reviewer_hourly,
+        original.tech.infra_cost + llm_per_submission * sum(submitted.values()),
+    )))
+    to_complete = dict(zip(COST_LINES, (
+        remaining.money.worker_cost,
+        0.0,
+        qa_minutes / 60 * i.reviewer_hourly,
+        remaining.tech.total_llm_cost,
+    )))
+
+    required = dict(zip(CATEGORIES, (rv.cat_a_required, rv.cat_b_required, rv.cat_c_required)))
+    progress = pd.DataFrame({
+        "Category": ["A (Simple)", "B (Reasoning)", "C (Synthesis)", "Total"],
+        **{label: [d[c] for c in CATEGORIES] + [sum(d.values())] for label, d in (
+            ("Target", targets), ("Accepted", accepted), ("Rejected", rejected), ("Remaining", remaining_target),
+            ("Still to submit", required), ("Reviews done", reviews), ("Review backlog", backlog))},
+    })
+    estimates = pd.DataFrame({
+        "Rate": [f"Cat {c} failure %" for c in CATEGORIES] + [f"Cat {c} min / submission" for c in CATEGORIES]
+                + ["Min / review"],
+        "Observations": [submitted[c] for c in CATEGORIES]
+                        + [cp.total("accepted", c)[1] + cp.total("rejected", c)[1] for c in CATEGORIES]
+                        + [sum(cp.total("review", c)[1] for c in CATEGORIES)],
+        "Plan": [planned_fail[c] for c in CATEGORIES] + [planned_time[c] for c in CATEGORIES] + [i.qa_review_time],
+        "Estimate": [fail[c] for c in CATEGORIES] + [minutes[c] for c in CATEGORIES] + [review_time],
+    })
+    return Replan(revised, remaining, original, estimates, progress, backlog_minutes,
+                  data_days, qa_days, remaining_days, spent, to_complete)
@@ -0,0 +1,254 @@
+"""JSON HTTP API for the calculator (standard library only).
+
+    python api.py --port 8000
+
+    POST /calculate   {"vol_total": 500, "p_cw": 10}        → one plan
+                      [{"vol_total": 500}, {"fail_b": 30}]   → a list of plans
+    GET  /metrics     request counts, cache hit rate, p50 / p90 / p99 latency
+    GET  /health
+
+Assumptions are keyed like the app's widgets or the PlanInputs fields, as in
+cli.py; missing ones take the widget defaults. The response carries the
+normalized inputs and every section's results. Requests are served on a
+thread each, and results are kept in an LRU keyed on the normalized inputs,
+so equal plans written differently (``"p_cw": 10`` vs ``"cat_c_workers":
+10.0``) share one entry.
+"""
+import argparse
+import json
+import math
+import sys
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import asdict, fields
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from calculator import WIDGET_KEYS, PlanInputs, calculate
+from stage_cache import StageCache
+
+MAX_BODY = 1_000_000  # bytes
+_FIELDS = {f.name for f in fields(PlanInputs)}
+_INT_FIELDS = {f.name for f in fields(PlanInputs) if f.type is int} | {"num_evals"}
+# Allowed range per field, as on the app's widgets (None = unbounded)
+BOUNDS = {
+    "total_deliverable": (1, None), "cat_a_pct": (0, 100), "cat_b_pct": (0, 100),
+    "fail_a": (0, 50), "fail_b": (0, 50), "fail_c": (0, 50),
+    "time_a": (1, None), "time_b": (1, None), "time_c": (1, None), "qual_time": (1, None),
+    "qa_review_time": (1, None), "hours_per_worker_day": (0.5, None),
+    "target_workers": (1, None), "cat_c_workers": (0, None), "cat_b_only_workers": (0, None),
+    "retention_rate": (10, 100), "pass_rate": (10, 100), "invite_take_rate": (10, 100),
+    "num_reviewers": (1, None), "reviewer_hours_day": (0.5, None),
+    "review_rate_a": (0, 100), "review_rate_b": (0, 100), "review_rate_c": (0, 100),
+    "worker_hourly": (1, None), "reviewer_hourly": (1, None),
+}
+_NON_NEGATIVE = (0, None)  # every other field: costs, prices, tokens, evaluations, days
+_SECTIONS = ("volume", "time", "people", "qa", "tech", "money", "timeline")
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def _finite(value):
+    try:
+        return math.isfinite(value)
+    except OverflowError:  # a JSON integer too large for a float
+        return False
+
+
+def normalize(payload):
+    """PlanInputs from a JSON object keyed by widget keys or field names.
+
+    Whole-number fields must hold whole numbers; everything else is a float,
+    so the same plan always normalizes to the same (hashable) PlanInputs.
+    Values must lie within BOUNDS, the ranges the app's widgets allow, and
+    the A and B mix together within 100%.
+    """
+    if not isinstance(payload, dict):
+        raise BadRequest("Each plan must be a JSON object")
+    values = {}
+    for key, value in payload.items():
+        name = WIDGET_KEYS.get(key, key)
+        if name not in _FIELDS:
+            raise BadRequest(f"Unknown assumption {key!r}")
+        if name in values:
+            raise BadRequest(f"{name!r} given twice")
+        if value is None and name == "num_evals":
+            values[name] = None
+            continue
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not _finite(value):
+            raise BadRequest(f"{key!r} must be a finite number")
+        if name in _INT_FIELDS and value != int(value):
+            raise BadRequest(f"{key!r} must be a whole number")
+        low, high = BOUNDS.get(name, _NON_NEGATIVE)
+        if value < low or (high is not None and value > high):
+            raise BadRequest(f"{key!r} must be {f'between {low} and {high}' if high is not None else f'at least {low}'}")
+        values[name] = int(value) if name in _INT_FIELDS else float(value)
+    inputs = PlanInputs(**values)
+    if inputs.cat_a_pct + inputs.cat_b_pct > 100:
+        raise BadRequest(f"Category mix A {inputs.cat_a_pct}% + B {inputs.cat_b_pct}% must not exceed 100%")
+    return inputs
+
+
+def evaluate(inputs):
+    plan = calculate(inputs)
+    return {
+        "inputs": asdict(plan.inputs),
+        "results": {section: asdict(getattr(plan, section)) for section in _SECTIONS},
+    }
+
+
+class CalculatorService:
+    """The API without HTTP: cached evaluation plus request metrics.
+
+    Cached response bodies are shared between requests — treat them as read-only.
+    """
+
+    def __init__(self, cache_size=4096, window=10_000):
+        self.cache = StageCache(maxsize=cache_size)
+        self._latencies = deque(maxlen=window)  # seconds, most recent requests
+        self._counts = Counter()
+        self._lock = threading.Lock()
+        self.started = time.time()
+
+    def calculate(self, payload):
+        """Results for one plan (object) or several (list)."""
+        if isinstance(payload, list):
+            return [self._one(p) for p in payload]
+        return self._one(payload)
+
+    def _one(self, payload):
+        inputs = normalize(payload)
+        log = []
+        try:
+            body = self.cache.get("calculate", evaluate, inputs, log=log)
+        except (ArithmeticError, ValueError) as e:
+            raise BadRequest(f"Cannot evaluate plan: {e}") from None
+        with self._lock:
+            self._counts["cache_hits" if log[0].hit else "cache_misses"] += 1
+        return body
+
+    def record(self, status, seconds):
+        with self._lock:
+            self._counts[f"status_{status}"] += 1
+            self._counts["requests"] += 1
+            self._latencies.append(seconds)
+
+    def metrics(self):
+        with self._lock:
+            latencies = np.array(self._latencies) * 1000
+            counts = dict(self._counts)
+        lookups = counts.get("cache_hits", 0) + counts.get("cache_misses", 0)
+        return {
+            "uptime_s": round(time.time() - self.started, 1),
+            "requests": counts.get("requests", 0),
+            "status": {k.removeprefix("status_"): v for k, v in counts.items() if k.startswith("status_")},
+            "cache": {
+                "size": len(self.cache),
+                "maxsize": self.cache.maxsize,
+                "hits": counts.get("cache_hits", 0),
+                "misses": counts.get("cache_misses", 0),
+                "hit_rate": counts.get("cache_hits", 0) / lookups if lookups else None,
+            },
+            "latency_ms": {
+                "window": len(latencies),
+                **({f"p{q}": float(v) for q, v in zip((50, 90, 99), np.percentile(latencies, (50, 90, 99)))}
+                   if len(latencies) else {"p50": None, "p90": None, "p99": None}),
+            },
+        }
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# HTTP
+# ══════════════════════════════════════════════════════════════════════════════
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive for clients that send many requests
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+    server_version = "LogisticsCalculator"
+
+    @property
+    def service(self):
+        return self.server.service
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send(200, {"status": "ok"})
+        elif self.path == "/metrics":
+            self._send(200, self.service.metrics(), timed=False)
+        else:
+            self._send(404, {"error": f"No route GET {self.path}"})
+
+    def do_POST(self):
+        start = time.perf_counter()
+        if self.path != "/calculate":
+            self._send(404, {"error": f"No route POST {self.path}"}, start=start)
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True
+            self._send(400, {"error": "Invalid Content-Length"}, start=start)
+            return
+        if length > MAX_BODY:
+            self.close_connection = True  # the body is left unread
+            self._send(413, {"error": f"Body over {MAX_BODY} bytes"}, start=start)
+            return
+        try:
+            payload = json.loads(self.rfile.read(length) or b"null")
+            self._send(200, self.service.calculate(payload), start=start)
+        except json.JSONDecodeError as e:
+            self._send(400, {"error": f"Invalid JSON: {e}"}, start=start)
+        except BadRequest as e:
+            self._send(400, {"error": str(e)}, start=start)
+
+    def _send(self, status, body, start=None, timed=True):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        if timed and start is not None:
+            self.service.record(status, time.perf_counter() - start)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256  # socketserver's default backlog of 5 drops bursts of connections
+
+
+def make_server(host="127.0.0.1", port=8000, cache_size=4096, verbose=False):
+    server = Server((host, port), Handler)
+    server.service = CalculatorService(cache_size)
+    server.verbose = verbose
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the logistics calculator as a JSON API.")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="port (default: 8000)")
+    parser.add_argument("--cache-size", type=int, default=4096, help="plans kept in the LRU (default: 4096)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+    server = make_server(args.host, args.port, args.cache_size, args.verbose)
+    print(f"Serving on http://{args.host}:{server.server_port}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
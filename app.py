@@ -1,6 +1,20 @@
+import uuid
+from contextlib import contextmanager, nullcontext
+from dataclasses import replace
+
 import streamlit as st
-import pandas as pd
-import math
+
+from assets import SECTION_HEADER, STYLE
+from calculator import (
+    WIDGET_KEYS, PlanInputs, PlanResults,
+    calc_money, calc_people, calc_qa, calc_tech, calc_time, calc_timeline, calc_volume,
+)
+from profiler import enabled as profiling_enabled
+from stage_cache import StageCache
+from tables import (
+    budget_table, cost_summary_html, qual_timeline_table, review_table, tech_table,
+    time_table, timeline_table, volume_table, workload_table,
+)
 
 st.set_page_config(
     page_title="Surge AI — Logistics Calculator",
@@ -8,36 +22,84 @@ st.set_page_config(
     layout="wide",
 )
 
-# ── Custom CSS ────────────────────────────────────────────────────────────────
-st.markdown("""
-<style>
-@import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap');
-html, body, [class*="css"] { font-family: 'Inter', sans-serif; }
-
-div[data-testid="stMetric"] {
-    background: linear-gradient(135deg, #1e1e2e 0%, #2a2a3e 100%);
-    border: 1px solid rgba(99, 102, 241, 0.25);
-    border-radius: 12px;
-    padding: 16px 20px;
-    box-shadow: 0 4px 20px rgba(0,0,0,0.15);
-}
-div[data-testid="stMetric"] label { color: #a5b4fc !important; font-size: 0.85rem !important; }
-div[data-testid="stMetric"] [data-testid="stMetricValue"] { color: #e0e7ff !important; font-weight: 700 !important; }
-
-details { border: 1px solid rgba(99, 102, 241, 0.2) !important; border-radius: 10px !important; }
-summary { font-weight: 600 !important; }
-th { background: #312e81 !important; color: #e0e7ff !important; }
-td, th { padding: 8px 12px !important; }
-
-.section-header {
-    background: linear-gradient(90deg, #312e81 0%, #1e1b4b 100%);
-    padding: 12px 20px;
-    border-radius: 10px;
-    margin-bottom: 4px;
-}
-.section-header h2 { color: #e0e7ff; margin: 0; font-size: 1.3rem; }
-</style>
-""", unsafe_allow_html=True)
+
+@st.cache_resource
+def get_stage_cache():
+    # One bounded cache per server process, shared by every session
+    return StageCache(maxsize=512)
+
+
+stage_cache = get_stage_cache()
+
+
+@st.cache_resource
+def get_scenario_store():
+    return ScenarioStore()
+
+
+stage_log = []  # StageRun records for this rerun, shown in the debug panel
+
+
+def stage(name, fn, *args):
+    return stage_cache.get(name, fn, *args, log=stage_log)
+
+
+# ── Profiling (opt-in: LOGISTICS_PROFILE=1 or ?profile=1) ─────────────────────
+if profiling_enabled(st.query_params):
+    from profiler import RerunProfile  # hooks pandas, so only loaded when profiling
+    profile = RerunProfile(stage_log)
+else:
+    profile = None
+
+
+def section(name):
+    # Starts the next timed section of the profile
+    if profile is not None:
+        profile.mark(name)
+
+
+section("Page setup")
+
+
+# ── Render mode ───────────────────────────────────────────────────────────────
+# On demand (default): detail tables sit in folded panels and are only built
+# and sent to the browser while their panel is open. ?render=full on the URL
+# (or the sidebar toggle) renders them inline as before.
+lazy_details = st.sidebar.toggle("Build detail tables on demand", value=st.query_params.get("render") != "full",
+                                 key="ui_lazy")
+
+
+@contextmanager
+def detail_panel(label, key, folded=False):
+    """Yields whether to build the detail content inside this block.
+
+    In full mode the content goes inline, or in a plain folded expander if ``folded``.
+    """
+    if not lazy_details:
+        if folded:
+            with st.expander(label, expanded=False):
+                yield True
+        else:
+            yield True
+        return
+    panel = st.expander(label, key=key, on_change="rerun")
+    with panel:
+        yield bool(panel.open)
+
+
+def rerun_app():
+    # Fragment callbacks that change widgets outside their fragment
+    st.session_state["ui_rerun_app"] = True
+
+
+def finish_callbacks():
+    """In a fragment: rerun the whole page if a callback asked for it."""
+    if st.session_state.pop("ui_rerun_app", False):
+        st.rerun()
+
+
+# ── Custom CSS (style.css, read once per server process by assets.py) ─────────
+st.markdown(STYLE, unsafe_allow_html=True)
 
 # ══════════════════════════════════════════════════════════════════════════════
 # HEADER + SUMMARY PLACEHOLDER (filled at bottom after all calcs)
@@ -54,7 +116,8 @@ st.divider()
 # ══════════════════════════════════════════════════════════════════════════════
 # 1. VOLUME & DISTRIBUTION
 # ══════════════════════════════════════════════════════════════════════════════
-st.markdown('<div class="section-header"><h2>📦 1 — Volume & Distribution</h2></div>', unsafe_allow_html=True)
+section("1 Volume & Distribution")
+st.markdown(SECTION_HEADER.format("📦 1 — Volume & Distribution"), unsafe_allow_html=True)
 
 with st.expander("Assumptions", expanded=False):
     v1, v2 = st.columns(2)
@@ -63,11 +126,9 @@ with st.expander("Assumptions", expanded=False):
         st.markdown("**Category mix**")
         cat_a_pct = st.slider("Category A %", 0, 100, 30, 5, key="vol_a")
         cat_b_pct = st.slider("Category B %", 0, 100, 50, 5, key="vol_b")
-        cat_c_pct = 100 - cat_a_pct - cat_b_pct
-        if cat_c_pct < 0:
+        if cat_a_pct + cat_b_pct > 100:
             st.error("A% + B% exceeds 100%. Adjust sliders.")
-            cat_c_pct = 0
-        st.metric("Category C % (auto)", f"{cat_c_pct}%")
+        st.metric("Category C % (auto)", f"{max(100 - cat_a_pct - cat_b_pct, 0)}%")
     with v2:
         st.markdown("**Rejection / failure rates**")
         fail_a = st.slider("Cat A failure rate %", 0, 50, 6, 1, key="vol_fa")
@@ -75,14 +136,9 @@ with st.expander("Assumptions", expanded=False):
         fail_c = st.slider("Cat C failure rate %", 0, 50, 34, 1, key="vol_fc")
 
 # Volume calcs
-cat_a_target = round(total_deliverable * cat_a_pct / 100)
-cat_b_target = round(total_deliverable * cat_b_pct / 100)
-cat_c_target = total_deliverable - cat_a_target - cat_b_target
-
-cat_a_required = math.ceil(cat_a_target / (1 - fail_a / 100)) if fail_a < 100 else cat_a_target
-cat_b_required = math.ceil(cat_b_target / (1 - fail_b / 100)) if fail_b < 100 else cat_b_target
-cat_c_required = math.ceil(cat_c_target / (1 - fail_c / 100)) if fail_c < 100 else cat_c_target
-total_required = cat_a_required + cat_b_required + cat_c_required
+volume = stage("Volume", calc_volume, total_deliverable, cat_a_pct, cat_b_pct, fail_a, fail_b, fail_c)
+cat_a_required, cat_b_required, cat_c_required = volume.cat_a_required, volume.cat_b_required, volume.cat_c_required
+total_required = volume.total_required
 
 # Dashboard
 vm1, vm2, vm3, vm4 = st.columns(4)
@@ -91,22 +147,18 @@ vm2.metric("Cat B required", cat_b_required)
 vm3.metric("Cat C required", cat_c_required)
 vm4.metric("Total required", total_required)
 
-volume_df = pd.DataFrame({
-    "Category": ["A (Simple)", "B (Reasoning)", "C (Synthesis)", "Total"],
-    "Target": [cat_a_target, cat_b_target, cat_c_target, total_deliverable],
-    "Failure %": [f"{fail_a}%", f"{fail_b}%", f"{fail_c}%", "—"],
-    "Required": [cat_a_required, cat_b_required, cat_c_required, total_required],
-    "Buffer": [cat_a_required - cat_a_target, cat_b_required - cat_b_target,
-               cat_c_required - cat_c_target, total_required - total_deliverable],
-})
-st.dataframe(volume_df, width="stretch", hide_index=True)
+with detail_panel("📋 Volume by category", "dp_volume") as show:
+    if show:
+        volume_df = stage("Volume table", volume_table, volume, total_deliverable, fail_a, fail_b, fail_c)
+        st.dataframe(volume_df, width="stretch", hide_index=True)
 st.divider()
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # 2. TIME
 # ══════════════════════════════════════════════════════════════════════════════
-st.markdown('<div class="section-header"><h2>⏱️ 2 — Time</h2></div>', unsafe_allow_html=True)
+section("2 Time")
+st.markdown(SECTION_HEADER.format("⏱️ 2 — Time"), unsafe_allow_html=True)
 
 with st.expander("Assumptions", expanded=False):
     t1, t2 = st.columns(2)
@@ -122,23 +174,17 @@ with st.expander("Assumptions", expanded=False):
         hours_per_worker_day = st.number_input("Work hours per worker per day", value=2.0, step=0.5, min_value=0.5, key="t_hpd")
 
 # Time calcs
-total_time_a = cat_a_required * time_a
-total_time_b = cat_b_required * time_b
-total_time_c = cat_c_required * time_c
-total_annotation_time = total_time_a + total_time_b + total_time_c
+time = stage("Time", calc_time, cat_a_required, cat_b_required, cat_c_required, time_a, time_b, time_c)
+total_annotation_time = time.total_annotation_time
 # NOTE: total_qa_time is computed later in the QA section (after review rates are set)
 
 # Dashboard
 st.metric("Total Annotation Time", f"{total_annotation_time} min ({total_annotation_time/60:.1f} hrs)")
 
-time_df = pd.DataFrame({
-    "Category": ["A (Simple)", "B (Reasoning)", "C (Synthesis)", "Total"],
-    "Per Sub": [f"{time_a} min", f"{time_b} min", f"{time_c} min", "—"],
-    "Subs": [cat_a_required, cat_b_required, cat_c_required, total_required],
-    "Total Time": [f"{total_time_a} min", f"{total_time_b} min", f"{total_time_c} min", f"{total_annotation_time} min"],
-    "Hours": [f"{total_time_a/60:.1f}", f"{total_time_b/60:.1f}", f"{total_time_c/60:.1f}", f"{total_annotation_time/60:.1f}"],
-})
-st.dataframe(time_df, width="stretch", hide_index=True)
+with detail_panel("📋 Time by category", "dp_time") as show:
+    if show:
+        time_df = stage("Time table", time_table, volume, time, time_a, time_b, time_c)
+        st.dataframe(time_df, width="stretch", hide_index=True)
 st.caption(f"ℹ️ Submissions Required trickles down from **Volume** section ({total_required} total).")
 st.divider()
 
@@ -146,7 +192,8 @@ st.divider()
 # ══════════════════════════════════════════════════════════════════════════════
 # 3. PEOPLE
 # ══════════════════════════════════════════════════════════════════════════════
-st.markdown('<div class="section-header"><h2>👥 3 — People</h2></div>', unsafe_allow_html=True)
+section("3 People")
+st.markdown(SECTION_HEADER.format("👥 3 — People"), unsafe_allow_html=True)
 
 with st.expander("Assumptions", expanded=False):
     p1, p2 = st.columns(2)
@@ -162,10 +209,13 @@ with st.expander("Assumptions", expanded=False):
         invite_take_rate = st.slider("Invite take rate %", 10, 100, 50, 5, key="p_inv")
 
 # People calcs
-workers_before_retention = math.ceil(target_workers / (retention_rate / 100))
-workers_before_pass = math.ceil(workers_before_retention / (pass_rate / 100))
-workers_to_invite = math.ceil(workers_before_pass / (invite_take_rate / 100))
-total_workers = cat_c_workers + cat_b_only_workers
+people = stage("People", calc_people, cat_a_required, cat_b_required, cat_c_required,
+               time_a, time_b, time_c, hours_per_worker_day,
+               target_workers, cat_c_workers, cat_b_only_workers,
+               retention_rate, pass_rate, invite_take_rate)
+workers_before_retention = people.workers_before_retention
+workers_before_pass = people.workers_before_pass
+workers_to_invite = people.workers_to_invite
 
 # Pipeline
 st.markdown("#### Recruitment Funnel")
@@ -178,45 +228,13 @@ pm4.metric(f"Invitations ({invite_take_rate}%)", workers_to_invite)
 # Workload per worker type
 st.markdown("#### Workload per Worker")
 
-if cat_c_workers > 0:
-    a_per_c = round(cat_a_required * (cat_c_workers / max(total_workers, 1)) / cat_c_workers, 1)
-    b_per_c = round(cat_b_required * (cat_c_workers / max(total_workers, 1)) / cat_c_workers, 1)
-    c_per_c = round(cat_c_required / max(cat_c_workers, 1), 1)
-    time_c_worker = a_per_c * time_a + b_per_c * time_b + c_per_c * time_c
-    days_c_worker = time_c_worker / (hours_per_worker_day * 60)
-else:
-    a_per_c = b_per_c = c_per_c = time_c_worker = days_c_worker = 0
-
-if cat_b_only_workers > 0:
-    a_per_b = round(cat_a_required * (cat_b_only_workers / max(total_workers, 1)) / cat_b_only_workers, 1)
-    leftover_b = cat_b_required - round(cat_b_required * cat_c_workers / max(total_workers, 1))
-    b_per_b = round(leftover_b / cat_b_only_workers, 1)
-    time_b_worker = a_per_b * time_a + b_per_b * time_b
-    days_b_worker = time_b_worker / (hours_per_worker_day * 60)
-else:
-    a_per_b = b_per_b = time_b_worker = days_b_worker = 0
-
-workload_rows = []
-if cat_c_workers > 0:
-    workload_rows.append({
-        "Worker Type": f"Cat C-qualified (×{cat_c_workers})",
-        "A subs": f"{a_per_c:.0f}", "B subs": f"{b_per_c:.0f}", "C subs": f"{c_per_c:.0f}",
-        "Total min": f"{time_c_worker:.0f}", "Days": f"{days_c_worker:.1f}",
-    })
-if cat_b_only_workers > 0:
-    workload_rows.append({
-        "Worker Type": f"Cat B-only (×{cat_b_only_workers})",
-        "A subs": f"{a_per_b:.0f}", "B subs": f"{b_per_b:.0f}", "C subs": "—",
-        "Total min": f"{time_b_worker:.0f}", "Days": f"{days_b_worker:.1f}",
-    })
-if workload_rows:
-    st.dataframe(pd.DataFrame(workload_rows), width="stretch", hide_index=True)
-
-subs_per_day_c = ((a_per_c + b_per_c + c_per_c) / max(days_c_worker, 0.01)) * cat_c_workers if cat_c_workers else 0
-subs_per_day_b = ((a_per_b + b_per_b) / max(days_b_worker, 0.01)) * cat_b_only_workers if cat_b_only_workers else 0
-total_subs_day = subs_per_day_c + subs_per_day_b
-
-st.metric("Est. Total Submissions / Day", f"~{total_subs_day:.0f}")
+with detail_panel("📋 Workload by worker type", "dp_workload") as show:
+    if show:
+        workload_df = stage("Workload table", workload_table, people, cat_c_workers, cat_b_only_workers)
+        if not workload_df.empty:
+            st.dataframe(workload_df, width="stretch", hide_index=True)
+
+st.metric("Est. Total Submissions / Day", f"~{people.total_subs_day:.0f}")
 st.caption(f"ℹ️ Per-submission times trickle down from **Time** section (A={time_a}m, B={time_b}m, C={time_c}m) · {hours_per_worker_day}h/day.")
 st.divider()
 
@@ -224,7 +242,8 @@ st.divider()
 # ══════════════════════════════════════════════════════════════════════════════
 # 4. QA
 # ══════════════════════════════════════════════════════════════════════════════
-st.markdown('<div class="section-header"><h2>🔍 4 — Quality Assurance</h2></div>', unsafe_allow_html=True)
+section("4 Quality Assurance")
+st.markdown(SECTION_HEADER.format("🔍 4 — Quality Assurance"), unsafe_allow_html=True)
 
 with st.expander("Assumptions", expanded=False):
     qa_col1, qa_col2 = st.columns(2)
@@ -238,37 +257,25 @@ with st.expander("Assumptions", expanded=False):
         review_rate_c = st.slider("Cat C review %", 0, 100, 60, 5, key="qa_rev_c")
     st.caption(f"QA review time per submission: **{qa_review_time} min** (from Time section)")
 
-# Per-category review counts
-reviews_a = math.ceil(cat_a_required * review_rate_a / 100)
-reviews_b = math.ceil(cat_b_required * review_rate_b / 100)
-reviews_c = math.ceil(cat_c_required * review_rate_c / 100)
-total_reviews = reviews_a + reviews_b + reviews_c
-
-# Now compute total_qa_time (deferred from Time section)
-total_qa_time = total_reviews * qa_review_time
-
-# Auto-calculate QA days
-total_review_minutes = total_reviews * qa_review_time
-reviewer_minutes_per_day = num_reviewers * reviewer_hours_day * 60
-qa_days_available = math.ceil(total_review_minutes / max(reviewer_minutes_per_day, 1))
-reviews_per_day = total_reviews / max(qa_days_available, 1)
-qa_hours_per_day = reviews_per_day * qa_review_time / 60
+# Per-category review counts, total_qa_time (deferred from Time section) and QA days
+qa = stage("QA", calc_qa, cat_a_required, cat_b_required, cat_c_required, qa_review_time,
+           num_reviewers, reviewer_hours_day, review_rate_a, review_rate_b, review_rate_c)
+total_reviews = qa.total_reviews
+total_qa_time = qa.total_qa_time
+qa_days_available = qa.qa_days_available
 
 # Review count breakdown
 st.markdown("#### Review Counts")
-review_df = pd.DataFrame({
-    "Category": ["A (Simple)", "B (Reasoning)", "C (Synthesis)", "Total"],
-    "Required Subs": [cat_a_required, cat_b_required, cat_c_required, total_required],
-    "Review Rate": [f"{review_rate_a}%", f"{review_rate_b}%", f"{review_rate_c}%", f"{total_reviews}/{total_required}"],
-    "Reviews": [reviews_a, reviews_b, reviews_c, total_reviews],
-})
-st.dataframe(review_df, width="stretch", hide_index=True)
+with detail_panel("📋 Reviews by category", "dp_review") as show:
+    if show:
+        review_df = stage("Review table", review_table, volume, qa, review_rate_a, review_rate_b, review_rate_c)
+        st.dataframe(review_df, width="stretch", hide_index=True)
 
 qa1, qa2, qa3, qa4 = st.columns(4)
 qa1.metric("Total Reviews", total_reviews)
 qa2.metric("QA Days Needed", f"{qa_days_available}")
-qa3.metric("Reviews / Day", f"~{reviews_per_day:.1f}")
-qa4.metric("QA Hours / Day", f"{qa_hours_per_day:.1f} hrs")
+qa3.metric("Reviews / Day", f"~{qa.reviews_per_day:.1f}")
+qa4.metric("QA Hours / Day", f"{qa.qa_hours_per_day:.1f} hrs")
 
 qa5, qa6 = st.columns(2)
 qa5.metric("Total QA Time", f"{total_qa_time} min ({total_qa_time/60:.1f} hrs)")
@@ -280,7 +287,8 @@ st.divider()
 # ══════════════════════════════════════════════════════════════════════════════
 # 5. MONEY
 # ══════════════════════════════════════════════════════════════════════════════
-st.markdown('<div class="section-header"><h2>💰 5 — Money</h2></div>', unsafe_allow_html=True)
+section("5 Money")
+st.markdown(SECTION_HEADER.format("💰 5 — Money"), unsafe_allow_html=True)
 
 with st.expander("Assumptions — Labour", expanded=False):
     mo1, mo2 = st.columns(2)
@@ -326,36 +334,17 @@ with st.expander("Assumptions — Tech Cost", expanded=False):
         tok_eval_out = st.number_input("Output tokens / eval", value=100, step=50, min_value=0, key="tc_eval_out")
 
 # ── LLM cost calcs ───────────────────────────────────────────────────────────
-# Submissions — without SEC
-total_sub_in_nosec = total_required * tok_sub_in_nosec
-total_sub_out_nosec = total_required * tok_sub_out_nosec
-cost_sub_nosec_in = total_sub_in_nosec / 1_000_000 * llm_price_input
-cost_sub_nosec_out = total_sub_out_nosec / 1_000_000 * llm_price_output
-cost_sub_nosec = cost_sub_nosec_in + cost_sub_nosec_out
-
-# Submissions — with SEC
-total_sub_in_sec = total_required * tok_sub_in_sec
-total_sub_out_sec = total_required * tok_sub_out_sec
-cost_sub_sec_in = total_sub_in_sec / 1_000_000 * llm_price_input
-cost_sub_sec_out = total_sub_out_sec / 1_000_000 * llm_price_output
-cost_sub_sec = cost_sub_sec_in + cost_sub_sec_out
-
-# Evaluations
-total_eval_in = num_evals * tok_eval_in
-total_eval_out = num_evals * tok_eval_out
-cost_eval_in = total_eval_in / 1_000_000 * llm_price_input
-cost_eval_out = total_eval_out / 1_000_000 * llm_price_output
-cost_eval = cost_eval_in + cost_eval_out
-
-total_llm_cost = cost_sub_sec + cost_eval  # conservative: use "with SEC" variant
-infra_cost = cost_filings + cost_auto_check + cost_database
-tech_cost = infra_cost + total_llm_cost
+tech = stage("Tech", calc_tech, total_required, num_evals, cost_filings, cost_auto_check, cost_database,
+             llm_price_input, llm_price_output,
+             tok_sub_in_nosec, tok_sub_out_nosec, tok_sub_in_sec, tok_sub_out_sec,
+             tok_eval_in, tok_eval_out)
+infra_cost, total_llm_cost, tech_cost = tech.infra_cost, tech.total_llm_cost, tech.tech_cost
 
 # ── Labour calcs ─────────────────────────────────────────────────────────────
-worker_cost = total_annotation_time / 60 * worker_hourly
-qual_cost = workers_before_pass * qual_time / 60 * worker_hourly
-reviewer_cost = total_qa_time / 60 * reviewer_hourly
-total_cost = worker_cost + qual_cost + reviewer_cost + tech_cost
+money = stage("Money", calc_money, total_annotation_time, workers_before_pass, qual_time, total_qa_time,
+              worker_hourly, reviewer_hourly, tech_cost)
+worker_cost, qual_cost, reviewer_cost = money.worker_cost, money.qual_cost, money.reviewer_cost
+total_cost = money.total_cost
 
 # ── Dashboard ─────────────────────────────────────────────────────────────────
 mo_a, mo_b, mo_c, mo_d = st.columns(4)
@@ -364,47 +353,17 @@ mo_b.metric("Qualification Cost", f"${qual_cost:,.0f}")
 mo_c.metric("Reviewer Cost", f"${reviewer_cost:,.0f}")
 mo_d.metric("Tech Cost", f"${tech_cost:,.2f}")
 
-budget_df = pd.DataFrame({
-    "Line Item": ["Worker Annotation", "Qualification Testing", "Expert Review", "Tech / Infrastructure", "TOTAL"],
-    "Formula": [
-        f"Total annotation time ÷ 60 × hourly rate → {total_annotation_time} min ÷ 60 × ${worker_hourly:.0f}",
-        f"Test-takers × qual time ÷ 60 × hourly rate → {workers_before_pass} × {qual_time} min ÷ 60 × ${worker_hourly:.0f}",
-        f"Reviewer rate × hours → ${reviewer_hourly:.0f} × {total_qa_time / 60:.1f}h",
-        f"Infra ${infra_cost:.0f} + LLM ${total_llm_cost:.2f}",
-        "",
-    ],
-    "Cost": [f"${worker_cost:,.0f}", f"${qual_cost:,.0f}", f"${reviewer_cost:,.0f}", f"${tech_cost:,.2f}", f"${total_cost:,.2f}"],
-})
-st.dataframe(budget_df, width="stretch", hide_index=True)
+with detail_panel("📋 Budget line items", "dp_budget") as show:
+    if show:
+        budget_df = stage("Budget table", budget_table, time, people, qa, tech, money, qual_time, worker_hourly, reviewer_hourly)
+        st.dataframe(budget_df, width="stretch", hide_index=True)
 
 # Tech cost detail table
 st.markdown("#### 🖥️ Tech Cost Breakdown")
-tech_df = pd.DataFrame({
-    "Component": [
-        "Filings", "Automated checking", "Database",
-        f"LLM Submissions w/o SEC ({total_required}×)",
-        f"LLM Submissions w/ SEC ({total_required}×)",
-        f"LLM Evaluations ({num_evals}×)",
-        "Total LLM (conservative, w/ SEC)",
-        "TOTAL TECH",
-    ],
-    "Tokens In": [
-        "—", "—", "—",
-        f"{total_sub_in_nosec:,}", f"{total_sub_in_sec:,}", f"{total_eval_in:,}",
-        f"{total_sub_in_sec + total_eval_in:,}", "—",
-    ],
-    "Tokens Out": [
-        "—", "—", "—",
-        f"{total_sub_out_nosec:,}", f"{total_sub_out_sec:,}", f"{total_eval_out:,}",
-        f"{total_sub_out_sec + total_eval_out:,}", "—",
-    ],
-    "Cost": [
-        f"${cost_filings:.2f}", f"${cost_auto_check:.2f}", f"${cost_database:.2f}",
-        f"${cost_sub_nosec:.2f}", f"${cost_sub_sec:.2f}", f"${cost_eval:.2f}",
-        f"${total_llm_cost:.2f}", f"${tech_cost:.2f}",
-    ],
-})
-st.dataframe(tech_df, width="stretch", hide_index=True)
+with detail_panel("📋 Tech cost lines", "dp_tech") as show:
+    if show:
+        tech_df = stage("Tech table", tech_table, volume, tech, cost_filings, cost_auto_check, cost_database)
+        st.dataframe(tech_df, width="stretch", hide_index=True)
 st.caption(f"ℹ️  Submissions ({total_required}) flow from **Volume** · Token pricing at ${llm_price_input}/M input, ${llm_price_output}/M output.")
 st.divider()
 
@@ -412,10 +371,8 @@ st.divider()
 # ══════════════════════════════════════════════════════════════════════════════
 # 6. TIMELINE
 # ══════════════════════════════════════════════════════════════════════════════
-st.markdown('<div class="section-header"><h2>📅 6 — Timeline</h2></div>', unsafe_allow_html=True)
-
-# Auto-calculate data creation days from worker capacity
-days_data = math.ceil(max(days_c_worker, days_b_worker, 1))
+section("6 Timeline")
+st.markdown(SECTION_HEADER.format("📅 6 — Timeline"), unsafe_allow_html=True)
 
 with st.expander("Assumptions", expanded=False):
     tl1, tl2 = st.columns(2)
@@ -426,57 +383,817 @@ with st.expander("Assumptions", expanded=False):
     with tl2:
         days_compiling = st.number_input("Compiling & final check (days)", value=1, step=1, min_value=0, key="tl_comp")
         days_buffer = st.number_input("Buffer (days)", value=1, step=1, min_value=0, key="tl_buf")
+    # Data creation days are auto-calculated from worker capacity
+    timeline = stage("Timeline", calc_timeline, people.days_c_worker, people.days_b_worker, qa_days_available,
+                     days_meeting, days_finding, days_testing, days_compiling, days_buffer)
+    days_data, data_qa_parallel = timeline.days_data, timeline.data_qa_parallel
     st.caption(f"Data creation days: **{days_data}** (auto-calculated from worker capacity in People section)")
     st.caption(f"QA days: **{qa_days_available}** (auto-calculated in QA section)")
 
-timeline_items = [
-    ("Finding people", days_finding),
-    ("Testing / qualification", days_testing),
-    ("Data creation + checking", days_data),
-    ("QA review (parallel with creation)", qa_days_available),
-    ("Customer meeting", days_meeting),
-    ("Compiling & final check", days_compiling),
-    ("Buffer", days_buffer),
-]
-# QA runs in parallel with data creation, so take the max of the two
-data_qa_parallel = max(days_data, qa_days_available)
-sequential_days = days_finding + days_testing + data_qa_parallel + days_meeting + days_compiling + days_buffer
-
-timeline_df = pd.DataFrame(timeline_items, columns=["Phase", "Days"])
-
 tc1, tc2 = st.columns([2, 1])
 with tc1:
-    st.dataframe(timeline_df, width="stretch", hide_index=True)
+    with detail_panel("📋 Timeline phases", "dp_timeline") as show:
+        if show:
+            timeline_df = stage("Timeline table", timeline_table, timeline, qa_days_available,
+                                days_finding, days_testing, days_meeting, days_compiling, days_buffer)
+            st.dataframe(timeline_df, width="stretch", hide_index=True)
     st.caption(f"ℹ️ Data creation ({days_data}d) and QA ({qa_days_available}d) run in parallel → **{data_qa_parallel}d** for that block.")
 with tc2:
-    st.metric("Total Project Duration", f"{sequential_days} days")
-    st.metric("~Calendar Weeks", f"{math.ceil(sequential_days / 5):.0f} weeks")
+    st.metric("Total Project Duration", f"{timeline.sequential_days} days")
+    st.metric("~Calendar Weeks", f"{timeline.calendar_weeks:.0f} weeks")
 
-total_days = sequential_days
+total_days = timeline.sequential_days
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # 7. QUALIFICATION TIMELINE
 # ══════════════════════════════════════════════════════════════════════════════
-st.markdown('<div class="section-header"><h2>📋 7 — Qualification Timeline</h2></div>', unsafe_allow_html=True)
+section("7 Qualification Timeline")
+st.markdown(SECTION_HEADER.format("📋 7 — Qualification Timeline"), unsafe_allow_html=True)
+
+with detail_panel("📋 Qualification steps", "dp_qual") as show:
+    if show:
+        qual_timeline_df = stage("Qualification table", qual_timeline_table)
+        st.dataframe(qual_timeline_df, width="stretch", hide_index=True)
+st.divider()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# DEFERRED IMPORTS
+# ══════════════════════════════════════════════════════════════════════════════
+# pandas, NumPy, Altair and the analysis modules take most of a cold start.
+# Sections 1–7 need none of them (their tables are built on demand), so they
+# load here, after the top of the page has been sent to the browser. Later
+# reruns find them in sys.modules.
+section("Deferred imports")
+import altair as alt
+import pandas as pd
+
+from actuals import (
+    PRIOR_WEIGHT, Checkpoint, checkpoint_path, ingest, load_checkpoint, replan, save_checkpoint, server_log_path,
+    server_logs,
+)
+from categories import abc_categories, categories_from_frame, category_frame, plan_categories, tiers_from_frame
+from export import XLSX_MIME, ZIP_MIME, evaluate_plans, excel_engine, export_tables, to_excel, to_parquet_zip
+from llm_costs import APP_MODEL, CachePricing, ModelPrice, default_calls, plan_llm, setup_options
+from pareto import frontier, point_inputs
+from pipeline import simulate_pipeline
+from reconcile import checks_table, reconcile
+from risk import KINDS, spread, summarize
+from scenarios import BUDGET_LINES, COMPARE_LINES, ScenarioStore
+from scheduler import OBJECTIVES as SCHEDULE_OBJECTIVES, Pool as SharedPool, Project, schedule
+from sensitivity import SENSITIVITY_FIELDS, tornado, tornado_bars
+from solver import solve
+
 
-qual_timeline_data = [
-    ("Day 1–2", "Platform pool filtering and invitation"),
-    ("Day 3–4", "Qualification test completion window (candidates have 36 hours to start once invited, must complete in one 45-minute session)"),
-    ("Day 5", "Automated scoring and flagging for manual review"),
-    ("Day 6", "Manual review of flagged submissions and final selection"),
-    ("Day 7", "Results communication and onboarding for qualified workers"),
+# ══════════════════════════════════════════════════════════════════════════════
+# 8. RISK (MONTE CARLO)
+# ══════════════════════════════════════════════════════════════════════════════
+section("8 Risk (Monte Carlo)")
+st.markdown(SECTION_HEADER.format("🎲 8 — Risk (Monte Carlo)"), unsafe_allow_html=True)
+
+# Every assumption above, as the calculator sees it
+plan_inputs = PlanInputs.from_widgets({k: st.session_state[k] for k in WIDGET_KEYS})
+
+# (field, label, default −%, default +%) around the current point estimate
+RISK_PARAMS = [
+    ("fail_a", "Cat A failure rate", 50, 50),
+    ("fail_b", "Cat B failure rate", 50, 50),
+    ("fail_c", "Cat C failure rate", 50, 50),
+    ("pass_rate", "Qualification pass rate", 25, 25),
+    ("retention_rate", "Worker retention rate", 15, 15),
+    ("time_a", "Cat A time per submission", 30, 50),
+    ("time_b", "Cat B time per submission", 30, 50),
+    ("time_c", "Cat C time per submission", 30, 50),
 ]
-qual_timeline_df = pd.DataFrame(qual_timeline_data, columns=["Day", "Activity"])
-st.dataframe(qual_timeline_df, width="stretch", hide_index=True)
+
+
+@st.fragment
+def risk_section():
+    with st.expander("Assumptions", expanded=False):
+        mc1, mc2, mc3 = st.columns(3)
+        with mc1:
+            risk_kind = st.selectbox("Distribution", KINDS, key="mc_kind")
+        with mc2:
+            risk_trials = st.number_input("Trials", value=100_000, step=10_000, min_value=1_000, max_value=1_000_000, key="mc_trials")
+        with mc3:
+            risk_seed = st.number_input("Seed", value=42, step=1, min_value=0, key="mc_seed")
+        st.markdown("**Spread around the current point estimate**")
+        risk_spreads = st.data_editor(
+            pd.DataFrame(RISK_PARAMS, columns=["Field", "Parameter", "Low (−%)", "High (+%)"]),
+            column_config={
+                "Field": None,
+                "Low (−%)": st.column_config.NumberColumn(min_value=0, max_value=100, step=5),
+                "High (+%)": st.column_config.NumberColumn(min_value=0, step=5),
+            },
+            disabled=["Parameter"], hide_index=True, width="stretch", key="mc_spreads",
+        )
+
+    if st.toggle("Run simulation", value=False, key="mc_on"):
+        distributions = {
+            row["Field"]: spread(risk_kind, getattr(plan_inputs, row["Field"]), row["Low (−%)"], row["High (+%)"])
+            for row in risk_spreads.to_dict("records")
+        }
+        risk_table, cost_hist, days_hist = stage("Risk", summarize, plan_inputs, tuple(distributions.items()),
+                                                 risk_trials, risk_seed)
+        st.dataframe(pd.DataFrame({
+            "Metric": ["💰 Total Budget", "📅 Duration (days)"],
+            "Plan": [f"${total_cost:,.0f}", f"{total_days}"],
+            **{col: [f"${risk_table.at['total_cost', col]:,.0f}", f"{risk_table.at['sequential_days', col]:.1f}"]
+               for col in risk_table.columns},
+        }), width="stretch", hide_index=True)
+
+        rh1, rh2 = st.columns(2)
+        with rh1:
+            st.markdown("#### Total Budget ($)")
+            st.bar_chart(cost_hist, height=260)
+        with rh2:
+            st.markdown("#### Duration (days)")
+            st.bar_chart(days_hist, height=260)
+        st.caption(f"ℹ️ {risk_trials:,} trials ({risk_kind}, seed {risk_seed}) of the full Volume → Timeline chain; every other assumption stays at its value above.")
+
+
+risk_section()
+st.divider()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 9. GOAL SEEK
+# ══════════════════════════════════════════════════════════════════════════════
+section("9 Goal Seek")
+st.markdown(SECTION_HEADER.format("🎯 9 — Goal Seek"), unsafe_allow_html=True)
+
+
+def apply_staffing(chosen):
+    # Runs before the next rerun, so the People / QA widgets pick the values up
+    st.session_state["p_tw"] = chosen.target_workers
+    st.session_state["p_cw"] = chosen.cat_c_workers
+    st.session_state["p_bw"] = chosen.cat_b_only_workers
+    st.session_state["qa_num_rev"] = chosen.num_reviewers
+    st.session_state["qa_rev_hpd"] = float(chosen.reviewer_hours_day)
+    st.session_state["qa_rev_a"] = int(chosen.review_rate_a)
+    st.session_state["qa_rev_b"] = int(chosen.review_rate_b)
+    st.session_state["qa_rev_c"] = int(chosen.review_rate_c)
+    rerun_app()
+
+
+@st.fragment
+def goal_seek_section():
+    finish_callbacks()
+    with st.expander("Assumptions", expanded=False):
+        gs1, gs2 = st.columns(2)
+        with gs1:
+            goal_deadline = st.number_input("Deadline (days, 0 = none)", value=0, step=1, min_value=0, key="gs_deadline")
+            goal_budget = st.number_input("Budget cap ($, 0 = none)", value=0.0, step=500.0, min_value=0.0, key="gs_budget")
+        with gs2:
+            goal_max_workers = st.number_input("Max workers", value=200, step=10, min_value=1, key="gs_max_workers")
+            goal_max_reviewers = st.number_input("Max reviewers", value=20, step=1, min_value=1, key="gs_max_reviewers")
+        st.caption("Searches the Cat C / Cat B-only split (target active = their sum) and reviewer capacity; review % stay as set in QA.")
+
+    if goal_deadline or goal_budget:
+        goal = stage("Goal seek", solve, plan_inputs, goal_deadline or None, goal_budget or None,
+                     goal_max_workers, goal_max_reviewers)
+        if goal is None:
+            st.error("No staffing within the limits meets that deadline / budget.")
+        else:
+            g = goal.inputs
+            st.dataframe(pd.DataFrame({
+                "": ["Cat C-qualified workers", "Cat B-only workers", "Target active workers", "Reviewers",
+                     "Reviewer hours / day", "💰 Total Budget", "📅 Duration"],
+                # One string type per column, so Arrow does not have to guess
+                "Current": [f"{cat_c_workers}", f"{cat_b_only_workers}", f"{target_workers}", f"{num_reviewers}",
+                            f"{reviewer_hours_day}", f"${total_cost:,.0f}", f"{total_days} days"],
+                "Goal seek": [f"{g.cat_c_workers}", f"{g.cat_b_only_workers}", f"{g.target_workers}", f"{g.num_reviewers}",
+                              f"{g.reviewer_hours_day}", f"${goal.results.money.total_cost:,.0f}",
+                              f"{goal.results.timeline.sequential_days} days"],
+            }), width="stretch", hide_index=True)
+            st.button("Apply to assumptions", on_click=apply_staffing, args=(g,), key="gs_apply")
+            st.caption(f"ℹ️ {goal.candidates:,} worker splits evaluated.")
+    else:
+        st.caption("Set a deadline and/or budget cap in the assumptions to search for the cheapest staffing.")
+
+
+goal_seek_section()
+st.divider()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 10. SENSITIVITY
+# ══════════════════════════════════════════════════════════════════════════════
+section("10 Sensitivity")
+st.markdown(SECTION_HEADER.format("🌪️ 10 — Sensitivity"), unsafe_allow_html=True)
+
+
+@st.fragment
+def sensitivity_section():
+    with st.expander("Assumptions", expanded=False):
+        sens1, sens2 = st.columns(2)
+        with sens1:
+            sens_pct = st.slider("Perturbation ±%", 1, 50, 10, 1, key="sens_pct")
+        with sens2:
+            sens_top = st.number_input("Inputs shown", value=12, step=1, min_value=3, max_value=len(SENSITIVITY_FIELDS), key="sens_top")
+
+    sens_df = stage("Sensitivity", tornado, plan_inputs, sens_pct)
+
+    def tornado_chart(metric, title):
+        bars = tornado_bars(sens_df, metric, sens_top)
+        return alt.Chart(bars, title=title).mark_bar().encode(
+            x=alt.X("Delta:Q", title="Change vs. plan"),
+            y=alt.Y("Input:N", sort=None, title=None),
+            color=alt.Color("Change:N", title=None),
+            tooltip=["Input", "Change", alt.Tooltip("Delta:Q", format=",.2f")],
+        )
+
+    sc1, sc2 = st.columns(2)
+    with sc1:
+        st.altair_chart(tornado_chart("total_cost", "💰 Total Budget ($)"), width="stretch")
+    with sc2:
+        st.altair_chart(tornado_chart("sequential_days", "📅 Duration (days)"), width="stretch")
+    st.caption(f"ℹ️ Each input moved ±{sens_pct}% on its own ({2 * len(sens_df)} plans evaluated in one batch); bars show the change in budget and duration.")
+
+
+sensitivity_section()
+st.divider()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 11. SCENARIOS
+# ══════════════════════════════════════════════════════════════════════════════
+section("11 Scenarios")
+st.markdown(SECTION_HEADER.format("💾 11 — Scenarios"), unsafe_allow_html=True)
+
+scenario_store = get_scenario_store()
+FIELD_KEYS = {field: key for key, field in WIDGET_KEYS.items()}
+
+
+def save_scenario(inputs):
+    name = st.session_state["sc_name"].strip()
+    if name:
+        scenario_store.save(name, inputs)
+        rerun_app()  # the Multi-Project Schedule lists saved scenarios
+
+
+def delete_scenario(name):
+    scenario_store.delete(name)
+    rerun_app()
+
+
+def load_scenario(name):
+    # Runs before the next rerun, so every assumption widget picks the values up
+    loaded = scenario_store.load(name)
+    for field, value in loaded.__dict__.items():
+        if field == "num_evals" and value is None:
+            value = scenario_store.results([name])[name]["num_evals"]
+        st.session_state[FIELD_KEYS[field]] = value
+    rerun_app()
+
+
+@st.fragment
+def scenarios_section():
+    finish_callbacks()
+    sv1, sv2 = st.columns(2)
+    with sv1:
+        st.text_input("Scenario name", key="sc_name", placeholder="e.g. 20 workers, with SEC context")
+        st.button("Save current assumptions", on_click=save_scenario, args=(plan_inputs,), key="sc_save")
+    saved_names = scenario_store.names()
+    with sv2:
+        load_name = st.selectbox("Saved scenario", saved_names, index=None, key="sc_load_name")
+        ld1, ld2 = st.columns(2)
+        ld1.button("Load into assumptions", on_click=load_scenario, args=(load_name,), disabled=load_name is None, key="sc_load")
+        ld2.button("Delete", on_click=delete_scenario, args=(load_name,), disabled=load_name is None, key="sc_delete")
+
+    compare_names = st.multiselect("Compare", saved_names, key="sc_compare")
+    if compare_names:
+        compare_df = scenario_store.compare(compare_names)
+        money_rows = [COMPARE_LINES[f] for f in BUDGET_LINES + ["total_cost"]]
+        st.dataframe(compare_df.apply(
+            lambda row: row.map(lambda v: f"${v:,.0f}" if row.name in money_rows else f"{v:,.0f}"), axis=1,
+        ), width="stretch")
+        st.altair_chart(alt.Chart(scenario_store.budget_lines(compare_names)).mark_bar().encode(
+            x=alt.X("Scenario:N", sort=compare_names, title=None),
+            y=alt.Y("Cost:Q", title="Cost ($)"),
+            color=alt.Color("Line Item:N"),
+            tooltip=["Scenario", "Line Item", alt.Tooltip("Cost:Q", format="$,.2f")],
+        ), width="stretch")
+        st.caption("ℹ️ Δ columns are relative to the first scenario selected. Results come from the store, cached by input hash.")
+    else:
+        st.caption("Save the current assumptions under a name, then pick saved scenarios to compare them side by side.")
+
+
+scenarios_section()
+st.divider()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 12. PIPELINE SIMULATION
+# ══════════════════════════════════════════════════════════════════════════════
+section("12 Pipeline Simulation")
+st.markdown(SECTION_HEADER.format("🏭 12 — Pipeline Simulation"), unsafe_allow_html=True)
+
+
+@st.fragment
+def pipeline_section():
+    with st.expander("Assumptions", expanded=False):
+        ps1, ps2, ps3 = st.columns(3)
+        with ps1:
+            sim_reps = st.number_input("Replications", value=200, step=50, min_value=1, max_value=5000, key="ps_reps")
+        with ps2:
+            sim_seed = st.number_input("Seed", value=42, step=1, min_value=0, key="ps_seed")
+        with ps3:
+            sim_retention_days = st.number_input("Retention horizon (days, 0 = data creation days)", value=0, step=1, min_value=0, key="ps_ret_days")
+        st.caption(f"Retention: {retention_rate}% of workers still active after the horizon · reviews start the day after a submission is created · rejected submissions are redone.")
+
+    if st.toggle("Run day-by-day simulation", value=False, key="ps_on"):
+        sim = stage("Pipeline", simulate_pipeline, plan_inputs, sim_reps, sim_seed, sim_retention_days or None)
+        sim_pct = sim.completion_percentiles()
+        unfinished = int((sim.completion_days < 0).sum())
+        sm1, sm2, sm3 = st.columns(3)
+        sm1.metric("Planned Data + QA Block", f"{sim.planned_days} days")
+        if sim_pct[50] is None:
+            sm2.metric("Simulated P50", "not finished")
+            sm3.metric("Simulated P90", "not finished")
+        else:
+            sm2.metric("Simulated P50", f"{sim_pct[50]:.0f} days", f"{sim_pct[50] - sim.planned_days:+.0f} days", delta_color="inverse")
+            sm3.metric("Simulated P90", f"{sim_pct[90]:.0f} days", f"{sim_pct[90] - sim.planned_days:+.0f} days", delta_color="inverse")
+
+        pc1, pc2 = st.columns(2)
+        with pc1:
+            st.markdown("#### Daily Throughput")
+            st.line_chart(sim.daily[["Created", "Reviewed", "Rejected"]], height=260)
+        with pc2:
+            st.markdown("#### Review Queue Depth")
+            st.area_chart(sim.daily[["Review queue"]], height=260)
+        st.markdown("#### Accepted Submissions")
+        st.line_chart(sim.daily[["Accepted (cumulative)"]], height=220)
+        if unfinished:
+            st.warning(f"{unfinished} of {sim_reps} replications did not finish within {len(sim.daily)} days — check worker capacity per category.")
+        if sim_pct[50] is not None:
+            st.caption(f"ℹ️ Mean of {sim_reps} replications. Total project at P50: {sim.fixed_days + sim_pct[50]:.0f} days (vs. {total_days} planned).")
+
+
+pipeline_section()
+st.divider()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 13. CATEGORY PLANNER (any number of categories)
+# ══════════════════════════════════════════════════════════════════════════════
+section("13 Category Planner")
+st.markdown(SECTION_HEADER.format("🧩 13 — Category Planner"), unsafe_allow_html=True)
+
+DEFAULT_CATEGORIES, DEFAULT_TIERS = abc_categories()
+
+
+@st.fragment
+def category_section():
+    with st.expander("Assumptions", expanded=False):
+        cp1, cp2 = st.columns([3, 1])
+        with cp1:
+            st.markdown("**Categories** (add or remove rows)")
+            category_rows = st.data_editor(
+                # Float columns, so a fractional entry reaches the check instead of being truncated
+                category_frame(DEFAULT_CATEGORIES).astype({"Tier": float}),
+                column_config={
+                    "Mix %": st.column_config.NumberColumn(min_value=0, max_value=100, step=1),
+                    "Failure %": st.column_config.NumberColumn(min_value=0, max_value=99, step=1),
+                    "Minutes": st.column_config.NumberColumn(min_value=0, step=5),
+                    "Review %": st.column_config.NumberColumn(min_value=0, max_value=100, step=5),
+                    "Tier": st.column_config.NumberColumn(min_value=1, step=1, help="Lowest worker tier qualified for it"),
+                },
+                num_rows="dynamic", hide_index=True, width="stretch", key="cp_categories",
+            )
+        with cp2:
+            st.markdown("**Worker tiers**")
+            tier_rows = st.data_editor(
+                pd.DataFrame(DEFAULT_TIERS, columns=["Tier", "Workers"], dtype=float),
+                column_config={
+                    "Tier": st.column_config.NumberColumn(min_value=1, step=1),
+                    "Workers": st.column_config.NumberColumn(min_value=0, step=1),
+                },
+                num_rows="dynamic", hide_index=True, width="stretch", key="cp_tiers",
+            )
+        st.caption("A worker of tier t can take every category of tier ≤ t. Hours per day, reviewers, the recruitment funnel, rates and timeline phases come from the sections above.")
+
+    try:
+        planner_categories = categories_from_frame(category_rows)
+        planner_tiers = tiers_from_frame(tier_rows)
+    except ValueError as e:
+        st.error(str(e))
+        planner_categories = None
+
+    if planner_categories:
+        cat_plan = stage("Category plan", plan_categories, plan_inputs, planner_categories, planner_tiers)
+
+        mix_total = sum(c.mix_pct for c in planner_categories)
+        if mix_total < 100:
+            st.warning(f"Category mix adds up to {mix_total:g}% — {planner_categories[-1].name} takes the remainder of the deliverable.")
+        if cat_plan.unassigned:
+            st.error(f"No staffed worker tier is qualified for: {', '.join(cat_plan.unassigned)}.")
+
+        cm1, cm2, cm3, cm4 = st.columns(4)
+        cm1.metric("📦 Submissions Required", f"{cat_plan.total_required}", f"{cat_plan.total_required - total_required:+}", delta_color="inverse")
+        cm2.metric("⏱️ Annotation Hours", f"{cat_plan.total_annotation_time/60:.1f}", f"{(cat_plan.total_annotation_time - total_annotation_time)/60:+.1f}", delta_color="inverse")
+        cm3.metric("📅 Duration", f"{cat_plan.timeline.sequential_days} days", f"{cat_plan.timeline.sequential_days - total_days:+} days", delta_color="inverse")
+        cm4.metric("💰 Total Budget", f"${cat_plan.money.total_cost:,.0f}", f"${cat_plan.money.total_cost - total_cost:+,.0f}", delta_color="inverse")
+
+        st.dataframe(cat_plan.categories, width="stretch", hide_index=True)
+        st.markdown("#### Workload per Worker Tier")
+        st.dataframe(cat_plan.workload, width="stretch", hide_index=True)
+        st.caption("ℹ️ Deltas are against the A/B/C plan above. Each category is split across its qualified tiers by head-count.")
+
+
+category_section()
+st.divider()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 14. LLM COST PLAN (caching, batch, per-call-type models)
+# ══════════════════════════════════════════════════════════════════════════════
+section("14 LLM Cost Plan")
+st.markdown(SECTION_HEADER.format("🤖 14 — LLM Cost Plan"), unsafe_allow_html=True)
+
+
+@st.fragment
+def llm_section():
+    with st.expander("Assumptions", expanded=False):
+        lc1, lc2 = st.columns(2)
+        with lc1:
+            st.markdown("**Prompt reuse**")
+            questions_per_filing = st.number_input("Questions per SEC filing", value=10, step=1, min_value=1, key="llm_qpf")
+            cache_hit_pct = st.slider("Repeat calls within cache lifetime %", 0, 100, 90, 5, key="llm_hit")
+            eval_shared_tokens = st.number_input("Shared rubric tokens / eval", value=0, step=100, min_value=0, key="llm_eval_shared")
+        with lc2:
+            st.markdown("**Provider discounts**")
+            cache_read = st.number_input("Cached input (× input price)", value=0.1, step=0.05, min_value=0.0, key="llm_cread")
+            cache_write = st.number_input("Cache write (× input price)", value=1.25, step=0.05, min_value=0.0, key="llm_cwrite")
+            batch_discount = st.slider("Batch API discount %", 0, 100, 50, 5, key="llm_batch")
+        st.markdown(f"**Other models** ($ per 1M tokens; *{APP_MODEL}* = ${llm_price_input:g} / ${llm_price_output:g} from the Money section)")
+        model_rows = st.data_editor(
+            pd.DataFrame([("Small", 0.4, 1.6), ("Large", 15.0, 75.0)], columns=["Model", "Input $/M", "Output $/M"]),
+            column_config={
+                "Input $/M": st.column_config.NumberColumn(min_value=0, step=0.1),
+                "Output $/M": st.column_config.NumberColumn(min_value=0, step=0.1),
+            },
+            num_rows="dynamic", hide_index=True, width="stretch", key="llm_models",
+        )
+
+    llm_models = tuple(ModelPrice(str(m).strip(), float(p_in), float(p_out))
+                       for m, p_in, p_out in model_rows.dropna().itertuples(index=False) if str(m).strip())
+    model_names = [APP_MODEL] + [m.name for m in llm_models if m.name != APP_MODEL]
+
+    lm1, lm2 = st.columns(2)
+    call_setup = {}
+    for col, call_key, label, cache_default, batch_default in (
+        (lm1, "sub", "Submissions (with SEC)", True, False),
+        (lm2, "eval", "Evaluations", False, True),
+    ):
+        with col:
+            st.markdown(f"**{label}**")
+            call_setup[label] = (
+                st.selectbox("Model", model_names, key=f"llm_{call_key}_model"),
+                st.toggle("Prompt caching", value=cache_default, key=f"llm_{call_key}_cache"),
+                st.toggle("Batch API", value=batch_default, key=f"llm_{call_key}_batch"),
+            )
+
+    llm_calls = tuple(
+        replace(call, model=call_setup[call.name][0], cached=call_setup[call.name][1], batched=call_setup[call.name][2])
+        for call in default_calls(plan_inputs, total_required, tech.num_evals,
+                                  questions_per_filing, cache_hit_pct, eval_shared_tokens)
+    )
+    llm_pricing = CachePricing(cache_read, cache_write, batch_discount)
+    llm_df = stage("LLM plan", plan_llm, llm_calls, llm_models, llm_price_input, llm_price_output, llm_pricing)
+    llm_naive, llm_planned = llm_df["Naive ($)"].sum(), llm_df["Planned ($)"].sum()
+
+    ll1, ll2, ll3 = st.columns(3)
+    ll1.metric("Naive LLM Cost", f"${llm_naive:,.2f}")
+    ll2.metric("Planned LLM Cost", f"${llm_planned:,.2f}")
+    ll3.metric("Savings", f"${llm_naive - llm_planned:,.2f}", f"{(llm_naive - llm_planned) / llm_naive * 100 if llm_naive else 0:.1f}%")
+    st.dataframe(llm_df, width="stretch", hide_index=True)
+
+    st.markdown("#### Cheapest Setup per Call Type")
+    st.dataframe(pd.concat([
+        stage("LLM options", setup_options, call, llm_models, llm_price_input, llm_price_output, llm_pricing).head(1)
+        for call in llm_calls
+    ], ignore_index=True), width="stretch", hide_index=True)
+    st.caption(f"ℹ️ Naive = the Money section's LLM cost (${total_llm_cost:,.2f}): every input token at full price, no batch. The SEC context is the with-SEC minus without-SEC input tokens ({max(tok_sub_in_sec - tok_sub_in_nosec, 0):,}/question), written to the cache once per filing.")
+
+
+llm_section()
+st.divider()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 15. MULTI-PROJECT SCHEDULE (shared worker / reviewer pool)
+# ══════════════════════════════════════════════════════════════════════════════
+section("15 Multi-Project Schedule")
+st.markdown(SECTION_HEADER.format("🗓️ 15 — Multi-Project Schedule"), unsafe_allow_html=True)
+
+CURRENT_PLAN = "Current assumptions"
+
+
+@st.fragment
+def schedule_section():
+    with st.expander("Assumptions", expanded=False):
+        ms1, ms2, ms3 = st.columns(3)
+        with ms1:
+            st.markdown("**Shared worker pool**")
+            pool_c = st.number_input("Cat C-qualified workers", value=40, step=5, min_value=0, key="ms_cw")
+            pool_b = st.number_input("Cat B-only workers", value=20, step=5, min_value=0, key="ms_bw")
+            pool_hpd = st.number_input("Work hours per worker per day", value=2.0, step=0.5, min_value=0.5, key="ms_hpd")
+        with ms2:
+            st.markdown("**Shared reviewer pool**")
+            pool_reviewers = st.number_input("Reviewers", value=3, step=1, min_value=0, key="ms_rev")
+            pool_rev_hpd = st.number_input("Hours per reviewer per day", value=5.0, step=0.5, min_value=0.5, key="ms_rev_hpd")
+        with ms3:
+            st.markdown("**Search**")
+            sched_objective = st.selectbox("Minimise", SCHEDULE_OBJECTIVES,
+                                           format_func={"lateness": "Total days late", "cost": "Total late fees"}.get, key="ms_objective")
+            sched_time_limit = st.number_input("Time limit (s)", value=3.0, step=1.0, min_value=0.5, max_value=60.0, key="ms_time")
+
+    project_names = st.multiselect("Projects (saved scenarios)", [CURRENT_PLAN] + scenario_store.names(), default=[CURRENT_PLAN], key="ms_projects")
+    project_rows = st.data_editor(
+        pd.DataFrame({"Project": project_names, "Release day": 0, "Due day": 30, "Late fee ($/day)": 0.0,
+                      "Max workers": None}).astype({"Max workers": "Int64"}),
+        column_config={
+            "Release day": st.column_config.NumberColumn(min_value=0, step=1, help="Setup starts the day after"),
+            "Due day": st.column_config.NumberColumn(min_value=1, step=1),
+            "Late fee ($/day)": st.column_config.NumberColumn(min_value=0, step=100),
+            "Max workers": st.column_config.NumberColumn(min_value=1, step=1, help="Blank = no cap"),
+        },
+        disabled=["Project"], hide_index=True, width="stretch", key="ms_rows",
+    )
+
+    if project_names and st.toggle("Build schedule", value=False, key="ms_on"):
+        # A cleared release day or fee means none; a due day has no sensible default
+        project_rows = project_rows.fillna({"Release day": 0, "Late fee ($/day)": 0.0})
+        undated = project_rows.loc[project_rows["Due day"].isna(), "Project"].tolist()
+        if undated:
+            st.error(f"Enter a due day for {', '.join(undated)}.")
+            return
+        projects = tuple(
+            Project(row["Project"], plan_inputs if row["Project"] == CURRENT_PLAN else scenario_store.load(row["Project"]),
+                    int(row["Due day"]), int(row["Release day"]), float(row["Late fee ($/day)"]),
+                    None if pd.isna(row["Max workers"]) else int(row["Max workers"]))
+            for row in project_rows.to_dict("records")
+        )
+        shared_pool = SharedPool(pool_c, pool_b, pool_hpd, pool_reviewers, pool_rev_hpd)
+        plan = stage("Schedule", schedule, projects, shared_pool, sched_objective, 1000, sched_time_limit)
+
+        sd1, sd2, sd3, sd4 = st.columns(4)
+        sd1.metric("Projects", len(projects))
+        sd2.metric("Makespan", f"{plan.makespan} days" if plan.makespan >= 0 else "not finished")
+        sd3.metric("Total Days Late", plan.total_days_late)
+        sd4.metric("Late Fees", f"${plan.total_late_fees:,.0f}")
+        if plan.unfinished:
+            st.error(f"The pool cannot finish {', '.join(plan.unfinished)} within 1000 days — check Cat C / reviewer capacity.")
+
+        due = plan.projects[["Project", "Due"]]
+        gantt = alt.Chart(plan.gantt).mark_bar().encode(
+            x=alt.X("Start:Q", title="Day"), x2="Day end:Q",
+            y=alt.Y("Project:N", sort=list(plan.order), title=None),
+            color=alt.Color("Phase:N", sort=["Setup", "Data + QA", "Wrap-up"]),
+            tooltip=["Project", "Phase", "Start", "End"],
+        ).transform_calculate(**{"Day end": "datum.End + 1"})
+        due_ticks = alt.Chart(due).mark_tick(color="#ef4444", thickness=3).encode(
+            x=alt.X("Due:Q"), y=alt.Y("Project:N", sort=list(plan.order)), tooltip=["Project", "Due"],
+        )
+        st.altair_chart((gantt + due_ticks).properties(height=max(120, 28 * len(projects))), width="stretch")
+        st.dataframe(plan.projects, width="stretch", hide_index=True)
+
+        st.markdown("#### Pool Usage by Day")
+        usage = plan.usage.assign(Workers=plan.usage["Cat C workers"] + plan.usage["B-only workers"])
+        st.altair_chart(alt.Chart(usage).mark_area().encode(
+            x=alt.X("Day:Q"), y=alt.Y("Workers:Q", stack=True), color=alt.Color("Project:N"),
+            tooltip=["Day", "Project", alt.Tooltip("Workers:Q", format=".1f"), alt.Tooltip("Reviewers:Q", format=".1f")],
+        ).properties(height=240), width="stretch")
+        st.caption(f"ℹ️ Priority order from dispatch rules plus pairwise swaps ({plan.evaluations:,} orders simulated). Red ticks mark due days; each project's hours / day come from the pool.")
+
+
+schedule_section()
+st.divider()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 16. EXPORT (Excel workbook / Parquet bundle)
+# ══════════════════════════════════════════════════════════════════════════════
+section("16 Export")
+st.markdown(SECTION_HEADER.format("📤 16 — Export"), unsafe_allow_html=True)
+
+EXPORT_FORMATS = {
+    "Excel workbook (.xlsx)": (to_excel, "xlsx", XLSX_MIME),
+    "Parquet bundle (.zip)": (to_parquet_zip, "zip", ZIP_MIME),
+}
+
+
+@st.fragment
+def export_section():
+    ex1, ex2 = st.columns([1, 2])
+    with ex1:
+        export_format = st.radio("Format", list(EXPORT_FORMATS), key="ex_format")
+    with ex2:
+        export_names = st.multiselect("Scenarios", [CURRENT_PLAN] + scenario_store.names(),
+                                      default=[CURRENT_PLAN], key="ex_scenarios")
+    write, suffix, mime = EXPORT_FORMATS[export_format]
+    named_inputs = {name: plan_inputs if name == CURRENT_PLAN else scenario_store.load(name) for name in export_names}
+    missing_engine = suffix == "xlsx" and excel_engine() is None
+    st.download_button(
+        f"⬇️ Download {len(export_names)} scenario{'s' * (len(export_names) != 1)}",
+        # Built only when clicked, off the script thread
+        data=lambda: write(export_tables(evaluate_plans(named_inputs))),
+        file_name=f"logistics_plan.{suffix}", mime=mime, on_click="ignore",
+        disabled=not export_names or missing_engine, key="ex_download",
+    )
+    if missing_engine:
+        st.warning("Excel export needs openpyxl on the server: `pip install openpyxl`. The Parquet bundle works without it.")
+    st.caption("ℹ️ One sheet (or Parquet file) per section table, plus Summary, Inputs and Results with the plain numbers; "
+               "every table has a Scenario column, one block per selected scenario.")
+
+
+export_section()
+st.divider()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 17. PARETO FRONTIER (cost vs. duration)
+# ══════════════════════════════════════════════════════════════════════════════
+section("17 Pareto Frontier")
+st.markdown(SECTION_HEADER.format("📈 17 — Pareto Frontier"), unsafe_allow_html=True)
+
+REVIEW_SCALES = [25, 50, 75, 100, 125, 150]  # % of the QA review rates
+CLOUD_POINTS = 2000  # dominated points drawn behind the frontier
+
+
+@st.fragment
+def frontier_section():
+    finish_callbacks()
+    with st.expander("Assumptions", expanded=False):
+        pf1, pf2 = st.columns(2)
+        with pf1:
+            pf_max_workers = st.number_input("Max workers", value=60, step=10, min_value=1, max_value=500, key="pf_max_workers")
+            pf_max_reviewers = st.number_input("Max reviewers", value=10, step=1, min_value=1, max_value=50, key="pf_max_reviewers")
+        with pf2:
+            pf_max_hours = st.number_input("Max reviewer hours / day", value=8.0, step=0.5, min_value=0.5, max_value=12.0, key="pf_max_hours")
+            pf_scales = st.multiselect("Review policies (% of the QA review rates)", REVIEW_SCALES, default=[100],
+                                       key="pf_scales")
+        st.caption("Every Cat C / Cat B-only split (target active = their sum), reviewer count × hours / day and "
+                   "review policy within the limits; each review policy gets its own frontier.")
+
+    if not pf_scales:
+        st.caption("Pick at least one review policy in the assumptions.")
+        return
+    front = stage("Pareto frontier", frontier, plan_inputs, pf_max_workers, pf_max_reviewers,
+                  pf_max_hours, tuple(sorted(pf_scales)))
+    points = front.points.rename_axis("Point").reset_index()
+
+    def load_point():
+        # Clicked point → widgets; runs before the next rerun like apply_staffing
+        picked = st.session_state["pf_chart"].selection.get("pick")
+        if picked:
+            apply_staffing(point_inputs(plan_inputs, front.points.loc[int(picked[0]["Point"])]))
+
+    cloud = front.cloud
+    if len(cloud) > CLOUD_POINTS:
+        cloud = cloud.sample(CLOUD_POINTS, random_state=0)
+    pick = alt.selection_point(name="pick", fields=["Point"], on="click")
+    x = alt.X("sequential_days:Q", title="Duration (days)", scale=alt.Scale(zero=False))
+    y = alt.Y("total_cost:Q", title="Total budget ($)", scale=alt.Scale(zero=False))
+    policy = alt.Color("Review policy:N", title="Review %")
+    dominated = alt.Chart(cloud).mark_circle(size=12, opacity=0.15).encode(x=x, y=y, color=policy)
+    line = alt.Chart(points).mark_line().encode(x=x, y=y, color=policy, order="sequential_days:Q")
+    dots = alt.Chart(points).mark_circle(size=80).encode(
+        x=x, y=y, color=policy,
+        opacity=alt.condition(pick, alt.value(1.0), alt.value(0.5)),
+        tooltip=[alt.Tooltip("total_cost:Q", title="Budget", format="$,.0f"),
+                 alt.Tooltip("sequential_days:Q", title="Days"),
+                 alt.Tooltip("cat_c_workers:Q", title="Cat C workers"),
+                 alt.Tooltip("cat_b_only_workers:Q", title="Cat B-only workers"),
+                 alt.Tooltip("num_reviewers:Q", title="Reviewers"),
+                 alt.Tooltip("reviewer_hours_day:Q", title="Reviewer h/day"),
+                 alt.Tooltip("Review policy:N", title="Review %")],
+    ).add_params(pick)
+    current = alt.Chart(pd.DataFrame({"sequential_days": [total_days], "total_cost": [total_cost]})).mark_point(
+        shape="diamond", size=160, color="#ef4444", filled=True).encode(x=x, y=y, tooltip=[
+        alt.Tooltip("total_cost:Q", title="Current budget", format="$,.0f"), alt.Tooltip("sequential_days:Q", title="Current days")])
+    st.altair_chart(dominated + line + dots + current, width="stretch", on_select=load_point,
+                    selection_mode="pick", key="pf_chart")
+
+    with detail_panel("Frontier points", "dp_frontier", folded=True) as show:
+        if show:
+            st.dataframe(pd.DataFrame({
+                "Review %": points["Review policy"],
+                "Cat A / B / C review %": [f"{a} / {b} / {c}" for a, b, c in
+                                           zip(points["review_rate_a"], points["review_rate_b"], points["review_rate_c"])],
+                "Cat C workers": points["cat_c_workers"],
+                "Cat B-only workers": points["cat_b_only_workers"],
+                "Reviewers": points["num_reviewers"],
+                "Reviewer h/day": points["reviewer_hours_day"],
+                "💰 Total Budget ($)": points["total_cost"].round(2),
+                "📅 Duration (days)": points["sequential_days"],
+                "Data days": points["days_data"],
+                "QA days": points["qa_days_available"],
+            }), width="stretch", hide_index=True)
+    st.caption(f"ℹ️ {front.configurations:,} configurations, {front.evaluated:,} evaluated after dropping ones that cannot "
+               f"be on the frontier, {len(points)} on it. The ◆ is the current plan; click a point to load its staffing "
+               "and review % into the assumptions above.")
+
+
+frontier_section()
+st.divider()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 18. ACTUALS (re-plan a running project from its progress log)
+# ══════════════════════════════════════════════════════════════════════════════
+section("18 Actuals")
+st.markdown(SECTION_HEADER.format("🔁 18 — Actuals"), unsafe_allow_html=True)
+
+
+@st.fragment
+def actuals_section():
+    with st.expander("Progress log", expanded=False):
+        act1, act2 = st.columns(2)
+        with act1:
+            act_log = st.selectbox("Log on the server (appended as work happens)", server_logs(), index=None,
+                                   placeholder="Choose a log" if server_logs() else "No server log directory set",
+                                   key="act_log")
+            act_prior = st.number_input("Plan weight (observations)", value=PRIOR_WEIGHT, step=5, min_value=0,
+                                        key="act_prior")
+        with act2:
+            act_upload = st.file_uploader("…or upload a copy of the log", type="csv", key="act_upload")
+        st.caption("One row per event with columns event (accepted / rejected / review), category (A / B / C) and "
+                   "minutes; other columns are ignored. Estimated rates lean on the plan's by the plan weight.")
+
+    if act_upload is not None:
+        # Per session, so two people uploading a "progress.csv" keep separate checkpoints
+        session = st.session_state.setdefault("act_session", uuid.uuid4().hex)
+        source, opener = f"upload:{session}:{act_upload.name}", lambda: nullcontext(act_upload)
+    elif act_log:
+        try:
+            path = server_log_path(act_log)
+        except ValueError as e:
+            st.error(str(e))
+            return
+        source, opener = str(path), lambda: open(path, "rb")
+    else:
+        st.caption("Choose (or upload) the progress log of a running project to re-plan the remaining work. "
+                   "Server logs are listed from LOGISTICS_ACTUALS_LOG_DIR.")
+        return
+
+    ckpt_path = checkpoint_path(source)
+    before = load_checkpoint(ckpt_path) or Checkpoint()
+    try:
+        with opener() as log:
+            checkpoint = ingest(before, log)
+    except (OSError, ValueError) as e:
+        st.error(f"Cannot read the progress log: {e}")
+        return
+    if checkpoint != before:
+        save_checkpoint(ckpt_path, checkpoint)
+    revised = replan(plan_inputs, checkpoint, act_prior)
+
+    planned_left = total_days - days_finding - days_testing
+    spent, to_complete = sum(revised.spent.values()), sum(revised.to_complete.values())
+    am1, am2, am3, am4 = st.columns(4)
+    am1.metric("📥 Log rows read", f"{checkpoint.rows:,}", f"+{checkpoint.rows - before.rows:,} new"
+               if checkpoint.rows >= before.rows else "re-read from the top", delta_color="off")
+    am2.metric("💸 Cost to complete", f"${to_complete:,.0f}", f"${spent:,.0f} spent", delta_color="off")
+    am3.metric("💰 Estimate at completion", f"${revised.estimate_at_completion:,.0f}",
+               f"{revised.estimate_at_completion - total_cost:+,.0f} vs. plan", delta_color="inverse")
+    am4.metric("📅 Days to finish", f"{revised.remaining_days} days",
+               f"{revised.remaining_days - planned_left:+} vs. plan", delta_color="inverse")
+
+    st.dataframe(revised.progress, width="stretch", hide_index=True)
+    with detail_panel("Estimated rates and cost to complete", "dp_actuals") as show:
+        if show:
+            ac1, ac2 = st.columns(2)
+            with ac1:
+                st.dataframe(revised.estimates.round({"Plan": 2, "Estimate": 2}), width="stretch", hide_index=True)
+            with ac2:
+                st.dataframe(pd.DataFrame({
+                    "Line Item": list(revised.spent) + ["TOTAL"],
+                    "Spent ($)": list(revised.spent.values()) + [spent],
+                    "To complete ($)": list(revised.to_complete.values()) + [to_complete],
+                    "At completion ($)": [revised.spent[k] + revised.to_complete[k] for k in revised.spent]
+                                         + [revised.estimate_at_completion],
+                }).round(2), width="stretch", hide_index=True)
+            st.caption(f"ℹ️ Data creation {revised.data_days} days and QA {revised.qa_days} days "
+                       f"(incl. {revised.review_backlog_minutes / 60:,.1f} h of reviews owed on submissions already in), "
+                       "then meeting, compiling and buffer; finding and testing are behind the project.")
+    st.button("Re-read the log from the top", on_click=lambda: ckpt_path.unlink(missing_ok=True), key="act_reset")
+    st.caption(f"ℹ️ {checkpoint.offset / 1e6:,.1f} MB read so far; each rerun parses only lines appended since"
+               f"{f', {checkpoint.skipped:,} rows skipped (unknown event or category)' if checkpoint.skipped else ''}.")
+
+
+actuals_section()
 st.divider()
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # FILL THE SUMMARY AT THE TOP (now that all values are computed)
 # ══════════════════════════════════════════════════════════════════════════════
+section("Summary")
 with summary_container:
-    st.markdown('<div class="section-header"><h2>📊 Summary</h2></div>', unsafe_allow_html=True)
+    st.markdown(SECTION_HEADER.format("📊 Summary"), unsafe_allow_html=True)
     s1, s2, s3, s4, s5 = st.columns(5)
     s1.metric("💰 Total Budget", f"${total_cost:,.0f}")
     s2.metric("📦 Submissions Required", f"{total_required}")
@@ -484,48 +1201,62 @@ with summary_container:
     s4.metric("👥 Invitations Needed", f"{workers_to_invite}")
     s5.metric("⏱️ Annotation Hours", f"{total_annotation_time/60:.1f}")
 
+    # Exact-arithmetic checks of the whole chain, on every rerun
+    reconciliation = stage("Reconcile", reconcile,
+                           PlanResults(plan_inputs, volume, time, people, qa, tech, money, timeline))
+    for check in reconciliation.errors:
+        st.error(f"🧮 {check.name}: {check.detail}")
+    exact_checks = len(reconciliation.checks) - len(reconciliation.errors) - len(reconciliation.drifts)
+    with detail_panel(f"🧮 Reconciliation — {exact_checks}/{len(reconciliation.checks)} checks exact, "
+                      f"{len(reconciliation.drifts)} rounding drift", "dp_reconcile", folded=True) as show:
+        if show:
+            st.dataframe(checks_table(reconciliation), width="stretch", hide_index=True)
+            st.markdown("#### Exact Allocation")
+            st.dataframe(reconciliation.allocation, width="stretch", hide_index=True)
+            st.caption(f"ℹ️ Integer / Decimal arithmetic: targets {reconciliation.targets} by largest remainder, "
+                       f"every required submission on one worker, busiest worker {reconciliation.data_days} days, "
+                       f"budget ${reconciliation.total_cost:,}. Drift = the float chain lands on a different "
+                       "whole number; error = the plan's numbers contradict each other.")
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 # COST SUMMARY TABLE (white bg, black text, Arial font)
 # ══════════════════════════════════════════════════════════════════════════════
 st.divider()
 
-cost_summary_html = f"""
-<div style="background-color: #ffffff; padding: 24px 28px; border-radius: 12px; border: 1px solid #e0e0e0; margin-top: 8px;">
-  <h3 style="color: #000000; font-family: Arial, sans-serif; margin-top: 0; margin-bottom: 16px;">Cost Summary by Category</h3>
-  <table style="width: 100%; border-collapse: collapse; font-family: Arial, sans-serif; color: #000000;">
-    <thead>
-      <tr style="border-bottom: 2px solid #333333;">
-        <th style="text-align: left; padding: 10px 12px; font-weight: 700; background-color: #f5f5f5; color: #000000;">Category</th>
-        <th style="text-align: right; padding: 10px 12px; font-weight: 700; background-color: #f5f5f5; color: #000000;">Cost</th>
-      </tr>
-    </thead>
-    <tbody>
-      <tr style="border-bottom: 1px solid #e0e0e0;">
-        <td style="padding: 10px 12px; color: #000000;">Worker Annotation</td>
-        <td style="text-align: right; padding: 10px 12px; color: #000000;">${worker_cost:,.2f}</td>
-      </tr>
-      <tr style="border-bottom: 1px solid #e0e0e0;">
-        <td style="padding: 10px 12px; color: #000000;">Qualification Testing</td>
-        <td style="text-align: right; padding: 10px 12px; color: #000000;">${qual_cost:,.2f}</td>
-      </tr>
-      <tr style="border-bottom: 1px solid #e0e0e0;">
-        <td style="padding: 10px 12px; color: #000000;">Expert Review (QA)</td>
-        <td style="text-align: right; padding: 10px 12px; color: #000000;">${reviewer_cost:,.2f}</td>
-      </tr>
-      <tr style="border-bottom: 1px solid #e0e0e0;">
-        <td style="padding: 10px 12px; color: #000000;">Tech / Infrastructure</td>
-        <td style="text-align: right; padding: 10px 12px; color: #000000;">${tech_cost:,.2f}</td>
-      </tr>
-      <tr style="border-top: 2px solid #333333; background-color: #f5f5f5;">
-        <td style="padding: 10px 12px; font-weight: 700; color: #000000;">TOTAL</td>
-        <td style="text-align: right; padding: 10px 12px; font-weight: 700; color: #000000;">${total_cost:,.2f}</td>
-      </tr>
-    </tbody>
-  </table>
-</div>
-"""
-st.markdown(cost_summary_html, unsafe_allow_html=True)
+section("Cost summary")
+with detail_panel("🧾 Cost summary", "dp_cost_summary") as show:
+    if show:
+        st.markdown(stage("Cost summary", cost_summary_html, money), unsafe_allow_html=True)
 
 st.markdown("<br>", unsafe_allow_html=True)
 st.caption("Built for Surge AI case study logistics planning. Every number trickles through — change one assumption and the rest follows.")
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# DEBUG — STAGE CACHE
+# ══════════════════════════════════════════════════════════════════════════════
+section("Debug")
+with detail_panel("🛠️ Debug — stage cache", "dp_debug", folded=True) as show:
+    if show:
+        st.dataframe(pd.DataFrame({
+            "Stage": [r.stage for r in stage_log],
+            "Result": ["hit" if r.hit else "recomputed" for r in stage_log],
+            "Time (ms)": [f"{r.seconds * 1000:.3f}" for r in stage_log],
+        }), width="stretch", hide_index=True)
+        hits = sum(r.hit for r in stage_log)
+        st.caption(f"{hits}/{len(stage_log)} stages served from cache this rerun · {len(stage_cache)}/{stage_cache.maxsize} entries cached.")
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# PROFILE (opt-in)
+# ══════════════════════════════════════════════════════════════════════════════
+if profile is not None:
+    profile.finish().log(render="lazy" if lazy_details else "full")
+    with st.sidebar.expander("⏱️ Profile — this rerun", expanded=True):
+        st.dataframe(profile.frame(), width="stretch", hide_index=True)
+        totals = profile.record()
+        st.caption(f"{totals['total_ms']:.1f} ms · {totals['stage_hits']}/{totals['stages']} stages cached · "
+                   f"{totals['dataframes']} DataFrames · {totals['widget_reads']} widget reads · "
+                   f"{totals['payload_bytes'] / 1024:.1f} KB sent. Stages (ms) is the calculator math; "
+                   "the rest of a section's time is DataFrames, charts and Streamlit serialization.")
@@ -0,0 +1,10 @@
+"""Static page assets: the stylesheet and HTML snippets shared by every session.
+
+app.py runs again for every session and rerun, but modules are imported once
+per server process, so style.css is read and wrapped here once and the same
+string is reused by every session.
+"""
+from pathlib import Path
+
+STYLE = f"<style>\n{Path(__file__).with_name('style.css').read_text(encoding='utf-8')}</style>"
+SECTION_HEADER = '<div class="section-header"><h2>{}</h2></div>'
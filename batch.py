@@ -0,0 +1,231 @@
+"""Vectorized evaluation of many plans at once.
+
+``evaluate_batch(df)`` takes one scenario per row (columns named like the
+PlanInputs fields or the app's widget keys; missing columns fall back to the
+defaults) and computes every derived column of calculator.calculate in a single
+pass of NumPy array operations, with the same rounding as the scalar path.
+"""
+import itertools
+from dataclasses import fields
+
+import numpy as np
+import pandas as pd
+
+from calculator import WIDGET_KEYS, PlanInputs
+
+INPUT_FIELDS = [f.name for f in fields(PlanInputs)]
+_DEFAULTS = PlanInputs()
+
+
+# ── Rounding helpers (match Python's round / math.ceil) ──────────────────────
+def _round0(x):
+    # np.rint is round-half-even on the exact binary value, like round(x)
+    return np.rint(x).astype(np.int64)
+
+
+def _round1(x):
+    # np.round(x, 1) scales by 10 first, which can land on the other side of a
+    # tie; redo the near-tie values with Python's correctly rounded round().
+    out = np.round(x, 1)
+    scaled = np.abs(x) * 10
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        # Ties repeat heavily in sweeps and simulations; round each distinct value once
+        values, inverse = np.unique(x[near_tie], return_inverse=True)
+        out[near_tie] = np.array([round(v, 1) for v in values.tolist()])[inverse]
+    return out
+
+
+def _ceil(x):
+    return np.ceil(x).astype(np.int64)
+
+
+def _gross_up(target, fail_pct):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        grossed = np.ceil(target / (1 - fail_pct / 100))
+    return np.where(fail_pct < 100, grossed, target).astype(np.int64)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# ARRAY CORE
+# ══════════════════════════════════════════════════════════════════════════════
+def funnel_arrays(target_workers, retention_rate, pass_rate, invite_take_rate):
+    """Recruitment funnel, working backwards from the target (People section)."""
+    before_retention = _ceil(target_workers / (retention_rate / 100))
+    before_pass = _ceil(before_retention / (pass_rate / 100))
+    return {
+        "workers_before_retention": before_retention,
+        "workers_before_pass": before_pass,
+        "workers_to_invite": _ceil(before_pass / (invite_take_rate / 100)),
+    }
+
+
+def workload_arrays(a_req, b_req, c_req, time_a, time_b, time_c, hours_per_worker_day, cw, bw):
+    """Per-worker workload and days for each worker type (People section)."""
+    tw_div = np.maximum(cw + bw, 1)
+    minutes_per_day = hours_per_worker_day * 60
+
+    has_c = cw > 0
+    cw_div = np.where(has_c, cw, 1)
+    a_per_c = np.where(has_c, _round1(a_req * (cw / tw_div) / cw_div), 0.0)
+    b_per_c = np.where(has_c, _round1(b_req * (cw / tw_div) / cw_div), 0.0)
+    c_per_c = np.where(has_c, _round1(c_req / cw_div), 0.0)
+    time_c_worker = a_per_c * time_a + b_per_c * time_b + c_per_c * time_c
+    days_c_worker = np.where(has_c, time_c_worker / minutes_per_day, 0.0)
+
+    has_b = bw > 0
+    bw_div = np.where(has_b, bw, 1)
+    a_per_b = np.where(has_b, _round1(a_req * (bw / tw_div) / bw_div), 0.0)
+    leftover_b = np.where(has_b, b_req - _round0(b_req * cw / tw_div), 0)
+    b_per_b = np.where(has_b, _round1(leftover_b / bw_div), 0.0)
+    time_b_worker = a_per_b * time_a + b_per_b * time_b
+    days_b_worker = np.where(has_b, time_b_worker / minutes_per_day, 0.0)
+
+    subs_per_day_c = np.where(has_c, ((a_per_c + b_per_c + c_per_c) / np.maximum(days_c_worker, 0.01)) * cw, 0.0)
+    subs_per_day_b = np.where(has_b, ((a_per_b + b_per_b) / np.maximum(days_b_worker, 0.01)) * bw, 0.0)
+    return {
+        "a_per_c": a_per_c, "b_per_c": b_per_c, "c_per_c": c_per_c,
+        "time_c_worker": time_c_worker, "days_c_worker": days_c_worker,
+        "a_per_b": a_per_b, "leftover_b": leftover_b, "b_per_b": b_per_b,
+        "time_b_worker": time_b_worker, "days_b_worker": days_b_worker,
+        "subs_per_day_c": subs_per_day_c, "subs_per_day_b": subs_per_day_b,
+        "total_subs_day": subs_per_day_c + subs_per_day_b,
+    }
+
+
+def evaluate_arrays(c):
+    """Evaluate the full chain over a dict of equal-length input arrays.
+
+    ``c`` must hold every PlanInputs field; ``num_evals`` may be NaN to mean
+    "one per required submission". Returns a dict of derived arrays keyed like
+    ``PlanResults.to_dict()``.
+    """
+    r = {}
+
+    # 1. Volume
+    r["cat_c_pct"] = np.maximum(100 - c["cat_a_pct"] - c["cat_b_pct"], 0)
+    a_tgt = _round0(c["total_deliverable"] * c["cat_a_pct"] / 100)
+    b_tgt = _round0(c["total_deliverable"] * c["cat_b_pct"] / 100)
+    c_tgt = c["total_deliverable"] - a_tgt - b_tgt
+    a_req = _gross_up(a_tgt, c["fail_a"])
+    b_req = _gross_up(b_tgt, c["fail_b"])
+    c_req = _gross_up(c_tgt, c["fail_c"])
+    total_required = a_req + b_req + c_req
+    r.update(cat_a_target=a_tgt, cat_b_target=b_tgt, cat_c_target=c_tgt,
+             cat_a_required=a_req, cat_b_required=b_req, cat_c_required=c_req,
+             total_required=total_required)
+
+    # 2. Time
+    r["total_time_a"] = a_req * c["time_a"]
+    r["total_time_b"] = b_req * c["time_b"]
+    r["total_time_c"] = c_req * c["time_c"]
+    r["total_annotation_time"] = r["total_time_a"] + r["total_time_b"] + r["total_time_c"]
+
+    # 3. People
+    funnel = funnel_arrays(c["target_workers"], c["retention_rate"], c["pass_rate"], c["invite_take_rate"])
+    r.update(funnel)
+    r["total_workers"] = c["cat_c_workers"] + c["cat_b_only_workers"]
+    workload = workload_arrays(a_req, b_req, c_req, c["time_a"], c["time_b"], c["time_c"],
+                               c["hours_per_worker_day"], c["cat_c_workers"], c["cat_b_only_workers"])
+    r.update(workload)
+    days_c_worker, days_b_worker = workload["days_c_worker"], workload["days_b_worker"]
+
+    # 4. QA
+    reviews_a = _ceil(a_req * c["review_rate_a"] / 100)
+    reviews_b = _ceil(b_req * c["review_rate_b"] / 100)
+    reviews_c = _ceil(c_req * c["review_rate_c"] / 100)
+    total_reviews = reviews_a + reviews_b + reviews_c
+    total_qa_time = total_reviews * c["qa_review_time"]
+    reviewer_minutes_per_day = c["num_reviewers"] * c["reviewer_hours_day"] * 60
+    qa_days = _ceil(total_qa_time / np.maximum(reviewer_minutes_per_day, 1))
+    reviews_per_day = total_reviews / np.maximum(qa_days, 1)
+    r.update(reviews_a=reviews_a, reviews_b=reviews_b, reviews_c=reviews_c,
+             total_reviews=total_reviews, total_qa_time=total_qa_time,
+             reviewer_minutes_per_day=reviewer_minutes_per_day, qa_days_available=qa_days,
+             reviews_per_day=reviews_per_day,
+             qa_hours_per_day=reviews_per_day * c["qa_review_time"] / 60)
+
+    # 5. Money — tech
+    num_evals = np.asarray(c["num_evals"], dtype=float)
+    num_evals = np.where(np.isnan(num_evals), total_required, num_evals).astype(np.int64)
+    p_in, p_out = c["llm_price_input"], c["llm_price_output"]
+    sub_in_nosec = total_required * c["tok_sub_in_nosec"]
+    sub_out_nosec = total_required * c["tok_sub_out_nosec"]
+    sub_in_sec = total_required * c["tok_sub_in_sec"]
+    sub_out_sec = total_required * c["tok_sub_out_sec"]
+    eval_in = num_evals * c["tok_eval_in"]
+    eval_out = num_evals * c["tok_eval_out"]
+    cost_sub_nosec = sub_in_nosec / 1_000_000 * p_in + sub_out_nosec / 1_000_000 * p_out
+    cost_sub_sec = sub_in_sec / 1_000_000 * p_in + sub_out_sec / 1_000_000 * p_out
+    cost_eval = eval_in / 1_000_000 * p_in + eval_out / 1_000_000 * p_out
+    total_llm_cost = cost_sub_sec + cost_eval
+    infra_cost = c["cost_filings"] + c["cost_auto_check"] + c["cost_database"]
+    tech_cost = infra_cost + total_llm_cost
+    r.update(num_evals=num_evals,
+             total_sub_in_nosec=sub_in_nosec, total_sub_out_nosec=sub_out_nosec, cost_sub_nosec=cost_sub_nosec,
+             total_sub_in_sec=sub_in_sec, total_sub_out_sec=sub_out_sec, cost_sub_sec=cost_sub_sec,
+             total_eval_in=eval_in, total_eval_out=eval_out, cost_eval=cost_eval,
+             total_llm_cost=total_llm_cost, infra_cost=infra_cost, tech_cost=tech_cost)
+
+    # 5. Money — labour
+    worker_cost = r["total_annotation_time"] / 60 * c["worker_hourly"]
+    qual_cost = r["workers_before_pass"] * c["qual_time"] / 60 * c["worker_hourly"]
+    reviewer_cost = total_qa_time / 60 * c["reviewer_hourly"]
+    r.update(worker_cost=worker_cost, qual_cost=qual_cost, reviewer_cost=reviewer_cost,
+             total_cost=worker_cost + qual_cost + reviewer_cost + tech_cost)
+
+    # 6. Timeline
+    days_data = _ceil(np.maximum(np.maximum(days_c_worker, days_b_worker), 1))
+    data_qa_parallel = np.maximum(days_data, qa_days)
+    sequential_days = (c["days_finding"] + c["days_testing"] + data_qa_parallel
+                       + c["days_meeting"] + c["days_compiling"] + c["days_buffer"])
+    r.update(days_data=days_data, data_qa_parallel=data_qa_parallel,
+             sequential_days=sequential_days, calendar_weeks=_ceil(sequential_days / 5))
+    return r
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# DATAFRAME API
+# ══════════════════════════════════════════════════════════════════════════════
+def normalize_inputs(df):
+    """Rename widget-key columns to field names and fill missing fields and blank cells with defaults.
+
+    A blank ``num_evals`` stays NaN ("one per required submission", like None).
+    """
+    df = df.rename(columns=WIDGET_KEYS)
+    missing = {name: getattr(_DEFAULTS, name) for name in INPUT_FIELDS if name not in df.columns}
+    if missing:
+        df = df.assign(**{k: (np.nan if v is None else v) for k, v in missing.items()})
+    # A blank CSV cell or a JSON Lines row without the key arrives as NaN
+    blank = [name for name in INPUT_FIELDS if name != "num_evals" and df[name].isna().any()]
+    if blank:
+        df = df.assign(**{name: _filled(df[name], getattr(_DEFAULTS, name)) for name in blank})
+    return df
+
+
+def _filled(column, default):
+    column = column.fillna(default)
+    # A blank turns an int column into floats; restore it once the gaps are filled
+    if isinstance(default, int) and (column % 1 == 0).all():
+        column = column.astype(np.int64)
+    return column
+
+
+def evaluate_batch(df):
+    """Evaluate every row of ``df`` as a plan; returns inputs plus derived columns.
+
+    Columns that are not plan inputs (e.g. a project id) are passed through.
+    """
+    df = normalize_inputs(df)
+    cols = {name: df[name].to_numpy() for name in INPUT_FIELDS}
+    derived = evaluate_arrays(cols)
+    return pd.concat([df.drop(columns="num_evals"), pd.DataFrame(derived, index=df.index)], axis=1)
+
+
+def product_grid(**values):
+    """Cartesian product of input values as a DataFrame, e.g. for sweeps.
+
+    ``product_grid(total_deliverable=[100, 500], fail_b=range(10, 40, 5))``
+    """
+    names = list(values)
+    return pd.DataFrame(list(itertools.product(*values.values())), columns=names)
@@ -0,0 +1,249 @@
+"""Benchmarks for the calculator and the page render.
+
+    python bench.py                                  # writes bench_results.json
+    python bench.py --quick -o new.json --compare bench_results.json
+
+Times the pure calculation chain, its exact reconciliation, the batch path, the
+Pareto frontier search, reading a progress log (whole, then 1,000 appended
+rows from a checkpoint), building each section table, the cold start of a fresh
+process (startup.py) and a full headless run of app.py through Streamlit's
+AppTest (cold and warm caches, full and on-demand detail tables, with the
+bytes sent to the browser), across input sizes. Results are written as JSON.
+The run fails if a startup timing is over its budget, or with --compare if
+any benchmark's median got slower than --threshold × the old one.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+
+import startup
+import tables
+from actuals import Checkpoint, ingest
+from batch import evaluate_batch
+from calculator import PlanInputs, calculate
+from pareto import frontier
+from reconcile import reconcile
+
+APP_PATH = Path(__file__).with_name("app.py")
+
+PLAN_SIZES = [100, 10_000, 1_000_000]  # total_deliverable
+SCENARIO_COUNTS = [1_000, 10_000, 100_000]  # rows per batch
+APP_SIZES = [100, 1_000_000]
+LOG_ROWS = [100_000, 500_000]  # progress log for actuals.py
+PARETO_WORKERS = [60, 200]  # frontier grid, with 20 reviewers
+RENDER_MODES = ["full", "lazy"]  # app.py ?render=
+
+
+def timed(fn, repeat, number=1):
+    """Median / min milliseconds per call over ``repeat`` rounds of ``number`` calls."""
+    rounds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        rounds.append((time.perf_counter() - start) / number * 1000)
+    return {"median_ms": statistics.median(rounds), "min_ms": min(rounds), "repeat": repeat, "number": number}
+
+
+def table_builders(plan):
+    i, r = plan.inputs, plan
+    return {
+        "volume_df": lambda: tables.volume_table(r.volume, i.total_deliverable, i.fail_a, i.fail_b, i.fail_c),
+        "time_df": lambda: tables.time_table(r.volume, r.time, i.time_a, i.time_b, i.time_c),
+        "workload_df": lambda: tables.workload_table(r.people, i.cat_c_workers, i.cat_b_only_workers),
+        "review_df": lambda: tables.review_table(r.volume, r.qa, i.review_rate_a, i.review_rate_b, i.review_rate_c),
+        "budget_df": lambda: tables.budget_table(r.time, r.people, r.qa, r.tech, r.money,
+                                                 i.qual_time, i.worker_hourly, i.reviewer_hourly),
+        "tech_df": lambda: tables.tech_table(r.volume, r.tech, i.cost_filings, i.cost_auto_check, i.cost_database),
+        "timeline_df": lambda: tables.timeline_table(r.timeline, r.qa.qa_days_available, i.days_finding,
+                                                     i.days_testing, i.days_meeting, i.days_compiling, i.days_buffer),
+        "qual_timeline_df": tables.qual_timeline_table,
+        "cost_summary_html": lambda: tables.cost_summary_html(r.money),
+    }
+
+
+def progress_log(rows):
+    """A synthetic progress log (CSV bytes) of ``rows`` events."""
+    events = ("accepted", "accepted", "rejected", "review")
+    lines = [f"2026-01-01T00:00:{k % 60:02d},{events[k % 4]},{'ABC'[k % 3]},{10 + k % 50}" for k in range(rows)]
+    return ("timestamp,event,category,minutes\n" + "\n".join(lines) + "\n").encode()
+
+
+@contextmanager
+def payload_meter():
+    """Counts the bytes of every message the script run queues for the browser."""
+    from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+
+    sent = [0]
+    enqueue = ForwardMsgQueue.enqueue
+
+    def counting(self, msg):
+        sent[0] += msg.ByteSize()
+        return enqueue(self, msg)
+
+    ForwardMsgQueue.enqueue = counting
+    try:
+        yield sent
+    finally:
+        ForwardMsgQueue.enqueue = enqueue
+
+
+def app_runs(total_deliverable, repeat, render="full"):
+    """Cold first render, then warm reruns after a widget change.
+
+    ``render`` is the app's ?render= mode: "full" builds every detail table,
+    "lazy" only those whose panel is open (none here). Each run also reports
+    the median bytes sent to the browser.
+    """
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    cold, cold_bytes = [], []
+    with payload_meter() as sent:
+        for _ in range(repeat):
+            st.cache_resource.clear()
+            st.cache_data.clear()
+            at = AppTest.from_file(str(APP_PATH), default_timeout=120)
+            at.query_params["render"] = render
+            at.session_state["vol_total"] = total_deliverable
+            sent[0] = 0
+            start = time.perf_counter()
+            at.run()
+            cold.append((time.perf_counter() - start) * 1000)
+            cold_bytes.append(sent[0])
+            if at.exception:
+                raise RuntimeError(at.exception[0].value)
+        warm, warm_bytes = [], []
+        for k in range(repeat):
+            at.number_input(key="tl_buf").set_value(k % 3 + 1)
+            sent[0] = 0
+            start = time.perf_counter()
+            at.run()
+            warm.append((time.perf_counter() - start) * 1000)
+            warm_bytes.append(sent[0])
+
+    def summary(xs, sizes):
+        return {"median_ms": statistics.median(xs), "min_ms": min(xs), "repeat": repeat, "number": 1,
+                "payload_bytes": int(statistics.median(sizes))}
+
+    return summary(cold, cold_bytes), summary(warm, warm_bytes)
+
+
+def run(quick=False):
+    reps = 3 if quick else 7
+    results = []
+
+    def record(name, params, stats):
+        results.append({"name": name, "params": params, **stats})
+        size = f"  {stats['payload_bytes']:>9,} B" if "payload_bytes" in stats else ""
+        print(f"{name:<24} {json.dumps(params):<52} {stats['median_ms']:>10.3f} ms{size}", file=sys.stderr)
+
+    for n in PLAN_SIZES:
+        inputs = PlanInputs(total_deliverable=n)
+        record("calculate", {"total_deliverable": n}, timed(lambda: calculate(inputs), reps, 1000))
+        plan = calculate(inputs)
+        record("reconcile", {"total_deliverable": n}, timed(lambda: reconcile(plan), reps, 100))
+        for table, build in table_builders(plan).items():
+            record(f"table.{table}", {"total_deliverable": n}, timed(build, reps, 100))
+
+    for rows in SCENARIO_COUNTS[:2] if quick else SCENARIO_COUNTS:
+        df = pd.DataFrame({"total_deliverable": range(100, 100 + rows), "fail_b": [i % 50 for i in range(rows)]})
+        record("evaluate_batch", {"rows": rows}, timed(lambda: evaluate_batch(df), reps))
+
+    for max_workers in PARETO_WORKERS:
+        record("pareto", {"max_workers": max_workers}, timed(lambda: frontier(PlanInputs(), max_workers, 20), reps))
+
+    for rows in LOG_ROWS[:1] if quick else LOG_ROWS:
+        log = progress_log(rows)
+        record("actuals.ingest", {"rows": rows}, timed(lambda: ingest(Checkpoint(), io.BytesIO(log)), reps))
+        checkpoint = ingest(Checkpoint(), io.BytesIO(log))
+        grown = log + progress_log(1_000)[log.index(b"\n") + 1:]  # 1,000 rows appended
+        record("actuals.ingest_append", {"rows": rows}, timed(lambda: ingest(checkpoint, io.BytesIO(grown)), reps))
+
+    for name, stats in startup.measure(3 if quick else 5).items():
+        record(f"startup.{name}", {}, stats)
+
+    for n in APP_SIZES:
+        for render in RENDER_MODES:
+            cold, warm = app_runs(n, 2 if quick else 5, render)
+            record("app.cold_run", {"total_deliverable": n, "render": render}, cold)
+            record("app.warm_rerun", {"total_deliverable": n, "render": render}, warm)
+    return results
+
+
+def over_budget(results):
+    """Benchmarks whose median is past their own budget (the startup ones)."""
+    return [f"{r['name']}: {r['median_ms']:.1f} > {r['budget_ms']} ms"
+            for r in results if "budget_ms" in r and r["median_ms"] > r["budget_ms"]]
+
+
+def _key(record):
+    return record["name"], json.dumps(record["params"], sort_keys=True)
+
+
+def compare(new, old, threshold):
+    """Names of benchmarks whose median grew past ``threshold`` × the old median."""
+    before = {_key(r): r["median_ms"] for r in old}
+    regressions = []
+    for r in new:
+        base = before.get(_key(r))
+        if base and r["median_ms"] > threshold * base:
+            regressions.append(f"{r['name']} {r['params']}: {base:.3f} → {r['median_ms']:.3f} ms")
+    return regressions
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=APP_PATH.parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the logistics calculator and page render.")
+    parser.add_argument("-o", "--output", default="bench_results.json", help="where to write results (JSON)")
+    parser.add_argument("--quick", action="store_true", help="fewer repeats and sizes")
+    parser.add_argument("--compare", help="previous results JSON to check for regressions")
+    parser.add_argument("--threshold", type=float, default=1.5, help="allowed slowdown factor (default: 1.5)")
+    args = parser.parse_args(argv)
+
+    # Keep the app's scenario store out of the working tree
+    os.environ.setdefault("LOGISTICS_SCENARIO_DB", str(Path(tempfile.mkdtemp()) / "scenarios.db"))
+    results = run(args.quick)
+    Path(args.output).write_text(json.dumps({
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }, indent=2))
+    print(f"Wrote {len(results)} benchmarks → {args.output}", file=sys.stderr)
+
+    failed = False
+    for line in over_budget(results):
+        print(f"OVER BUDGET {line}", file=sys.stderr)
+        failed = True
+    if args.compare:
+        regressions = compare(results, json.loads(Path(args.compare).read_text())["results"], args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        failed = failed or bool(regressions)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,443 @@
+"""Headless logistics calculator.
+
+The Volume → Time → People → QA → Money → Timeline chain from app.py as
+plain functions. ``calculate(PlanInputs(...))`` evaluates a whole plan
+without Streamlit; the app calls the same stage functions section by section.
+See math_explained.txt for the formulas.
+"""
+import math
+from dataclasses import asdict, dataclass, fields
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# INPUTS
+# ══════════════════════════════════════════════════════════════════════════════
+@dataclass(frozen=True)
+class PlanInputs:
+    """Every assumption in the app, defaulting to the widget defaults."""
+
+    # 1. Volume & Distribution
+    total_deliverable: int = 100
+    cat_a_pct: int = 30
+    cat_b_pct: int = 50
+    fail_a: float = 6
+    fail_b: float = 26
+    fail_c: float = 34
+    # 2. Time
+    time_a: float = 10
+    time_b: float = 35
+    time_c: float = 60
+    qual_time: float = 45
+    qa_review_time: float = 30
+    hours_per_worker_day: float = 2.0
+    # 3. People
+    target_workers: int = 12
+    cat_c_workers: int = 8
+    cat_b_only_workers: int = 4
+    retention_rate: float = 80
+    pass_rate: float = 40
+    invite_take_rate: float = 50
+    # 4. QA
+    num_reviewers: int = 1
+    reviewer_hours_day: float = 5.0
+    review_rate_a: float = 30
+    review_rate_b: float = 50
+    review_rate_c: float = 60
+    # 5. Money
+    worker_hourly: float = 20.0
+    reviewer_hourly: float = 50.0
+    cost_filings: float = 0.0
+    cost_auto_check: float = 20.0
+    cost_database: float = 30.0
+    llm_price_input: float = 2.0
+    llm_price_output: float = 12.0
+    tok_sub_in_nosec: int = 2000
+    tok_sub_out_nosec: int = 100
+    tok_sub_in_sec: int = 50000
+    tok_sub_out_sec: int = 100
+    num_evals: int | None = None  # None → one evaluation per required submission
+    tok_eval_in: int = 1000
+    tok_eval_out: int = 100
+    # 6. Timeline
+    days_meeting: int = 1
+    days_finding: int = 1
+    days_testing: int = 1
+    days_compiling: int = 1
+    days_buffer: int = 1
+
+    @classmethod
+    def from_widgets(cls, values):
+        """Build inputs from a mapping keyed by the app's widget keys."""
+        return cls(**{WIDGET_KEYS[k]: v for k, v in values.items() if k in WIDGET_KEYS})
+
+
+# Streamlit widget key → PlanInputs field
+WIDGET_KEYS = {
+    "vol_total": "total_deliverable",
+    "vol_a": "cat_a_pct",
+    "vol_b": "cat_b_pct",
+    "vol_fa": "fail_a",
+    "vol_fb": "fail_b",
+    "vol_fc": "fail_c",
+    "t_a": "time_a",
+    "t_b": "time_b",
+    "t_c": "time_c",
+    "t_qual": "qual_time",
+    "t_qa": "qa_review_time",
+    "t_hpd": "hours_per_worker_day",
+    "p_tw": "target_workers",
+    "p_cw": "cat_c_workers",
+    "p_bw": "cat_b_only_workers",
+    "p_ret": "retention_rate",
+    "p_pass": "pass_rate",
+    "p_inv": "invite_take_rate",
+    "qa_num_rev": "num_reviewers",
+    "qa_rev_hpd": "reviewer_hours_day",
+    "qa_rev_a": "review_rate_a",
+    "qa_rev_b": "review_rate_b",
+    "qa_rev_c": "review_rate_c",
+    "mo_wh": "worker_hourly",
+    "mo_rh": "reviewer_hourly",
+    "tc_filings": "cost_filings",
+    "tc_autocheck": "cost_auto_check",
+    "tc_db": "cost_database",
+    "tc_llm_pin": "llm_price_input",
+    "tc_llm_pout": "llm_price_output",
+    "tc_sub_in_nosec": "tok_sub_in_nosec",
+    "tc_sub_out_nosec": "tok_sub_out_nosec",
+    "tc_sub_in_sec": "tok_sub_in_sec",
+    "tc_sub_out_sec": "tok_sub_out_sec",
+    "tc_num_evals": "num_evals",
+    "tc_eval_in": "tok_eval_in",
+    "tc_eval_out": "tok_eval_out",
+    "tl_meet": "days_meeting",
+    "tl_find": "days_finding",
+    "tl_test": "days_testing",
+    "tl_comp": "days_compiling",
+    "tl_buf": "days_buffer",
+}
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# RESULTS (one dataclass per section)
+# ══════════════════════════════════════════════════════════════════════════════
+@dataclass(frozen=True)
+class Volume:
+    cat_c_pct: int
+    cat_a_target: int
+    cat_b_target: int
+    cat_c_target: int
+    cat_a_required: int
+    cat_b_required: int
+    cat_c_required: int
+    total_required: int
+
+
+@dataclass(frozen=True)
+class Time:
+    total_time_a: float
+    total_time_b: float
+    total_time_c: float
+    total_annotation_time: float
+
+
+@dataclass(frozen=True)
+class People:
+    workers_before_retention: int
+    workers_before_pass: int
+    workers_to_invite: int
+    total_workers: int
+    a_per_c: float
+    b_per_c: float
+    c_per_c: float
+    time_c_worker: float
+    days_c_worker: float
+    a_per_b: float
+    leftover_b: int
+    b_per_b: float
+    time_b_worker: float
+    days_b_worker: float
+    subs_per_day_c: float
+    subs_per_day_b: float
+    total_subs_day: float
+
+
+@dataclass(frozen=True)
+class QA:
+    reviews_a: int
+    reviews_b: int
+    reviews_c: int
+    total_reviews: int
+    total_qa_time: float
+    reviewer_minutes_per_day: float
+    qa_days_available: int
+    reviews_per_day: float
+    qa_hours_per_day: float
+
+
+@dataclass(frozen=True)
+class Tech:
+    num_evals: int
+    total_sub_in_nosec: int
+    total_sub_out_nosec: int
+    cost_sub_nosec: float
+    total_sub_in_sec: int
+    total_sub_out_sec: int
+    cost_sub_sec: float
+    total_eval_in: int
+    total_eval_out: int
+    cost_eval: float
+    total_llm_cost: float
+    infra_cost: float
+    tech_cost: float
+
+
+@dataclass(frozen=True)
+class Money:
+    worker_cost: float
+    qual_cost: float
+    reviewer_cost: float
+    tech_cost: float
+    total_cost: float
+
+
+@dataclass(frozen=True)
+class Timeline:
+    days_data: int
+    data_qa_parallel: int
+    sequential_days: int
+    calendar_weeks: int
+
+
+@dataclass(frozen=True)
+class PlanResults:
+    inputs: PlanInputs
+    volume: Volume
+    time: Time
+    people: People
+    qa: QA
+    tech: Tech
+    money: Money
+    timeline: Timeline
+
+    def to_dict(self):
+        """Flat ``{field: value}`` of every derived number (section fields are unique)."""
+        flat = {}
+        for f in fields(self):
+            if f.name != "inputs":
+                flat.update(asdict(getattr(self, f.name)))
+        return flat
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# STAGES
+# ══════════════════════════════════════════════════════════════════════════════
+def _gross_up(target, fail_pct):
+    return math.ceil(target / (1 - fail_pct / 100)) if fail_pct < 100 else target
+
+
+def calc_volume(total_deliverable, cat_a_pct, cat_b_pct, fail_a, fail_b, fail_c):
+    cat_a_target = round(total_deliverable * cat_a_pct / 100)
+    cat_b_target = round(total_deliverable * cat_b_pct / 100)
+    cat_c_target = total_deliverable - cat_a_target - cat_b_target
+
+    cat_a_required = _gross_up(cat_a_target, fail_a)
+    cat_b_required = _gross_up(cat_b_target, fail_b)
+    cat_c_required = _gross_up(cat_c_target, fail_c)
+    return Volume(
+        cat_c_pct=max(100 - cat_a_pct - cat_b_pct, 0),
+        cat_a_target=cat_a_target,
+        cat_b_target=cat_b_target,
+        cat_c_target=cat_c_target,
+        cat_a_required=cat_a_required,
+        cat_b_required=cat_b_required,
+        cat_c_required=cat_c_required,
+        total_required=cat_a_required + cat_b_required + cat_c_required,
+    )
+
+
+def calc_time(cat_a_required, cat_b_required, cat_c_required, time_a, time_b, time_c):
+    total_time_a = cat_a_required * time_a
+    total_time_b = cat_b_required * time_b
+    total_time_c = cat_c_required * time_c
+    return Time(
+        total_time_a=total_time_a,
+        total_time_b=total_time_b,
+        total_time_c=total_time_c,
+        total_annotation_time=total_time_a + total_time_b + total_time_c,
+    )
+
+
+def calc_people(cat_a_required, cat_b_required, cat_c_required,
+                time_a, time_b, time_c, hours_per_worker_day,
+                target_workers, cat_c_workers, cat_b_only_workers,
+                retention_rate, pass_rate, invite_take_rate):
+    # Recruitment funnel, working backwards from the target
+    workers_before_retention = math.ceil(target_workers / (retention_rate / 100))
+    workers_before_pass = math.ceil(workers_before_retention / (pass_rate / 100))
+    workers_to_invite = math.ceil(workers_before_pass / (invite_take_rate / 100))
+    total_workers = cat_c_workers + cat_b_only_workers
+
+    # Cat C-qualified workers handle A, B and C
+    if cat_c_workers > 0:
+        a_per_c = round(cat_a_required * (cat_c_workers / max(total_workers, 1)) / cat_c_workers, 1)
+        b_per_c = round(cat_b_required * (cat_c_workers / max(total_workers, 1)) / cat_c_workers, 1)
+        c_per_c = round(cat_c_required / max(cat_c_workers, 1), 1)
+        time_c_worker = a_per_c * time_a + b_per_c * time_b + c_per_c * time_c
+        days_c_worker = time_c_worker / (hours_per_worker_day * 60)
+    else:
+        a_per_c = b_per_c = c_per_c = time_c_worker = days_c_worker = 0
+
+    # Cat B-only workers handle A and the B left over after the C workers' share
+    if cat_b_only_workers > 0:
+        a_per_b = round(cat_a_required * (cat_b_only_workers / max(total_workers, 1)) / cat_b_only_workers, 1)
+        leftover_b = cat_b_required - round(cat_b_required * cat_c_workers / max(total_workers, 1))
+        b_per_b = round(leftover_b / cat_b_only_workers, 1)
+        time_b_worker = a_per_b * time_a + b_per_b * time_b
+        days_b_worker = time_b_worker / (hours_per_worker_day * 60)
+    else:
+        a_per_b = leftover_b = b_per_b = time_b_worker = days_b_worker = 0
+
+    subs_per_day_c = ((a_per_c + b_per_c + c_per_c) / max(days_c_worker, 0.01)) * cat_c_workers if cat_c_workers else 0
+    subs_per_day_b = ((a_per_b + b_per_b) / max(days_b_worker, 0.01)) * cat_b_only_workers if cat_b_only_workers else 0
+    return People(
+        workers_before_retention=workers_before_retention,
+        workers_before_pass=workers_before_pass,
+        workers_to_invite=workers_to_invite,
+        total_workers=total_workers,
+        a_per_c=a_per_c,
+        b_per_c=b_per_c,
+        c_per_c=c_per_c,
+        time_c_worker=time_c_worker,
+        days_c_worker=days_c_worker,
+        a_per_b=a_per_b,
+        leftover_b=leftover_b,
+        b_per_b=b_per_b,
+        time_b_worker=time_b_worker,
+        days_b_worker=days_b_worker,
+        subs_per_day_c=subs_per_day_c,
+        subs_per_day_b=subs_per_day_b,
+        total_subs_day=subs_per_day_c + subs_per_day_b,
+    )
+
+
+def calc_qa(cat_a_required, cat_b_required, cat_c_required, qa_review_time,
+            num_reviewers, reviewer_hours_day, review_rate_a, review_rate_b, review_rate_c):
+    reviews_a = math.ceil(cat_a_required * review_rate_a / 100)
+    reviews_b = math.ceil(cat_b_required * review_rate_b / 100)
+    reviews_c = math.ceil(cat_c_required * review_rate_c / 100)
+    total_reviews = reviews_a + reviews_b + reviews_c
+
+    total_qa_time = total_reviews * qa_review_time
+    reviewer_minutes_per_day = num_reviewers * reviewer_hours_day * 60
+    qa_days_available = math.ceil(total_qa_time / max(reviewer_minutes_per_day, 1))
+    reviews_per_day = total_reviews / max(qa_days_available, 1)
+    return QA(
+        reviews_a=reviews_a,
+        reviews_b=reviews_b,
+        reviews_c=reviews_c,
+        total_reviews=total_reviews,
+        total_qa_time=total_qa_time,
+        reviewer_minutes_per_day=reviewer_minutes_per_day,
+        qa_days_available=qa_days_available,
+        reviews_per_day=reviews_per_day,
+        qa_hours_per_day=reviews_per_day * qa_review_time / 60,
+    )
+
+
+def calc_tech(total_required, num_evals, cost_filings, cost_auto_check, cost_database,
+              llm_price_input, llm_price_output,
+              tok_sub_in_nosec, tok_sub_out_nosec, tok_sub_in_sec, tok_sub_out_sec,
+              tok_eval_in, tok_eval_out):
+    if num_evals is None:
+        num_evals = total_required
+
+    # Submissions — without SEC
+    total_sub_in_nosec = total_required * tok_sub_in_nosec
+    total_sub_out_nosec = total_required * tok_sub_out_nosec
+    cost_sub_nosec = (total_sub_in_nosec / 1_000_000 * llm_price_input
+                      + total_sub_out_nosec / 1_000_000 * llm_price_output)
+
+    # Submissions — with SEC
+    total_sub_in_sec = total_required * tok_sub_in_sec
+    total_sub_out_sec = total_required * tok_sub_out_sec
+    cost_sub_sec = (total_sub_in_sec / 1_000_000 * llm_price_input
+                    + total_sub_out_sec / 1_000_000 * llm_price_output)
+
+    # Evaluations
+    total_eval_in = num_evals * tok_eval_in
+    total_eval_out = num_evals * tok_eval_out
+    cost_eval = (total_eval_in / 1_000_000 * llm_price_input
+                 + total_eval_out / 1_000_000 * llm_price_output)
+
+    total_llm_cost = cost_sub_sec + cost_eval  # conservative: use "with SEC" variant
+    infra_cost = cost_filings + cost_auto_check + cost_database
+    return Tech(
+        num_evals=num_evals,
+        total_sub_in_nosec=total_sub_in_nosec,
+        total_sub_out_nosec=total_sub_out_nosec,
+        cost_sub_nosec=cost_sub_nosec,
+        total_sub_in_sec=total_sub_in_sec,
+        total_sub_out_sec=total_sub_out_sec,
+        cost_sub_sec=cost_sub_sec,
+        total_eval_in=total_eval_in,
+        total_eval_out=total_eval_out,
+        cost_eval=cost_eval,
+        total_llm_cost=total_llm_cost,
+        infra_cost=infra_cost,
+        tech_cost=infra_cost + total_llm_cost,
+    )
+
+
+def calc_money(total_annotation_time, workers_before_pass, qual_time, total_qa_time,
+               worker_hourly, reviewer_hourly, tech_cost):
+    worker_cost = total_annotation_time / 60 * worker_hourly
+    qual_cost = workers_before_pass * qual_time / 60 * worker_hourly
+    reviewer_cost = total_qa_time / 60 * reviewer_hourly
+    return Money(
+        worker_cost=worker_cost,
+        qual_cost=qual_cost,
+        reviewer_cost=reviewer_cost,
+        tech_cost=tech_cost,
+        total_cost=worker_cost + qual_cost + reviewer_cost + tech_cost,
+    )
+
+
+def calc_timeline(days_c_worker, days_b_worker, qa_days_available,
+                  days_meeting, days_finding, days_testing, days_compiling, days_buffer):
+    days_data = math.ceil(max(days_c_worker, days_b_worker, 1))
+    # QA runs in parallel with data creation, so take the max of the two
+    data_qa_parallel = max(days_data, qa_days_available)
+    sequential_days = days_finding + days_testing + data_qa_parallel + days_meeting + days_compiling + days_buffer
+    return Timeline(
+        days_data=days_data,
+        data_qa_parallel=data_qa_parallel,
+        sequential_days=sequential_days,
+        calendar_weeks=math.ceil(sequential_days / 5),
+    )
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# FULL CHAIN
+# ══════════════════════════════════════════════════════════════════════════════
+def calculate(inputs=PlanInputs()):
+    """Evaluate one plan end to end."""
+    i = inputs
+    volume = calc_volume(i.total_deliverable, i.cat_a_pct, i.cat_b_pct, i.fail_a, i.fail_b, i.fail_c)
+    time = calc_time(volume.cat_a_required, volume.cat_b_required, volume.cat_c_required,
+                     i.time_a, i.time_b, i.time_c)
+    people = calc_people(volume.cat_a_required, volume.cat_b_required, volume.cat_c_required,
+                         i.time_a, i.time_b, i.time_c, i.hours_per_worker_day,
+                         i.target_workers, i.cat_c_workers, i.cat_b_only_workers,
+                         i.retention_rate, i.pass_rate, i.invite_take_rate)
+    qa = calc_qa(volume.cat_a_required, volume.cat_b_required, volume.cat_c_required, i.qa_review_time,
+                 i.num_reviewers, i.reviewer_hours_day, i.review_rate_a, i.review_rate_b, i.review_rate_c)
+    tech = calc_tech(volume.total_required, i.num_evals, i.cost_filings, i.cost_auto_check, i.cost_database,
+                     i.llm_price_input, i.llm_price_output,
+                     i.tok_sub_in_nosec, i.tok_sub_out_nosec, i.tok_sub_in_sec, i.tok_sub_out_sec,
+                     i.tok_eval_in, i.tok_eval_out)
+    money = calc_money(time.total_annotation_time, people.workers_before_pass, i.qual_time, qa.total_qa_time,
+                       i.worker_hourly, i.reviewer_hourly, tech.tech_cost)
+    timeline = calc_timeline(people.days_c_worker, people.days_b_worker, qa.qa_days_available,
+                             i.days_meeting, i.days_finding, i.days_testing, i.days_compiling, i.days_buffer)
+    return PlanResults(inputs, volume, time, people, qa, tech, money, timeline)
@@ -0,0 +1,248 @@
+"""Plans with any number of task categories.
+
+Sections 1–7 of the app model exactly three categories (A/B/C). Here the
+categories are rows of a table — name, mix %, failure rate, minutes per
+submission, review rate and the qualification tier a worker needs — and the
+workforce is a set of tiers: a worker of tier t can take every category of
+tier ≤ t. The A/B/C plan is tier 1 = B-only workers (A and B) and tier 2 =
+Cat C-qualified workers (A, B and C).
+
+Volume, time, QA and workload are array operations over the category columns
+(and a categories × tiers matrix for the workload split), so fifteen
+categories cost the same handful of NumPy passes as three.
+
+Each category's submissions are split across the tiers qualified for it in
+proportion to their head-count. The People section instead gives the Cat C
+workers their (rounded) share of Cat B first and the remainder to B-only
+workers, so for the A/B/C table the B-only Cat B load can differ from it by a
+rounding step.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from batch import _ceil, _gross_up, _round0, _round1, funnel_arrays
+from calculator import PlanInputs, calc_money, calc_tech, calc_timeline
+
+
+@dataclass(frozen=True)
+class Category:
+    name: str
+    mix_pct: float
+    fail_pct: float
+    minutes: float  # per submission
+    review_pct: float
+    tier: int = 1  # lowest worker tier qualified for it
+
+    def __post_init__(self):
+        if not str(self.name).strip():
+            raise ValueError("Category name must not be empty")
+        if self.mix_pct < 0 or self.minutes < 0:
+            raise ValueError(f"{self.name}: mix % and minutes must be >= 0")
+        if not 0 <= self.fail_pct <= 100 or not 0 <= self.review_pct <= 100:
+            raise ValueError(f"{self.name}: failure and review rates must be between 0 and 100")
+        if self.tier < 1 or int(self.tier) != self.tier:
+            raise ValueError(f"{self.name}: tier must be a whole number >= 1, got {self.tier}")
+
+
+def abc_categories(inputs=PlanInputs()):
+    """The app's three categories and two worker tiers as a category table."""
+    i = inputs
+    categories = (
+        Category("A", i.cat_a_pct, i.fail_a, i.time_a, i.review_rate_a, 1),
+        Category("B", i.cat_b_pct, i.fail_b, i.time_b, i.review_rate_b, 1),
+        Category("C", max(100 - i.cat_a_pct - i.cat_b_pct, 0), i.fail_c, i.time_c, i.review_rate_c, 2),
+    )
+    tiers = ((1, i.cat_b_only_workers), (2, i.cat_c_workers))
+    return categories, tiers
+
+
+CATEGORY_COLUMNS = ["Category", "Mix %", "Failure %", "Minutes", "Review %", "Tier"]
+
+
+def categories_from_frame(df):
+    """Categories from a DataFrame with the CATEGORY_COLUMNS (blank rows skipped).
+
+    Raises ValueError for invalid rows, including a fractional tier or a mix over 100%.
+    """
+    df = df.dropna(subset=["Category"])
+    df = df[df["Category"].astype(str).str.strip() != ""]
+    df = df.fillna({"Mix %": 0, "Failure %": 0, "Minutes": 0, "Review %": 0, "Tier": 1})
+    names = df["Category"].astype(str).str.strip()
+    if names.duplicated().any():
+        raise ValueError(f"Duplicate category names: {', '.join(sorted(set(names[names.duplicated()])))}")
+    for name, tier in zip(names, df["Tier"].astype(float)):
+        if not tier.is_integer():
+            raise ValueError(f"{name}: tier must be a whole number >= 1, got {tier:g}")
+    mix_total = float(df["Mix %"].astype(float).sum())
+    if mix_total > 100:
+        raise ValueError(f"Category mix adds up to {mix_total:g}% — it must not exceed 100%")
+    return tuple(
+        Category(name, float(row["Mix %"]), float(row["Failure %"]), float(row["Minutes"]),
+                 float(row["Review %"]), int(row["Tier"]))
+        for name, (_, row) in zip(names, df.iterrows())
+    )
+
+
+def tiers_from_frame(df):
+    """(tier, workers) pairs from a DataFrame with Tier and Workers columns (incomplete rows skipped).
+
+    Raises ValueError unless tiers are whole numbers >= 1 and worker counts whole numbers >= 0.
+    """
+    tiers = []
+    for tier, workers in df[["Tier", "Workers"]].dropna().astype(float).itertuples(index=False):
+        if not tier.is_integer() or tier < 1:
+            raise ValueError(f"Worker tier must be a whole number >= 1, got {tier:g}")
+        if not workers.is_integer() or workers < 0:
+            raise ValueError(f"Tier {tier:g}: workers must be a whole number >= 0, got {workers:g}")
+        tiers.append((int(tier), int(workers)))
+    return tuple(tiers)
+
+
+def category_frame(categories):
+    return pd.DataFrame([(c.name, c.mix_pct, c.fail_pct, c.minutes, c.review_pct, c.tier) for c in categories],
+                        columns=CATEGORY_COLUMNS)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# ARRAY CORE
+# ══════════════════════════════════════════════════════════════════════════════
+def category_arrays(total_deliverable, mix_pct, fail_pct, minutes, review_pct):
+    """Volume, time and review counts per category (Sections 1, 2 and 4)."""
+    # Every category but the last is rounded; the last takes the remainder
+    target = _round0(total_deliverable * mix_pct / 100)
+    if len(target):
+        target[-1] = total_deliverable - target[:-1].sum()
+    required = _gross_up(target, fail_pct)
+    return {
+        "target": target,
+        "required": required,
+        "total_time": required * minutes,
+        "reviews": _ceil(required * review_pct / 100),
+    }
+
+
+def workload_arrays(required, minutes, cat_tier, tier_levels, tier_workers, hours_per_worker_day):
+    """Per-worker load of each tier (Section 3), split by head-count.
+
+    Returns ``per_worker`` (categories × tiers, submissions per worker),
+    per-tier ``minutes`` / ``days`` / ``subs_per_day`` and ``unassigned``
+    (submissions of categories no tier with workers is qualified for).
+    """
+    qualified = (tier_levels[None, :] >= cat_tier[:, None]) & (tier_workers[None, :] > 0)
+    pool = (qualified * tier_workers[None, :]).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        share = np.where(qualified, required[:, None] / pool[:, None], 0.0)  # per worker, unrounded
+    per_worker = _round1(share)
+
+    tier_minutes = (per_worker * minutes[:, None]).sum(axis=0)
+    tier_days = tier_minutes / (hours_per_worker_day * 60)
+    subs = per_worker.sum(axis=0)
+    subs_per_day = np.where(tier_workers > 0, subs / np.maximum(tier_days, 0.01) * tier_workers, 0.0)
+    return {
+        "per_worker": per_worker,
+        "minutes": tier_minutes,
+        "days": tier_days,
+        "subs_per_day": subs_per_day,
+        "unassigned": np.where(pool > 0, 0, required),
+    }
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# FULL PLAN
+# ══════════════════════════════════════════════════════════════════════════════
+@dataclass(frozen=True)
+class CategoryPlan:
+    categories: pd.DataFrame  # one row per category
+    workload: pd.DataFrame  # one row per worker tier
+    total_required: int
+    total_annotation_time: float
+    total_reviews: int
+    total_qa_time: float
+    qa_days_available: int
+    workers_to_invite: int
+    unassigned: tuple  # names of categories no staffed tier can take
+    tech: object  # calculator.Tech
+    money: object  # calculator.Money
+    timeline: object  # calculator.Timeline
+
+
+def plan_categories(inputs, categories, tiers):
+    """Evaluate ``categories`` (Category rows) staffed by ``tiers`` ((tier, workers) pairs).
+
+    Everything that isn't per category — hours per day, reviewers, the
+    recruitment funnel, rates, tech costs and the timeline phases — comes
+    from ``inputs``.
+    """
+    i = inputs
+    cols = {
+        "mix": np.array([c.mix_pct for c in categories], dtype=float),
+        "fail": np.array([c.fail_pct for c in categories], dtype=float),
+        "minutes": np.array([c.minutes for c in categories], dtype=float),
+        "review": np.array([c.review_pct for c in categories], dtype=float),
+        "tier": np.array([c.tier for c in categories], dtype=np.int64),
+    }
+    tiers = sorted(tiers)
+    tier_levels = np.array([t for t, _ in tiers], dtype=np.int64)
+    tier_workers = np.array([w for _, w in tiers], dtype=np.int64)
+
+    v = category_arrays(i.total_deliverable, cols["mix"], cols["fail"], cols["minutes"], cols["review"])
+    w = workload_arrays(v["required"], cols["minutes"], cols["tier"], tier_levels, tier_workers,
+                        i.hours_per_worker_day)
+
+    total_required = int(v["required"].sum())
+    total_annotation_time = float(v["total_time"].sum())
+    total_reviews = int(v["reviews"].sum())
+    total_qa_time = total_reviews * i.qa_review_time
+    qa_days_available = int(np.ceil(total_qa_time / max(i.num_reviewers * i.reviewer_hours_day * 60, 1)))
+    funnel = funnel_arrays(np.array([i.target_workers]), np.array([i.retention_rate]),
+                           np.array([i.pass_rate]), np.array([i.invite_take_rate]))
+
+    tech = calc_tech(total_required, i.num_evals, i.cost_filings, i.cost_auto_check, i.cost_database,
+                     i.llm_price_input, i.llm_price_output,
+                     i.tok_sub_in_nosec, i.tok_sub_out_nosec, i.tok_sub_in_sec, i.tok_sub_out_sec,
+                     i.tok_eval_in, i.tok_eval_out)
+    money = calc_money(total_annotation_time, int(funnel["workers_before_pass"][0]), i.qual_time, total_qa_time,
+                       i.worker_hourly, i.reviewer_hourly, tech.tech_cost)
+    # The slowest tier sets the data-creation length
+    timeline = calc_timeline(float(w["days"].max(initial=0)), 0, qa_days_available,
+                             i.days_meeting, i.days_finding, i.days_testing, i.days_compiling, i.days_buffer)
+
+    names = [c.name for c in categories]
+    category_df = pd.DataFrame({
+        "Category": names,
+        "Tier": cols["tier"],
+        "Mix %": cols["mix"],
+        "Target": v["target"],
+        "Failure %": cols["fail"],
+        "Required": v["required"],
+        "Buffer": v["required"] - v["target"],
+        "Min / Sub": cols["minutes"],
+        "Total Min": v["total_time"],
+        "Hours": np.round(v["total_time"] / 60, 1),
+        "Review %": cols["review"],
+        "Reviews": v["reviews"],
+    })
+    workload_df = pd.DataFrame({
+        "Tier": tier_levels,
+        "Workers": tier_workers,
+        **{f"{name} / Worker": w["per_worker"][k] for k, name in enumerate(names)},
+        "Min / Worker": np.round(w["minutes"], 1),
+        "Days / Worker": np.round(w["days"], 1),
+        "Subs / Day (tier)": np.round(w["subs_per_day"], 1),
+    })
+    return CategoryPlan(
+        categories=category_df,
+        workload=workload_df,
+        total_required=total_required,
+        total_annotation_time=total_annotation_time,
+        total_reviews=total_reviews,
+        total_qa_time=total_qa_time,
+        qa_days_available=qa_days_available,
+        workers_to_invite=int(funnel["workers_to_invite"][0]),
+        unassigned=tuple(n for n, u in zip(names, w["unassigned"]) if u > 0),
+        tech=tech,
+        money=money,
+        timeline=timeline,
+    )
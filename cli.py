@@ -0,0 +1,147 @@
+"""Price plans from a CSV or JSON Lines file without a Streamlit server.
+
+    python cli.py plans.csv -o results.csv
+    python cli.py plans.jsonl -o results.parquet --chunksize 50000 --workers 4
+
+Each input row is one assumption set keyed like the app's widgets (vol_total,
+t_a, p_ret, qa_rev_c, mo_wh, tc_llm_pin, ...) or like the PlanInputs fields;
+missing keys and blank cells take the widget defaults and any other columns
+(e.g. a project id) are copied through. The file is streamed in chunks, so
+memory stays flat no matter how large it is. Parquet output needs pyarrow.
+"""
+import argparse
+import csv
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from batch import evaluate_batch
+
+
+def read_chunks(path, chunksize):
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        return pd.read_csv(path, chunksize=chunksize)
+    if suffix in (".jsonl", ".ndjson", ".json"):
+        return pd.read_json(path, lines=True, chunksize=chunksize)
+    raise ValueError(f"Unsupported input {path!r}: expected .csv or .jsonl")
+
+
+# Sinks split output into encode() — run next to the calculation, in the worker
+# process when --workers > 1 — and write(), which appends in the main process.
+def _encode_csv(df):
+    # Float formatting dominates CSV output, so it belongs with the parallel work
+    return list(df.columns), df.to_csv(index=False, header=False)
+
+
+def _encode_frame(df):
+    return df
+
+
+class CsvSink:
+    encode = staticmethod(_encode_csv)
+
+    def __init__(self, path):
+        self.file = open(path, "w", newline="")
+        self.header = True
+
+    def write(self, encoded):
+        columns, body = encoded
+        if self.header:
+            csv.writer(self.file, lineterminator="\n").writerow(columns)
+            self.header = False
+        self.file.write(body)
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetSink:
+    encode = staticmethod(_encode_frame)
+
+    def __init__(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("Parquet output needs pyarrow: pip install pyarrow") from None
+        self.pa, self.pq = pa, pq
+        self.path = path
+        self.writer = None
+
+    def write(self, df):
+        if self.writer is None:
+            table = self.pa.Table.from_pandas(df, preserve_index=False)
+            self.writer = self.pq.ParquetWriter(self.path, table.schema)
+        else:
+            # Later chunks may infer e.g. int vs float differently; follow the first chunk
+            table = self.pa.Table.from_pandas(df, schema=self.writer.schema, preserve_index=False)
+        self.writer.write_table(table)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def open_sink(path):
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        return CsvSink(path)
+    if suffix == ".parquet":
+        return ParquetSink(path)
+    raise ValueError(f"Unsupported output {path!r}: expected .csv or .parquet")
+
+
+def run(input_path, output_path, chunksize=10_000, workers=1):
+    """Stream ``input_path`` through the calculator into ``output_path``; returns rows written."""
+    sink = open_sink(output_path)
+    rows = 0
+    try:
+        chunks = read_chunks(input_path, chunksize)
+        if workers <= 1:
+            results = (price_chunk(chunk, sink.encode) for chunk in chunks)
+        else:
+            results = _parallel(chunks, sink.encode, workers)
+        for n, encoded in results:
+            sink.write(encoded)
+            rows += n
+    finally:
+        sink.close()
+    return rows
+
+
+def price_chunk(chunk, encode):
+    return len(chunk), encode(evaluate_batch(chunk))
+
+
+def _parallel(chunks, encode, workers):
+    # Keep at most 2 chunks per worker in flight and yield in input order
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(price_chunk, chunk, encode))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Price logistics plans from a CSV / JSON Lines file.")
+    parser.add_argument("input", help="plans as .csv or .jsonl, one assumption set per row")
+    parser.add_argument("-o", "--output", required=True, help="results as .csv or .parquet")
+    parser.add_argument("--chunksize", type=int, default=10_000, help="rows per chunk (default: 10000)")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (default: 1)")
+    args = parser.parse_args(argv)
+    try:
+        rows = run(args.input, args.output, args.chunksize, args.workers)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"Priced {rows:,} plans → {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
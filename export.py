@@ -0,0 +1,120 @@
+"""Every section table of one or more plans as an Excel workbook or a Parquet bundle.
+
+    from export import export_tables, evaluate_plans, to_excel
+    data = to_excel(export_tables(evaluate_plans({"Base": PlanInputs(), "Big": PlanInputs(total_deliverable=5000)})))
+
+Each sheet (or Parquet file) stacks one table for all plans, with a Scenario
+column first: the app's section tables as displayed (tables.py), plus
+Summary, Inputs and Results sheets with the plain numbers. Plans are
+evaluated with calculator.calculate, so a batch of scenarios is exported
+without rerunning the page for each. Files are built in memory.
+Excel needs openpyxl (or XlsxWriter); Parquet needs pyarrow.
+"""
+import importlib.util
+import io
+import zipfile
+from dataclasses import asdict
+
+import numpy as np
+import pandas as pd
+
+import tables
+from calculator import calculate
+
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+ZIP_MIME = "application/zip"
+
+
+def excel_engine():
+    """The installed pandas Excel writer, or None (found without importing it)."""
+    for module in ("openpyxl", "xlsxwriter"):
+        if importlib.util.find_spec(module) is not None:
+            return module
+    return None
+
+
+def evaluate_plans(named_inputs):
+    """{name: PlanResults} for {name: PlanInputs}."""
+    return {name: calculate(inputs) for name, inputs in named_inputs.items()}
+
+
+def summary_row(plan):
+    r = plan
+    return {
+        "Total Budget ($)": r.money.total_cost,
+        "Submissions Required": r.volume.total_required,
+        "Duration (days)": r.timeline.sequential_days,
+        "Calendar Weeks": r.timeline.calendar_weeks,
+        "Invitations Needed": r.people.workers_to_invite,
+        "Annotation Hours": r.time.total_annotation_time / 60,
+        "Worker Annotation ($)": r.money.worker_cost,
+        "Qualification Testing ($)": r.money.qual_cost,
+        "Expert Review ($)": r.money.reviewer_cost,
+        "Tech / Infrastructure ($)": r.money.tech_cost,
+    }
+
+
+def section_tables(plan):
+    """The app's section tables for one plan, by sheet name."""
+    i, r = plan.inputs, plan
+    return {
+        "Volume": tables.volume_table(r.volume, i.total_deliverable, i.fail_a, i.fail_b, i.fail_c),
+        "Time": tables.time_table(r.volume, r.time, i.time_a, i.time_b, i.time_c),
+        "Workload": tables.workload_table(r.people, i.cat_c_workers, i.cat_b_only_workers),
+        "Reviews": tables.review_table(r.volume, r.qa, i.review_rate_a, i.review_rate_b, i.review_rate_c),
+        "Budget": tables.budget_table(r.time, r.people, r.qa, r.tech, r.money,
+                                      i.qual_time, i.worker_hourly, i.reviewer_hourly),
+        "Tech": tables.tech_table(r.volume, r.tech, i.cost_filings, i.cost_auto_check, i.cost_database),
+        "Timeline": tables.timeline_table(r.timeline, r.qa.qa_days_available, i.days_finding,
+                                          i.days_testing, i.days_meeting, i.days_compiling, i.days_buffer),
+        "Qualification": tables.qual_timeline_table(),
+    }
+
+
+def export_tables(plans):
+    """{sheet: DataFrame} for {name: PlanResults}, every table stacked with a Scenario column."""
+    names = list(plans)
+    sheets = {
+        "Summary": pd.DataFrame([summary_row(p) for p in plans.values()]),
+        "Inputs": pd.DataFrame([asdict(p.inputs) for p in plans.values()]),
+        "Results": pd.DataFrame([p.to_dict() for p in plans.values()]),
+    }
+    for sheet in sheets.values():
+        sheet.insert(0, "Scenario", names)
+    per_plan = [section_tables(p) for p in plans.values()]
+    for sheet in per_plan[0] if per_plan else ():
+        frames = [t[sheet] for t in per_plan]
+        stacked = pd.concat(frames, ignore_index=True)
+        stacked.insert(0, "Scenario", np.repeat(names, [len(f) for f in frames]))
+        sheets[sheet] = stacked
+    return sheets
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# FILE FORMATS (in memory)
+# ══════════════════════════════════════════════════════════════════════════════
+def to_excel(sheets):
+    """One worksheet per table, as .xlsx bytes."""
+    engine = excel_engine()
+    if engine is None:
+        raise RuntimeError("Excel export needs openpyxl: pip install openpyxl")
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine=engine) as writer:
+        for name, df in sheets.items():
+            df.to_excel(writer, sheet_name=name[:31], index=False)
+    return buffer.getvalue()
+
+
+def _arrow_safe(df):
+    # Display tables mix numbers and "—" in one column; Parquet needs one type per column
+    mixed = [c for c in df.columns if df[c].dtype == object and df[c].map(type).nunique() > 1]
+    return df.astype({c: str for c in mixed}) if mixed else df
+
+
+def to_parquet_zip(sheets):
+    """One <table>.parquet per table in a .zip, as bytes."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as bundle:  # Parquet is compressed already
+        for name, df in sheets.items():
+            bundle.writestr(f"{name.lower()}.parquet", _arrow_safe(df).to_parquet(index=False))
+    return buffer.getvalue()
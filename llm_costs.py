@@ -0,0 +1,173 @@
+"""LLM token costs per call type, with prompt caching and batch pricing.
+
+calc_tech prices every submission as total_required × tok_sub_in_sec at one
+input/output price pair. Here each call type (SEC submissions, evaluations)
+has its own model and can use:
+
+  * prompt caching — the shared prefix of a call (the SEC filing context) is
+    written to the cache once per filing at ``cache_write`` × the input price
+    and read back by the other questions on that filing at ``cache_read`` ×;
+    ``cache_hit_pct`` of those repeat calls land within the cache lifetime,
+    the rest write it again;
+  * the batch API — ``batch_discount`` % off every token of the call type.
+
+All options of a call type (model × cache × batch) are priced in one pass of
+array math, so the cheapest setup can be listed next to the chosen one.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+APP_MODEL = "App prices"  # the Money section's input / output price pair
+
+
+@dataclass(frozen=True)
+class ModelPrice:
+    name: str
+    input: float  # $ per 1M uncached input tokens
+    output: float  # $ per 1M output tokens
+
+
+@dataclass(frozen=True)
+class CachePricing:
+    """Provider-wide multipliers on the input price, and the batch discount."""
+
+    cache_read: float = 0.1
+    cache_write: float = 1.25
+    batch_discount: float = 50  # %
+
+
+@dataclass(frozen=True)
+class CallType:
+    name: str
+    calls: int
+    shared_tokens: int  # identical prefix reused across calls, e.g. the SEC filing
+    unique_tokens: int  # per-call input on top of the shared prefix
+    output_tokens: int
+    calls_per_context: float = 1  # calls sharing one prefix, e.g. questions per filing
+    cache_hit_pct: float = 100  # repeat calls that find the prefix still cached
+    model: str = APP_MODEL
+    cached: bool = False
+    batched: bool = False
+
+
+def default_calls(inputs, total_required, num_evals, questions_per_filing=1, cache_hit_pct=100,
+                  eval_shared_tokens=0):
+    """The two call types the Money section prices, split into shared / unique input.
+
+    The SEC context is the difference between the with- and without-SEC input
+    tokens per question; the rest of the prompt is the question itself.
+    """
+    i = inputs
+    shared_eval = min(eval_shared_tokens, i.tok_eval_in)
+    return (
+        CallType("Submissions (with SEC)", total_required,
+                 max(i.tok_sub_in_sec - i.tok_sub_in_nosec, 0), min(i.tok_sub_in_nosec, i.tok_sub_in_sec),
+                 i.tok_sub_out_sec, questions_per_filing, cache_hit_pct),
+        CallType("Evaluations", num_evals, shared_eval, i.tok_eval_in - shared_eval,
+                 i.tok_eval_out, max(num_evals, 1) if shared_eval else 1, cache_hit_pct),
+    )
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# ARRAY CORE
+# ══════════════════════════════════════════════════════════════════════════════
+def cost_arrays(calls, shared, unique, output, per_context, hit_pct,
+                price_in, price_out, cached, batched, pricing):
+    """Token counts and $ for arrays of (call type, model, cache, batch) options."""
+    calls = np.asarray(calls, dtype=float)
+    contexts = np.minimum(np.ceil(calls / np.maximum(per_context, 1)), calls)
+    repeats = calls - contexts
+    hits = np.where(cached, np.floor(repeats * hit_pct / 100), 0)
+    writes = np.where(cached & (shared > 0), calls - hits, 0)
+
+    cached_tokens = hits * shared
+    write_tokens = writes * shared
+    uncached_tokens = calls * (shared + unique) - cached_tokens - write_tokens
+    output_tokens = calls * output
+
+    gross = (uncached_tokens * price_in
+             + cached_tokens * price_in * pricing.cache_read
+             + write_tokens * price_in * pricing.cache_write
+             + output_tokens * price_out) / 1_000_000
+    cost = np.where(batched, gross * (1 - pricing.batch_discount / 100), gross)
+    return {
+        "uncached_tokens": uncached_tokens,
+        "cache_write_tokens": write_tokens,
+        "cached_tokens": cached_tokens,
+        "output_tokens": output_tokens,
+        "cost": cost,
+    }
+
+
+def naive_cost(call, price_in, price_out):
+    """calc_tech's figure: every input token at the full price, no batch."""
+    return (call.calls * (call.shared_tokens + call.unique_tokens) * price_in
+            + call.calls * call.output_tokens * price_out) / 1_000_000
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# PLANS
+# ══════════════════════════════════════════════════════════════════════════════
+def _prices(models, price_in, price_out):
+    table = {APP_MODEL: ModelPrice(APP_MODEL, price_in, price_out)}
+    table.update({m.name: m for m in models if m.name != APP_MODEL})
+    return table
+
+
+def plan_llm(calls, models, price_in, price_out, pricing=CachePricing()):
+    """One row per call type: tokens by billing class, naive vs planned cost, savings.
+
+    ``models`` are extra ModelPrice rows; APP_MODEL is always available at
+    ``price_in`` / ``price_out`` (the Money section's prices).
+    """
+    prices = _prices(models, price_in, price_out)
+    unknown = [c.model for c in calls if c.model not in prices]
+    if unknown:
+        raise ValueError(f"No price for model(s): {', '.join(sorted(set(unknown)))}")
+
+    def col(attr):
+        return np.array([getattr(c, attr) for c in calls])
+
+    r = cost_arrays(col("calls"), col("shared_tokens"), col("unique_tokens"), col("output_tokens"),
+                    col("calls_per_context"), col("cache_hit_pct"),
+                    np.array([prices[c.model].input for c in calls]),
+                    np.array([prices[c.model].output for c in calls]),
+                    col("cached").astype(bool), col("batched").astype(bool), pricing)
+    naive = np.array([naive_cost(c, price_in, price_out) for c in calls])
+    df = pd.DataFrame({
+        "Call Type": [c.name for c in calls],
+        "Model": col("model"),
+        "Cache": np.where(col("cached").astype(bool), "✓", ""),
+        "Batch": np.where(col("batched").astype(bool), "✓", ""),
+        "Calls": col("calls"),
+        "Uncached In": r["uncached_tokens"].astype(np.int64),
+        "Cache Writes": r["cache_write_tokens"].astype(np.int64),
+        "Cached In": r["cached_tokens"].astype(np.int64),
+        "Output": r["output_tokens"].astype(np.int64),
+        "Naive ($)": naive,
+        "Planned ($)": r["cost"],
+    })
+    df["Savings ($)"] = df["Naive ($)"] - df["Planned ($)"]
+    df["Savings %"] = np.where(naive > 0, df["Savings ($)"] / np.where(naive > 0, naive, 1) * 100, 0.0)
+    return df
+
+
+def setup_options(call, models, price_in, price_out, pricing=CachePricing()):
+    """Every model × cache × batch setup for one call type, cheapest first."""
+    prices = list(_prices(models, price_in, price_out).values())
+    grid = [(m, cached, batched) for m in prices for cached in (False, True) for batched in (False, True)]
+    n = len(grid)
+    r = cost_arrays(np.full(n, call.calls), np.full(n, call.shared_tokens), np.full(n, call.unique_tokens),
+                    np.full(n, call.output_tokens), np.full(n, call.calls_per_context),
+                    np.full(n, call.cache_hit_pct),
+                    np.array([m.input for m, _, _ in grid]), np.array([m.output for m, _, _ in grid]),
+                    np.array([c for _, c, _ in grid]), np.array([b for _, _, b in grid]), pricing)
+    return pd.DataFrame({
+        "Call Type": call.name,
+        "Model": [m.name for m, _, _ in grid],
+        "Cache": [c for _, c, _ in grid],
+        "Batch": [b for _, _, b in grid],
+        "Cost ($)": r["cost"],
+    }).sort_values("Cost ($)", kind="stable", ignore_index=True)
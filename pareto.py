@@ -0,0 +1,141 @@
+"""Cost vs. duration Pareto frontier over staffing and review policy.
+
+The configurations are every worker split (Cat C-qualified / Cat B-only,
+with target_workers = their sum) up to ``max_workers``, every reviewer count
+× hours/day up to the limits, and each review policy (the QA review % scaled,
+e.g. 50 = half as many reviews, rounded to the 5% slider step).
+
+The model separates as in solver.py, so the full grid is reduced before
+evaluation without losing a frontier point:
+  * for a given team size cost is the same for every split, so only the split
+    finishing data creation soonest is kept;
+  * reviewer capacity costs nothing, so for each QA duration only the fewest
+    reviewers (then hours/day) reaching it are kept.
+What remains is evaluated in one batch (batch.evaluate_arrays, the full
+chain) and dominated points are pruned with one sort and a running minimum.
+Fewer reviews are always both cheaper and faster, so review policies are not
+traded against each other: each policy gets its own frontier.
+"""
+import math
+from dataclasses import dataclass, fields, replace
+
+import numpy as np
+import pandas as pd
+
+from batch import evaluate_arrays, workload_arrays
+from calculator import PlanInputs, calculate
+from solver import HOURS_STEP, worker_splits
+
+RATE_STEP = 5  # review % slider step
+CONFIG_FIELDS = ["target_workers", "cat_c_workers", "cat_b_only_workers", "num_reviewers", "reviewer_hours_day",
+                 "review_rate_a", "review_rate_b", "review_rate_c"]
+RESULT_FIELDS = ["total_cost", "sequential_days", "calendar_weeks", "days_data", "qa_days_available",
+                 "qual_cost", "reviewer_cost"]
+
+
+@dataclass(frozen=True)
+class Frontier:
+    points: object  # DataFrame: Review policy, CONFIG_FIELDS, RESULT_FIELDS; one row per frontier point
+    cloud: object  # DataFrame: distinct (Review policy, total_cost, sequential_days) of every evaluated point
+    configurations: int  # size of the full grid
+    evaluated: int  # points left after the reduction, evaluated in the batch
+
+
+def review_rates(inputs, scale):
+    """The three review % scaled by ``scale`` %, on the slider's 5% grid and capped at 100."""
+    return tuple(min(100, int(math.floor(rate * scale / 100 / RATE_STEP + 0.5)) * RATE_STEP)
+                 for rate in (inputs.review_rate_a, inputs.review_rate_b, inputs.review_rate_c))
+
+
+def pareto_mask(cost, duration, *tiebreak):
+    """True for the points no other point beats on cost and duration (first of equal points).
+
+    Sorted by cost, then duration, then ``tiebreak`` (smaller first), a point
+    is on the frontier if it is strictly faster than everything before it.
+    """
+    order = np.lexsort(tuple(reversed(tiebreak)) + (duration, cost))
+    d = np.asarray(duration, dtype=float)[order]
+    fastest_before = np.minimum.accumulate(np.r_[np.inf, d[:-1]])
+    mask = np.zeros(len(order), dtype=bool)
+    mask[order[d < fastest_before]] = True
+    return mask
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# GRID REDUCTION
+# ══════════════════════════════════════════════════════════════════════════════
+def team_options(inputs, volume, max_workers):
+    """Per team size, the split finishing data creation soonest: (n, cat_c_workers, cat_b_only_workers, splits)."""
+    i, v = inputs, volume
+    n, cw, bw = worker_splits(1, max_workers, v.cat_c_required > 0)
+    w = workload_arrays(v.cat_a_required, v.cat_b_required, v.cat_c_required,
+                        i.time_a, i.time_b, i.time_c, i.hours_per_worker_day, cw, bw)
+    days = np.maximum(w["days_c_worker"], w["days_b_worker"])
+    order = np.lexsort((cw, days, n))
+    first = order[np.r_[True, n[order][1:] != n[order][:-1]]]
+    return n[first], cw[first], bw[first], len(n)
+
+
+def reviewer_options(total_qa_time, max_reviewers, max_reviewer_hours):
+    """Per QA duration, the fewest reviewers (then hours/day) reaching it: (reviewers, hours, combinations)."""
+    reviewers = np.repeat(np.arange(1, max_reviewers + 1), int(max_reviewer_hours / HOURS_STEP))
+    hours = np.tile(np.arange(1, int(max_reviewer_hours / HOURS_STEP) + 1) * HOURS_STEP, max_reviewers)
+    qa_days = np.ceil(total_qa_time / np.maximum(reviewers * hours * 60, 1))
+    order = np.lexsort((hours, reviewers, qa_days))
+    first = order[np.r_[True, qa_days[order][1:] != qa_days[order][:-1]]]
+    return reviewers[first], hours[first], len(reviewers)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# FRONTIER
+# ══════════════════════════════════════════════════════════════════════════════
+def frontier(inputs, max_workers=60, max_reviewers=10, max_reviewer_hours=8.0, review_scales=(100,)):
+    """The cost / duration frontier of ``inputs`` for each review policy in ``review_scales`` (%)."""
+    i = inputs
+    volume = calculate(i).volume
+    n, cw, bw, splits = team_options(i, volume, max_workers)
+
+    policies = {}  # review rates → first scale giving them
+    for scale in review_scales:
+        policies.setdefault(review_rates(i, scale), scale)
+
+    blocks, combinations = [], 0
+    for rates, scale in policies.items():
+        total_qa_time = calculate(replace(i, review_rate_a=rates[0], review_rate_b=rates[1],
+                                          review_rate_c=rates[2])).qa.total_qa_time
+        reviewers, hours, combinations = reviewer_options(total_qa_time, max_reviewers, max_reviewer_hours)
+        team, rev = np.meshgrid(np.arange(len(n)), np.arange(len(reviewers)), indexing="ij")
+        team, rev = team.ravel(), rev.ravel()
+        blocks.append(pd.DataFrame({
+            "policy": scale, "target_workers": n[team], "cat_c_workers": cw[team], "cat_b_only_workers": bw[team],
+            "num_reviewers": reviewers[rev], "reviewer_hours_day": hours[rev],
+            "review_rate_a": rates[0], "review_rate_b": rates[1], "review_rate_c": rates[2],
+        }))
+    grid = pd.concat(blocks, ignore_index=True)
+
+    # Only the staffing and review columns vary; NumPy broadcasts the other inputs as scalars
+    columns = {f.name: getattr(i, f.name) for f in fields(PlanInputs)}
+    columns["num_evals"] = np.nan if i.num_evals is None else i.num_evals
+    columns.update({name: grid[name].to_numpy() for name in CONFIG_FIELDS})
+    derived = evaluate_arrays(columns)
+    for name in RESULT_FIELDS:
+        grid[name] = np.broadcast_to(derived[name], len(grid))
+
+    on_front = np.zeros(len(grid), dtype=bool)
+    for scale in policies.values():
+        block = np.flatnonzero(grid["policy"].to_numpy() == scale)
+        g = grid.iloc[block]
+        on_front[block] = pareto_mask(g["total_cost"].to_numpy(), g["sequential_days"].to_numpy(),
+                                      g["target_workers"].to_numpy(), g["num_reviewers"].to_numpy(),
+                                      g["reviewer_hours_day"].to_numpy())
+
+    points = (grid[on_front].sort_values(["policy", "total_cost", "sequential_days"])
+              .rename(columns={"policy": "Review policy"}).reset_index(drop=True))
+    cloud = (grid[["policy", "total_cost", "sequential_days"]].drop_duplicates()
+             .rename(columns={"policy": "Review policy"}).reset_index(drop=True))
+    return Frontier(points, cloud, splits * combinations * len(policies), len(grid))
+
+
+def point_inputs(inputs, point):
+    """``inputs`` with the staffing and review % of one frontier row."""
+    return replace(inputs, **{name: type(getattr(inputs, name))(point[name]) for name in CONFIG_FIELDS})
@@ -0,0 +1,184 @@
+"""Opt-in per-rerun profile of the app's sections.
+
+    LOGISTICS_PROFILE=1 streamlit run app.py    # every session
+    http://localhost:8501/?profile=1           # one session
+
+The rerun is split into sections at ``mark`` calls. Each section records its
+wall time, the time spent inside calculator stages (and how many were cache
+hits), the pandas DataFrames constructed, the widget reads and the bytes
+queued for the browser — so a slow rerun can be put down to the math,
+DataFrame building or Streamlit serialization.
+
+Counting hooks pandas.DataFrame, the Streamlit widget functions and the
+browser message queue the first time a profile starts. The hooks only count
+on the thread of a rerun being profiled (Streamlit runs each script on its
+own thread), so other sessions pay one attribute lookup per call. Fragment
+reruns are not profiled.
+"""
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass
+
+ENV_VAR = "LOGISTICS_PROFILE"
+WIDGETS = ("number_input", "slider", "selectbox", "multiselect", "toggle", "text_input", "data_editor", "button")
+
+logger = logging.getLogger("logistics.profile")
+_active = threading.local()  # .profile: the RerunProfile of this thread's rerun, if any
+_install_lock = threading.Lock()
+_installed = False
+
+
+def enabled(query_params):
+    """Profiling is on for every session via ENV_VAR, or for one via ?profile=1."""
+    return os.environ.get(ENV_VAR, "0") not in ("", "0") or query_params.get("profile", "0") not in ("", "0")
+
+
+@dataclass(frozen=True)
+class SectionTiming:
+    section: str
+    seconds: float
+    stage_seconds: float  # inside StageCache.get, hits included
+    stages: int
+    stage_hits: int
+    dataframes: int
+    widget_reads: int
+    payload_bytes: int
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# HOOKS
+# ══════════════════════════════════════════════════════════════════════════════
+def _count(what, n=1):
+    profile = getattr(_active, "profile", None)
+    if profile is not None:
+        profile.counts[what] += n
+
+
+def _counting(fn, what):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        _count(what)
+        return fn(*args, **kwargs)
+    return wrapper
+
+
+def _install():
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        import pandas as pd
+        import streamlit as st
+        from streamlit.delta_generator import DeltaGenerator
+        from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+
+        pd.DataFrame.__init__ = _counting(pd.DataFrame.__init__, "dataframes")
+        for name in WIDGETS:
+            # st.<widget> is bound to the main container at import; column.<widget> goes through the class
+            setattr(st, name, _counting(getattr(st, name), "widget_reads"))
+            setattr(DeltaGenerator, name, _counting(getattr(DeltaGenerator, name), "widget_reads"))
+
+        enqueue = ForwardMsgQueue.enqueue
+
+        @functools.wraps(enqueue)
+        def counting_enqueue(self, msg):
+            if getattr(_active, "profile", None) is not None:
+                _count("payload_bytes", msg.ByteSize())
+            return enqueue(self, msg)
+
+        ForwardMsgQueue.enqueue = counting_enqueue
+        _installed = True
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# PROFILE
+# ══════════════════════════════════════════════════════════════════════════════
+class RerunProfile:
+    """Section timings and counts for one rerun on the current thread."""
+
+    def __init__(self, stage_log):
+        _install()
+        self.stage_log = stage_log  # the app's StageRun list for this rerun
+        self.counts = Counter()
+        self.sections = []
+        self._open = None
+        self._start = time.perf_counter()
+        self.seconds = None
+        _active.profile = self
+
+    def mark(self, section):
+        """End the current section and start ``section``."""
+        self._close()
+        self._open = (section, time.perf_counter(), len(self.stage_log), self.counts.copy())
+
+    def _close(self):
+        if self._open is None:
+            return
+        section, start, first_stage, before = self._open
+        runs = self.stage_log[first_stage:]
+        self.sections.append(SectionTiming(
+            section=section,
+            seconds=time.perf_counter() - start,
+            stage_seconds=sum(r.seconds for r in runs),
+            stages=len(runs),
+            stage_hits=sum(r.hit for r in runs),
+            dataframes=self.counts["dataframes"] - before["dataframes"],
+            widget_reads=self.counts["widget_reads"] - before["widget_reads"],
+            payload_bytes=self.counts["payload_bytes"] - before["payload_bytes"],
+        ))
+        self._open = None
+
+    def finish(self):
+        """Close the last section and stop counting; the rest of the rerun is not profiled."""
+        self._close()
+        self.seconds = time.perf_counter() - self._start
+        if getattr(_active, "profile", None) is self:
+            _active.profile = None
+        return self
+
+    def frame(self):
+        import pandas as pd
+
+        df = pd.DataFrame({
+            "Section": [s.section for s in self.sections],
+            "Time (ms)": [s.seconds * 1000 for s in self.sections],
+            "Stages (ms)": [s.stage_seconds * 1000 for s in self.sections],
+            "Stages": [s.stages for s in self.sections],
+            "Hits": [s.stage_hits for s in self.sections],
+            "DataFrames": [s.dataframes for s in self.sections],
+            "Widgets": [s.widget_reads for s in self.sections],
+            "Payload (KB)": [s.payload_bytes / 1024 for s in self.sections],
+        })
+        return df.round({"Time (ms)": 2, "Stages (ms)": 2, "Payload (KB)": 1})
+
+    def record(self, **context):
+        """One JSON-ready dict per rerun: totals, then every section."""
+        return {
+            "event": "rerun_profile",
+            **context,
+            "total_ms": round(self.seconds * 1000, 3),
+            "stages": sum(s.stages for s in self.sections),
+            "stage_hits": sum(s.stage_hits for s in self.sections),
+            "dataframes": sum(s.dataframes for s in self.sections),
+            "widget_reads": sum(s.widget_reads for s in self.sections),
+            "payload_bytes": sum(s.payload_bytes for s in self.sections),
+            "sections": [
+                {**asdict(s), "seconds": round(s.seconds, 6), "stage_seconds": round(s.stage_seconds, 6)}
+                for s in self.sections
+            ],
+        }
+
+    def log(self, **context):
+        """Write ``record`` as one JSON line to the logistics.profile logger (stderr by default)."""
+        if not logger.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(message)s"))
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+        logger.info(json.dumps(self.record(**context)))
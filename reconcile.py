@@ -0,0 +1,265 @@
+"""Exact reconciliation of a plan's counts, allocations and totals.
+
+The calculator mixes round() (half-even) for the category targets, ceil() of
+float divisions for required submissions, reviews and days, and per-worker
+loads rounded to 0.1. Here the same quantities are recomputed with integers
+and fractions, reading every rate as the decimal that was typed (6.3 % is
+63/1000, not the nearest float):
+
+  * category targets by largest remainder, so they always add up to the
+    deliverable and never go to a category whose share rounds to nothing;
+  * each category's required submissions split between the worker types by
+    head-count (largest remainder), then as evenly as possible over the
+    workers of each type — every submission lands on exactly one worker;
+  * the busiest worker's days, QA days and the budget in Decimal cents.
+
+``reconcile(plan)`` checks the PlanResults against them, one step at a time
+(each check starts from the plan's own upstream numbers, so one rounding
+difference is reported once, not in every later section). A check is
+"error" when the plan's numbers contradict each other (negative targets,
+submissions no worker can take, totals that don't add up) and "drift"
+where the float chain lands on a different whole number than exact
+arithmetic. The work is a few dozen integer operations plus one pass over
+the workers, whatever the volume, so the app runs it on every rerun.
+"""
+import math
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal
+from fractions import Fraction
+
+import numpy as np
+import pandas as pd
+
+CENT = Decimal("0.01")
+SEVERITIES = ("ok", "drift", "error")
+
+
+def exact(x):
+    """The decimal ``x`` was typed as, as a Fraction (floats go through their shortest repr)."""
+    return Fraction(Decimal(repr(x)) if isinstance(x, float) else x)
+
+
+def largest_remainder(total, weights):
+    """Split the integer ``total`` in proportion to ``weights``; the shares add up to ``total``.
+
+    Every share is its quota rounded down, plus one for the largest
+    remainders (earlier weights win ties). All-zero weights give all zeros.
+    """
+    weights = [exact(w) for w in weights]
+    weight_sum = sum(weights)
+    if total == 0 or weight_sum <= 0:
+        return [0] * len(weights)
+    quotas = [total * w / weight_sum for w in weights]
+    shares = [math.floor(q) for q in quotas]
+    by_remainder = sorted(range(len(weights)), key=lambda k: (shares[k] - quotas[k], k))
+    for k in by_remainder[:total - sum(shares)]:
+        shares[k] += 1
+    return shares
+
+
+def gross_up(target, fail_pct):
+    """⌈target ÷ (1 − failure)⌉ in exact arithmetic."""
+    fail = exact(fail_pct)
+    return target if fail >= 100 else math.ceil(target * 100 / (100 - fail))
+
+
+def spread(totals, workers):
+    """Per-worker counts of each total over ``workers`` workers (workers × totals).
+
+    Everyone gets the floor share; the extra ones go round-robin, continuing
+    from where the previous column stopped, so no worker takes more than one
+    extra per column and extras don't pile up on the first workers.
+    """
+    counts = np.zeros((workers, len(totals)), dtype=np.int64)
+    if workers == 0:
+        return counts
+    start = 0
+    for j, total in enumerate(totals):
+        base, extra = divmod(total, workers)
+        counts[:, j] = base
+        counts[(start + np.arange(extra)) % workers, j] += 1
+        start = (start + extra) % workers
+    return counts
+
+
+@dataclass(frozen=True)
+class Check:
+    name: str
+    severity: str  # one of SEVERITIES
+    detail: str
+
+
+@dataclass(frozen=True)
+class Reconciliation:
+    targets: tuple  # (A, B, C) by largest remainder
+    required: tuple  # (A, B, C) exact, from the plan's targets
+    reviews: tuple  # (A, B, C) exact, from the plan's required
+    allocation: pd.DataFrame  # one row per worker type: submissions per category, per-worker range
+    data_days: int  # the busiest worker's days, rounded up (at least 1)
+    qa_days: int
+    total_cost: Decimal  # to the cent
+    checks: tuple
+
+    @property
+    def errors(self):
+        return tuple(c for c in self.checks if c.severity == "error")
+
+    @property
+    def drifts(self):
+        return tuple(c for c in self.checks if c.severity == "drift")
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# RECONCILE
+# ══════════════════════════════════════════════════════════════════════════════
+def _compare(checks, name, plan_value, exact_value, what, severity="drift"):
+    if plan_value == exact_value:
+        checks.append(Check(name, "ok", f"{what}: {plan_value}"))
+    else:
+        checks.append(Check(name, severity, f"{what}: plan {plan_value}, exact {exact_value}"))
+
+
+def _cents(x):
+    return Decimal(x.numerator) / Decimal(x.denominator) if isinstance(x, Fraction) else Decimal(repr(x))
+
+
+def reconcile(plan):
+    """Check a calculator.PlanResults against exact arithmetic; returns a Reconciliation."""
+    i, v, p, q, t, m, tl = plan.inputs, plan.volume, plan.people, plan.qa, plan.tech, plan.money, plan.timeline
+    checks = []
+    cats = ("A", "B", "C")
+    plan_targets = (v.cat_a_target, v.cat_b_target, v.cat_c_target)
+    plan_required = (v.cat_a_required, v.cat_b_required, v.cat_c_required)
+    plan_reviews = (q.reviews_a, q.reviews_b, q.reviews_c)
+
+    # ── 1. Volume ──
+    if i.cat_a_pct + i.cat_b_pct > 100:
+        checks.append(Check("Category mix", "error",
+                            f"A {i.cat_a_pct}% + B {i.cat_b_pct}% is over 100%; Cat C target is {v.cat_c_target}"))
+    else:
+        checks.append(Check("Category mix", "ok", f"A {i.cat_a_pct}% + B {i.cat_b_pct}% + C {v.cat_c_pct}%"))
+    targets = tuple(largest_remainder(i.total_deliverable,
+                                      (i.cat_a_pct, i.cat_b_pct, max(100 - i.cat_a_pct - i.cat_b_pct, 0))))
+    if sum(plan_targets) != i.total_deliverable or min(plan_targets) < 0:
+        checks.append(Check("Targets add up", "error",
+                            f"A / B / C targets {plan_targets} for {i.total_deliverable} deliverable"))
+    else:
+        checks.append(Check("Targets add up", "ok", f"A + B + C targets = {i.total_deliverable}"))
+    _compare(checks, "Targets (largest remainder)", plan_targets, targets, "A / B / C targets")
+
+    fails = (i.fail_a, i.fail_b, i.fail_c)
+    required = tuple(gross_up(target, f) for target, f in zip(plan_targets, fails))
+    _compare(checks, "Required (exact gross-up)", plan_required, required, "A / B / C required")
+    short = [c for c, target, req in zip(cats, plan_targets, plan_required) if req < target]
+    if short or sum(plan_required) != v.total_required:
+        checks.append(Check("Required covers targets", "error",
+                            f"required below target for {', '.join(short) or '—'}; "
+                            f"total {v.total_required} vs sum {sum(plan_required)}"))
+    else:
+        checks.append(Check("Required covers targets", "ok", f"total required {v.total_required}"))
+
+    # ── 3. People: every required submission on exactly one worker ──
+    cw, bw = i.cat_c_workers, i.cat_b_only_workers
+    to_assign = [max(req, 0) for req in plan_required]  # negative counts are reported above
+    a_split = largest_remainder(to_assign[0], (cw, bw))
+    b_split = largest_remainder(to_assign[1], (cw, bw))
+    c_on_c = to_assign[2] if cw else 0
+    per_c = spread((a_split[0], b_split[0], c_on_c), cw)
+    per_b = spread((a_split[1], b_split[1], 0), bw)
+    unassigned = [f"{c} ({req - a})" for c, req, a in
+                  zip(cats, to_assign, (sum(a_split), sum(b_split), c_on_c)) if req != a]
+    if unassigned:
+        checks.append(Check("Every submission assigned", "error",
+                            f"no qualified worker for {', '.join(unassigned)} submissions"))
+    else:
+        checks.append(Check("Every submission assigned", "ok", f"{v.total_required} submissions on {cw + bw} workers"))
+    # The plan's per-worker loads (rounded to 0.1) times the head-count, per category
+    covered = (exact(p.a_per_c) * cw + exact(p.a_per_b) * bw, exact(p.b_per_c) * cw + exact(p.b_per_b) * bw,
+               exact(p.c_per_c) * cw)
+    gaps = [f"{c} {float(cov - req):+g}" for c, cov, req in zip(cats, covered, plan_required) if cov != req]
+    checks.append(Check("Workload adds up", "drift" if gaps else "ok",
+                        f"per-worker loads × workers − required: {', '.join(gaps)}" if gaps
+                        else "per-worker loads × workers = required"))
+
+    minutes = (exact(i.time_a), exact(i.time_b), exact(i.time_c))
+    minutes_per_day = exact(i.hours_per_worker_day) * 60
+    # Workers' counts differ by at most one per category, so only a few distinct rows need exact minutes
+    busiest = [max(sum(n * mins for n, mins in zip(row, minutes)) for row in np.unique(counts, axis=0).tolist())
+               if len(counts) else Fraction(0) for counts in (per_c, per_b)]
+    data_days = math.ceil(max(max(busiest) / minutes_per_day, 1))
+    _compare(checks, "Data creation days", tl.days_data, data_days, "days for the busiest worker")
+
+    # ── 4. QA ──
+    rates = (i.review_rate_a, i.review_rate_b, i.review_rate_c)
+    reviews = tuple(math.ceil(req * exact(r) / 100) for req, r in zip(plan_required, rates))
+    _compare(checks, "Reviews (exact)", plan_reviews, reviews, "A / B / C reviews")
+    qa_minutes = exact(q.total_reviews) * exact(i.qa_review_time)
+    qa_days = math.ceil(qa_minutes / max(i.num_reviewers * exact(i.reviewer_hours_day) * 60, 1))
+    _compare(checks, "QA days (exact)", q.qa_days_available, qa_days, "QA days")
+
+    # ── 5. Money, to the cent ──
+    worker_cost = sum(r * exact(mins) for r, mins in zip(plan_required, (i.time_a, i.time_b, i.time_c))) \
+        / 60 * exact(i.worker_hourly)
+    qual_cost = p.workers_before_pass * exact(i.qual_time) / 60 * exact(i.worker_hourly)
+    reviewer_cost = qa_minutes / 60 * exact(i.reviewer_hourly)
+    llm_cost = (t.total_sub_in_sec * exact(i.llm_price_input) + t.total_sub_out_sec * exact(i.llm_price_output)
+                + t.total_eval_in * exact(i.llm_price_input) + t.total_eval_out * exact(i.llm_price_output)) / 1_000_000
+    infra_cost = exact(i.cost_filings) + exact(i.cost_auto_check) + exact(i.cost_database)
+    lines = {"worker": (m.worker_cost, worker_cost), "qualification": (m.qual_cost, qual_cost),
+             "reviewer": (m.reviewer_cost, reviewer_cost), "tech": (m.tech_cost, llm_cost + infra_cost)}
+    total_cost = sum(_cents(e) for _, e in lines.values()).quantize(CENT, ROUND_HALF_UP)
+    off = [f"{name} ${_cents(f).quantize(CENT, ROUND_HALF_UP)} vs ${_cents(e).quantize(CENT, ROUND_HALF_UP)}"
+           for name, (f, e) in lines.items()
+           if _cents(f).quantize(CENT, ROUND_HALF_UP) != _cents(e).quantize(CENT, ROUND_HALF_UP)]
+    plan_total = _cents(m.total_cost).quantize(CENT, ROUND_HALF_UP)
+    if off:
+        checks.append(Check("Budget lines to the cent", "drift", "; ".join(off)))
+    else:
+        checks.append(Check("Budget lines to the cent", "ok", "every line matches"))
+    _compare(checks, "Budget total to the cent", f"${plan_total:,}", f"${total_cost:,}", "total")
+
+    # ── 6. Timeline ──
+    phases = i.days_finding + i.days_testing + i.days_meeting + i.days_compiling + i.days_buffer
+    parallel = max(tl.days_data, q.qa_days_available)
+    if tl.data_qa_parallel != parallel or tl.sequential_days != phases + parallel:
+        checks.append(Check("Timeline adds up", "error",
+                            f"{tl.sequential_days} days vs phases {phases} + data/QA block {parallel}"))
+    else:
+        checks.append(Check("Timeline adds up", "ok", f"{phases} phase days + {parallel} data/QA days"))
+
+    allocation = pd.DataFrame({
+        "Worker Type": ["Cat C-qualified", "Cat B-only"],
+        "Workers": [cw, bw],
+        "A subs": [a_split[0], a_split[1]],
+        "B subs": [b_split[0], b_split[1]],
+        "C subs": [c_on_c, 0],
+        "Per Worker": [_per_worker(per_c), _per_worker(per_b)],
+        "Busiest (min)": [float(busiest[0]), float(busiest[1])],
+        "Busiest (days)": [float(busiest[0] / minutes_per_day), float(busiest[1] / minutes_per_day)],
+    })
+    return Reconciliation(
+        targets=targets,
+        required=required,
+        reviews=reviews,
+        allocation=allocation,
+        data_days=data_days,
+        qa_days=qa_days,
+        total_cost=total_cost,
+        checks=tuple(checks),
+    )
+
+
+def _per_worker(counts):
+    if not len(counts):
+        return "—"
+    totals = counts.sum(axis=1)
+    low, high = int(totals.min()), int(totals.max())
+    return f"{low}" if low == high else f"{low}–{high}"
+
+
+def checks_table(rec):
+    return pd.DataFrame({
+        "Check": [c.name for c in rec.checks],
+        "Result": [{"ok": "✅", "drift": "⚠️ drift", "error": "❌ error"}[c.severity] for c in rec.checks],
+        "Detail": [c.detail for c in rec.checks],
+    })
@@ -0,0 +1,104 @@
+"""Monte Carlo risk mode.
+
+Draws the uncertain assumptions (failure rates, funnel rates, per-submission
+times, ...) from user-specified distributions and pushes every trial through
+the vectorized chain in batch.evaluate_arrays, so 100k trials cost one pass
+of array math. Seed the generator to make a run reproducible.
+"""
+from dataclasses import asdict, dataclass
+
+import numpy as np
+import pandas as pd
+
+from batch import evaluate_arrays
+
+KINDS = ("pert", "triangular", "uniform")
+
+# Inputs that are percentages, and the range a draw is clipped to
+_PCT_BOUNDS = {
+    "fail_a": (0, 99), "fail_b": (0, 99), "fail_c": (0, 99),
+    "retention_rate": (1, 100), "pass_rate": (1, 100), "invite_take_rate": (1, 100),
+    "review_rate_a": (0, 100), "review_rate_b": (0, 100), "review_rate_c": (0, 100),
+}
+_POSITIVE_FLOOR = 1e-6
+
+
+@dataclass(frozen=True)
+class Distribution:
+    """Three-point estimate for one input. ``mode`` is ignored for uniform."""
+
+    kind: str
+    low: float
+    mode: float
+    high: float
+
+    def __post_init__(self):
+        if self.kind not in KINDS:
+            raise ValueError(f"Unknown distribution {self.kind!r}; expected one of {KINDS}")
+        if not self.low <= self.mode <= self.high:
+            raise ValueError(f"Need low <= mode <= high, got {self.low}, {self.mode}, {self.high}")
+
+    def sample(self, rng, n):
+        if self.low == self.high:
+            return np.full(n, float(self.low))
+        if self.kind == "uniform":
+            return rng.uniform(self.low, self.high, n)
+        if self.kind == "triangular":
+            return rng.triangular(self.low, self.mode, self.high, n)
+        # PERT: beta on [low, high] with the mode weighted 4×
+        span = self.high - self.low
+        alpha = 1 + 4 * (self.mode - self.low) / span
+        beta = 1 + 4 * (self.high - self.mode) / span
+        return self.low + rng.beta(alpha, beta, n) * span
+
+
+def spread(kind, mode, low_pct, high_pct):
+    """Distribution from a point estimate and relative spreads, e.g. −30% / +50%.
+
+    A missing spread (None or NaN, e.g. a cleared table cell) is 0%: that bound stays at ``mode``.
+    """
+    low_pct, high_pct = (0 if pd.isna(pct) else pct for pct in (low_pct, high_pct))
+    return Distribution(kind, mode * (1 - low_pct / 100), mode, mode * (1 + high_pct / 100))
+
+
+def simulate(inputs, distributions, trials=100_000, seed=None):
+    """Run ``trials`` draws around ``inputs``; returns a dict of result arrays.
+
+    ``distributions`` maps PlanInputs field names to Distribution objects;
+    every other input stays at its value in ``inputs``.
+    """
+    rng = np.random.default_rng(seed)
+    cols = {}
+    for name, value in asdict(inputs).items():
+        if name in distributions:
+            draws = distributions[name].sample(rng, trials)
+            lo, hi = _PCT_BOUNDS.get(name, (_POSITIVE_FLOOR, np.inf))
+            cols[name] = np.clip(draws, lo, hi)
+        else:
+            cols[name] = np.full(trials, np.nan if value is None else value)
+    return evaluate_arrays(cols)
+
+
+def percentiles(results, metrics=("total_cost", "sequential_days"), qs=(50, 90, 99)):
+    """P50/P90/P99 (and mean) of the chosen result arrays, one row per metric."""
+    rows = {}
+    for m in metrics:
+        values = results[m]
+        row = dict(zip((f"P{q}" for q in qs), np.percentile(values, qs)))
+        row["Mean"] = values.mean()
+        rows[m] = row
+    return pd.DataFrame.from_dict(rows, orient="index")
+
+
+def histogram(values, bins=40):
+    """Counts per bin as a DataFrame indexed by the bin midpoint, ready for st.bar_chart."""
+    counts, edges = np.histogram(values, bins=bins)
+    return pd.DataFrame({"Trials": counts}, index=(edges[:-1] + edges[1:]) / 2)
+
+
+def summarize(inputs, distributions, trials=100_000, seed=None, bins=40):
+    """Percentile table plus budget and duration histograms — small enough to cache."""
+    results = simulate(inputs, dict(distributions), trials, seed)
+    return (percentiles(results),
+            histogram(results["total_cost"], bins),
+            histogram(results["sequential_days"], bins))
@@ -0,0 +1,102 @@
+"""Named scenarios in a local SQLite file, with results cached by input hash.
+
+A scenario is a saved PlanInputs. Its results are stored once per distinct
+input hash, so reopening or comparing saved scenarios never recomputes, and two
+scenarios with identical inputs share one entry.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+from contextlib import closing
+from dataclasses import asdict
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from calculator import PlanInputs, calculate
+
+DEFAULT_PATH = os.environ.get("LOGISTICS_SCENARIO_DB") or os.path.join(os.path.dirname(os.path.abspath(__file__)), "scenarios.db")
+
+# Rows of the comparison table: result field → label
+COMPARE_LINES = {
+    "worker_cost": "Worker Annotation",
+    "qual_cost": "Qualification Testing",
+    "reviewer_cost": "Expert Review",
+    "tech_cost": "Tech / Infrastructure",
+    "total_cost": "TOTAL",
+    "sequential_days": "Duration (days)",
+    "total_required": "Submissions Required",
+    "workers_to_invite": "Invitations Needed",
+}
+BUDGET_LINES = ["worker_cost", "qual_cost", "reviewer_cost", "tech_cost"]
+
+
+def input_hash(inputs):
+    canonical = json.dumps(asdict(inputs), sort_keys=True)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class ScenarioStore:
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        with closing(self._connect()) as db, db:
+            db.execute("""CREATE TABLE IF NOT EXISTS scenarios (
+                name TEXT PRIMARY KEY, inputs TEXT NOT NULL, input_hash TEXT NOT NULL, saved_at TEXT NOT NULL)""")
+            db.execute("""CREATE TABLE IF NOT EXISTS results (
+                input_hash TEXT PRIMARY KEY, results TEXT NOT NULL)""")
+
+    def _connect(self):
+        # One short-lived connection per call keeps the store safe across Streamlit threads
+        return sqlite3.connect(self.path)
+
+    def names(self):
+        with closing(self._connect()) as db:
+            return [row[0] for row in db.execute("SELECT name FROM scenarios ORDER BY saved_at, name")]
+
+    def save(self, name, inputs):
+        """Save (or overwrite) ``name`` and cache its results."""
+        digest = input_hash(inputs)
+        with closing(self._connect()) as db, db:
+            db.execute("INSERT OR REPLACE INTO scenarios VALUES (?, ?, ?, ?)",
+                       (name, json.dumps(asdict(inputs)), digest, datetime.now(timezone.utc).isoformat()))
+            if db.execute("SELECT 1 FROM results WHERE input_hash = ?", (digest,)).fetchone() is None:
+                db.execute("INSERT INTO results VALUES (?, ?)", (digest, json.dumps(calculate(inputs).to_dict())))
+
+    def load(self, name):
+        with closing(self._connect()) as db:
+            row = db.execute("SELECT inputs FROM scenarios WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            raise KeyError(name)
+        return PlanInputs(**json.loads(row[0]))
+
+    def delete(self, name):
+        with closing(self._connect()) as db, db:
+            db.execute("DELETE FROM scenarios WHERE name = ?", (name,))
+            db.execute("DELETE FROM results WHERE input_hash NOT IN (SELECT input_hash FROM scenarios)")
+
+    def results(self, names):
+        """Cached flat results (``PlanResults.to_dict()``) for each name, in order."""
+        with closing(self._connect()) as db:
+            rows = dict(db.execute(
+                f"SELECT s.name, r.results FROM scenarios s JOIN results r USING (input_hash) "
+                f"WHERE s.name IN ({','.join('?' * len(names))})", list(names)))
+        return {name: json.loads(rows[name]) for name in names if name in rows}
+
+    def compare(self, names):
+        """One column per scenario plus ``Δ <name>`` columns against the first."""
+        results = self.results(names)
+        table = pd.DataFrame({name: [r[f] for f in COMPARE_LINES] for name, r in results.items()},
+                             index=list(COMPARE_LINES.values()))
+        if len(results) > 1:
+            first = next(iter(results))
+            for name in list(results)[1:]:
+                table[f"Δ {name}"] = table[name] - table[first]
+        return table
+
+    def budget_lines(self, names):
+        """Long-form budget lines per scenario, for a grouped bar chart."""
+        return pd.DataFrame([
+            {"Scenario": name, "Line Item": COMPARE_LINES[f], "Cost": r[f]}
+            for name, r in self.results(names).items() for f in BUDGET_LINES
+        ])
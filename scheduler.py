@@ -0,0 +1,287 @@
+"""Schedule many projects on one shared worker and reviewer pool.
+
+Each project is a PlanInputs evaluated with calculator.calculate, which gives
+its work in minutes: Cat C annotation (Cat C-qualified workers only), Cat A/B
+annotation (anyone) and QA review. Its timeline phases frame that work:
+finding + testing before the data block, meeting + compiling + buffer after.
+
+The pool is stepped a day at a time. Projects are ranked by a priority order;
+each day B-only workers' minutes go to A/B work, Cat C-qualified workers'
+minutes go to Cat C work and then to whatever A/B work is left, and reviewer
+minutes go to the QA unlocked by data finished on earlier days — each in
+priority order, with a project's day capped at ``max_workers`` if it has one.
+Every step is a cumulative sum over (orders × projects) arrays, so many
+candidate orders are simulated at once.
+
+The order is chosen by trying the usual dispatch rules (earliest due date,
+least slack, late fee per minute of work, release date) and then swapping
+pairs of projects while that lowers the objective: total days late, or total
+late fees for ``objective="cost"``.
+"""
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from calculator import calculate
+
+OBJECTIVES = ("lateness", "cost")
+_EPS = 1e-6
+
+
+@dataclass(frozen=True)
+class Project:
+    name: str
+    inputs: object  # PlanInputs
+    due_day: int  # last day the project may finish on time (day 1 = first day)
+    release_day: int = 0  # setup starts the day after this
+    late_fee: float = 0.0  # $ per day late
+    max_workers: int | None = None  # cap on workers on this project per day
+
+
+@dataclass(frozen=True)
+class Pool:
+    cat_c_workers: int
+    cat_b_only_workers: int
+    hours_per_worker_day: float
+    num_reviewers: int
+    reviewer_hours_day: float
+
+
+@dataclass(frozen=True)
+class Schedule:
+    projects: pd.DataFrame  # one row per project, in input order
+    gantt: pd.DataFrame  # Project / Phase / Start / End (days, End inclusive)
+    usage: pd.DataFrame  # per day and project: C / B-only workers and reviewers used
+    order: tuple  # project names, highest priority first
+    total_days_late: int
+    total_late_fees: float
+    makespan: int
+    unfinished: tuple  # projects the pool cannot finish within max_days
+    evaluations: int  # orders simulated
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SIMULATION
+# ══════════════════════════════════════════════════════════════════════════════
+def _fill(demand, capacity):
+    """Give ``capacity`` (one per row) to ``demand`` in column order; returns the amounts given."""
+    before = np.cumsum(demand, axis=1) - demand
+    return np.minimum(np.maximum(capacity[:, None] - before, 0), demand)
+
+
+def _work(projects):
+    """Per-project work and phase lengths as arrays."""
+    rows = []
+    for p in projects:
+        i, plan = p.inputs, calculate(p.inputs)
+        rows.append((
+            plan.time.total_time_c,
+            plan.time.total_time_a + plan.time.total_time_b,
+            plan.qa.total_qa_time,
+            i.days_finding + i.days_testing,
+            i.days_meeting + i.days_compiling + i.days_buffer,
+            plan.money.total_cost,
+        ))
+    c_min, ab_min, qa_min, pre, post, cost = (np.array(col, dtype=float) for col in zip(*rows))
+    return {
+        "c_min": c_min, "ab_min": ab_min, "qa_min": qa_min,
+        "pre": pre.astype(np.int64), "post": post.astype(np.int64), "cost": cost,
+        "release": np.array([p.release_day for p in projects], dtype=np.int64),
+        "due": np.array([p.due_day for p in projects], dtype=np.int64),
+        "fee": np.array([p.late_fee for p in projects], dtype=float),
+        "cap": np.array([np.inf if p.max_workers is None else p.max_workers for p in projects], dtype=float),
+    }
+
+
+def simulate(work, pool, orders, max_days=1000, record=False):
+    """Run the pool over each row of ``orders`` (project indices, highest priority first).
+
+    All orders are stepped together as (orders × projects) arrays. Returns
+    (data_end, usage): the last day of each project's data + QA block per
+    order, in project order (-1 = unfinished within ``max_days``), and with
+    ``record`` the per-day minutes used by the first order (days × projects).
+    """
+    orders = np.atleast_2d(orders)
+    m, n = orders.shape
+    w = {k: v[orders] for k, v in work.items()}
+    minutes_per_worker = pool.hours_per_worker_day * 60
+    cap_b = np.full(m, pool.cat_b_only_workers * minutes_per_worker)
+    cap_c = np.full(m, pool.cat_c_workers * minutes_per_worker)
+    cap_r = np.full(m, pool.num_reviewers * pool.reviewer_hours_day * 60)
+    project_cap = w["cap"] * minutes_per_worker
+
+    c_rem, ab_rem = w["c_min"].copy(), w["ab_min"].copy()
+    total_data = w["c_min"] + w["ab_min"]
+    safe_total = np.where(total_data > 0, total_data, 1)
+    qa_done = np.zeros((m, n))
+    qa_open = np.where(total_data > 0, 0.0, w["qa_min"])  # QA unlocked so far
+    starts = w["release"] + w["pre"]  # data starts the day after
+    end = np.full((m, n), -1, dtype=np.int64)
+    used = {"c": [], "b": [], "r": []}
+
+    for day in range(1, max_days + 1):
+        active = (day > starts) & (end < 0)
+        if not active.any():
+            if (end >= 0).all():
+                break
+            if record:
+                for k in used:
+                    used[k].append(np.zeros(n))
+            continue
+        room = np.where(active, project_cap, 0.0)
+        b_ab = _fill(np.minimum(np.where(active, ab_rem, 0), room), cap_b)
+        room -= b_ab
+        c_c = _fill(np.minimum(np.where(active, c_rem, 0), room), cap_c)
+        room -= c_c
+        c_ab = _fill(np.minimum(np.where(active, ab_rem - b_ab, 0), room), cap_c - c_c.sum(axis=1))
+        # Reviews only reach submissions from earlier days
+        r = _fill(np.where(active, qa_open - qa_done, 0), cap_r)
+
+        c_rem -= c_c
+        ab_rem -= b_ab + c_ab
+        qa_done += r
+        left = c_rem + ab_rem
+        qa_open = w["qa_min"] * np.where(total_data > 0, 1 - left / safe_total, 1)
+        end[active & (left <= _EPS) & (qa_done >= w["qa_min"] - _EPS)] = day
+        if record:
+            used["c"].append((c_c + c_ab)[0])
+            used["b"].append(b_ab[0])
+            used["r"].append(r[0])
+
+    back = np.argsort(orders, axis=1)
+    end = np.take_along_axis(end, back, axis=1)
+    if not record:
+        return end, None
+    usage = {k: np.array(v)[:, back[0]] if v else np.zeros((0, n)) for k, v in used.items()}
+    return end, usage
+
+
+def _scores(work, end, objective, max_days):
+    """Objective tuples per order (row of ``end``), lower is better."""
+    finish = np.where(end >= 0, end + work["post"], max_days * 10)
+    late = np.maximum(finish - work["due"], 0)
+    days_late, fees, finish_sum = late.sum(axis=1), (late * work["fee"]).sum(axis=1), finish.sum(axis=1)
+    if objective == "cost":
+        return list(zip(fees.tolist(), days_late.tolist(), finish_sum.tolist()))
+    return list(zip(days_late.tolist(), fees.tolist(), finish_sum.tolist()))
+
+
+def _rule_orders(work, pool):
+    """Starting orders from common dispatch rules."""
+    minutes = work["c_min"] + work["ab_min"]
+    pool_minutes = max((pool.cat_c_workers + pool.cat_b_only_workers) * pool.hours_per_worker_day * 60, 1)
+    slack = work["due"] - work["release"] - work["pre"] - work["post"] - minutes / pool_minutes
+    fee_rate = work["fee"] / np.maximum(minutes, 1)
+    return np.array([
+        np.lexsort((work["release"], work["due"])),  # earliest due date
+        np.argsort(slack, kind="stable"),  # least slack
+        np.lexsort((work["due"], -fee_rate)),  # most late fee per minute of work
+        np.lexsort((work["due"], work["release"])),  # first come, first served
+    ])
+
+
+def _swaps(order, max_neighbours):
+    """Orders one swap away: every pair if few enough, else adjacent pairs."""
+    n = len(order)
+    i, j = np.triu_indices(n, 1)
+    if len(i) > max_neighbours:
+        i = np.arange(n - 1)
+        j = i + 1
+    rows = np.repeat(order[None, :], len(i), axis=0)
+    k = np.arange(len(i))
+    rows[k, i], rows[k, j] = order[j], order[i]
+    return rows
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SCHEDULE
+# ══════════════════════════════════════════════════════════════════════════════
+def schedule(projects, pool, objective="lateness", max_days=1000, time_limit=3.0, max_neighbours=2000):
+    """Prioritise ``projects`` on ``pool``; returns a Schedule.
+
+    Each improvement round simulates every order one swap away from the best
+    so far in a single batch and keeps the best; the search stops when no swap
+    helps or ``time_limit`` seconds have passed.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective {objective!r}; expected one of {OBJECTIVES}")
+    if not projects:
+        raise ValueError("No projects to schedule")
+    names = [p.name for p in projects]
+    if len(set(names)) != len(names):
+        raise ValueError("Project names must be unique")
+    work = _work(projects)
+    deadline = time.perf_counter() + time_limit
+
+    candidates = _rule_orders(work, pool)
+    end, _ = simulate(work, pool, candidates, max_days)
+    scores = _scores(work, end, objective, max_days)
+    k = min(range(len(scores)), key=scores.__getitem__)
+    best_order, best_score = candidates[k], scores[k]
+    evaluations = len(candidates)
+
+    while len(projects) > 1 and time.perf_counter() < deadline:
+        candidates = _swaps(best_order, max_neighbours)
+        end, _ = simulate(work, pool, candidates, max_days)
+        scores = _scores(work, end, objective, max_days)
+        evaluations += len(candidates)
+        k = min(range(len(scores)), key=scores.__getitem__)
+        if scores[k] >= best_score:
+            break
+        best_order, best_score = candidates[k], scores[k]
+
+    end, usage = simulate(work, pool, best_order, max_days, record=True)
+    return _build(projects, work, pool, best_order, end[0], usage, evaluations)
+
+
+def _build(projects, work, pool, order, end, usage, evaluations):
+    finished = end >= 0
+    data_start = work["release"] + work["pre"] + 1
+    finish = np.where(finished, end + work["post"], -1)
+    late = np.where(finished, np.maximum(finish - work["due"], 0), 0)
+    fees = late * work["fee"]
+
+    table = pd.DataFrame({
+        "Project": [p.name for p in projects],
+        "Priority": np.argsort(order) + 1,
+        "Data Start": data_start,
+        "Data + QA End": np.where(finished, end, -1),
+        "Finish": finish,
+        "Due": work["due"],
+        "Days Late": late,
+        "Late Fees ($)": fees,
+        "Planned Cost ($)": work["cost"],
+    })
+
+    gantt = []
+    for k, p in enumerate(projects):
+        phases = [("Setup", work["release"][k] + 1, work["release"][k] + work["pre"][k])]
+        if finished[k]:
+            phases += [("Data + QA", data_start[k], end[k]), ("Wrap-up", end[k] + 1, finish[k])]
+        gantt += [{"Project": p.name, "Phase": ph, "Start": int(s), "End": int(e)} for ph, s, e in phases if e >= s]
+
+    minutes_per_worker = pool.hours_per_worker_day * 60
+    minutes_per_reviewer = pool.reviewer_hours_day * 60
+    days, n = usage["c"].shape
+    usage_df = pd.DataFrame({
+        "Day": np.repeat(np.arange(1, days + 1), n),
+        "Project": np.tile([p.name for p in projects], days),
+        "Cat C workers": (usage["c"] / minutes_per_worker).ravel(),
+        "B-only workers": (usage["b"] / minutes_per_worker).ravel(),
+        "Reviewers": (usage["r"] / max(minutes_per_reviewer, _EPS)).ravel(),
+    })
+    usage_df = usage_df[usage_df[["Cat C workers", "B-only workers", "Reviewers"]].sum(axis=1) > 0]
+
+    return Schedule(
+        projects=table,
+        gantt=pd.DataFrame(gantt, columns=["Project", "Phase", "Start", "End"]),
+        usage=usage_df.reset_index(drop=True),
+        order=tuple(projects[k].name for k in order),
+        total_days_late=int(late.sum()),
+        total_late_fees=float(fees.sum()),
+        makespan=int(finish.max()) if finished.all() else -1,
+        unfinished=tuple(p.name for p, f in zip(projects, finished) if not f),
+        evaluations=evaluations,
+    )
@@ -0,0 +1,93 @@
+"""One-at-a-time sensitivity of total_cost and sequential_days.
+
+Every assumption in SENSITIVITY_FIELDS is moved down and up by ``pct`` percent
+while the rest stay put; all 2 × N perturbed plans (plus the base plan) are
+evaluated as one batch through batch.evaluate_arrays.
+"""
+from dataclasses import asdict
+
+import numpy as np
+import pandas as pd
+
+from batch import evaluate_arrays
+
+# Assumptions to perturb → label shown on the tornado chart.
+# Staffing counts and the manual timeline phases are decisions, not estimates.
+SENSITIVITY_FIELDS = {
+    "fail_a": "Cat A failure rate",
+    "fail_b": "Cat B failure rate",
+    "fail_c": "Cat C failure rate",
+    "time_a": "Cat A time / submission",
+    "time_b": "Cat B time / submission",
+    "time_c": "Cat C time / submission",
+    "qual_time": "Qualification test time",
+    "qa_review_time": "QA review time / submission",
+    "hours_per_worker_day": "Worker hours / day",
+    "retention_rate": "Worker retention rate",
+    "pass_rate": "Qualification pass rate",
+    "invite_take_rate": "Invite take rate",
+    "reviewer_hours_day": "Reviewer hours / day",
+    "review_rate_a": "Cat A review rate",
+    "review_rate_b": "Cat B review rate",
+    "review_rate_c": "Cat C review rate",
+    "worker_hourly": "Worker hourly rate",
+    "reviewer_hourly": "Reviewer hourly rate",
+    "cost_filings": "Filings cost",
+    "cost_auto_check": "Automated checking cost",
+    "cost_database": "Database cost",
+    "llm_price_input": "LLM input price",
+    "llm_price_output": "LLM output price",
+    "tok_sub_in_nosec": "Submission input tokens (w/o SEC)",
+    "tok_sub_out_nosec": "Submission output tokens (w/o SEC)",
+    "tok_sub_in_sec": "Submission input tokens (w/ SEC)",
+    "tok_sub_out_sec": "Submission output tokens (w/ SEC)",
+    "tok_eval_in": "Eval input tokens",
+    "tok_eval_out": "Eval output tokens",
+}
+
+# Percentages keep to the range their widgets allow
+_UPPER = {"fail_a": 50, "fail_b": 50, "fail_c": 50,
+          "retention_rate": 100, "pass_rate": 100, "invite_take_rate": 100,
+          "review_rate_a": 100, "review_rate_b": 100, "review_rate_c": 100}
+
+
+def tornado(inputs, pct=10, metrics=("total_cost", "sequential_days")):
+    """One row per assumption: its low/high values and each metric at low and high.
+
+    Columns are ``field``, ``Input``, ``low``, ``high`` and, per metric,
+    ``<metric> low`` / ``<metric> high`` / ``<metric> swing``; the base plan's
+    values and ``pct`` are in ``df.attrs``.
+    """
+    base = asdict(inputs)
+    names = list(SENSITIVITY_FIELDS)
+    n = 1 + 2 * len(names)
+    cols = {k: np.full(n, np.nan if v is None else v, dtype=float) for k, v in base.items()}
+
+    low = np.array([base[k] * (1 - pct / 100) for k in names])
+    high = np.array([min(base[k] * (1 + pct / 100), _UPPER.get(k, np.inf)) for k in names])
+    for j, name in enumerate(names):
+        cols[name][1 + 2 * j] = low[j]
+        cols[name][2 + 2 * j] = high[j]
+    results = evaluate_arrays(cols)
+
+    df = pd.DataFrame({"field": names, "Input": [SENSITIVITY_FIELDS[k] for k in names], "low": low, "high": high})
+    for m in metrics:
+        values = results[m]
+        df[f"{m} low"] = values[1::2]
+        df[f"{m} high"] = values[2::2]
+        df[f"{m} swing"] = (df[f"{m} high"] - df[f"{m} low"]).abs()
+    df.attrs["base"] = {m: results[m][0] for m in metrics}
+    df.attrs["pct"] = pct
+    return df
+
+
+def tornado_bars(df, metric, top=None):
+    """Long-form bars for one metric: Δ from base at −pct / +pct, biggest swing first."""
+    ranked = df.sort_values(f"{metric} swing", ascending=False)
+    if top:
+        ranked = ranked.head(top)
+    base, pct = df.attrs["base"][metric], df.attrs["pct"]
+    return pd.concat([
+        pd.DataFrame({"Input": ranked["Input"], "Change": f"−{pct}%", "Delta": ranked[f"{metric} low"] - base}),
+        pd.DataFrame({"Input": ranked["Input"], "Change": f"+{pct}%", "Delta": ranked[f"{metric} high"] - base}),
+    ], ignore_index=True)
@@ -0,0 +1,114 @@
+"""Goal seek: the cheapest staffing that meets a deadline and/or budget cap.
+
+The decision variables are the worker split (Cat C-qualified / Cat B-only,
+with target_workers = their sum) and reviewer capacity (num_reviewers ×
+reviewer_hours_day). Review percentages stay as entered — they are a quality
+policy, not a knob to trade away.
+
+The model separates cleanly, which keeps the search small:
+  * cost depends on staffing only through qual_cost, which is nondecreasing in
+    the number of workers, so workers are searched in ascending blocks and the
+    first block with a feasible split holds the cheapest answer;
+  * reviewer cost depends only on total_qa_time, so reviewer capacity is free
+    and only needs to keep QA from being the bottleneck — the fewest reviewers
+    (then fewest hours) that achieve that are chosen in closed form.
+"""
+import math
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from batch import funnel_arrays, workload_arrays
+from calculator import calculate
+
+HOURS_STEP = 0.5  # reviewer_hours_day widget step
+
+
+@dataclass(frozen=True)
+class Solution:
+    inputs: object  # PlanInputs with the chosen staffing
+    results: object  # PlanResults for those inputs
+    candidates: int  # worker splits evaluated
+
+
+def _qa_days(total_qa_time, capacity_minutes):
+    return math.ceil(total_qa_time / max(capacity_minutes, 1))
+
+
+def _reviewers_for(total_qa_time, qa_days, max_reviewers, max_reviewer_hours):
+    """Fewest reviewers, then fewest hours/day, finishing QA within ``qa_days``."""
+    need = total_qa_time / max(qa_days, 1)  # minutes per day
+    for n in range(1, max_reviewers + 1):
+        hours = max(math.ceil(need / (n * 60) / HOURS_STEP) * HOURS_STEP, HOURS_STEP)
+        if hours <= max_reviewer_hours and _qa_days(total_qa_time, n * hours * 60) <= qa_days:
+            return n, hours
+    return max_reviewers, max_reviewer_hours
+
+
+def worker_splits(n_lo, n_hi, needs_c):
+    """Every (cat_c_workers, cat_b_only_workers) pair with n_lo <= total <= n_hi."""
+    n = np.repeat(np.arange(n_lo, n_hi + 1), np.arange(n_lo, n_hi + 1) + 1)
+    cw = np.concatenate([np.arange(k + 1) for k in range(n_lo, n_hi + 1)])
+    keep = cw >= (1 if needs_c else 0)
+    return n[keep], cw[keep], (n - cw)[keep]
+
+
+def solve(inputs, deadline=None, budget=None, max_workers=200, max_reviewers=20,
+          max_reviewer_hours=8.0, block=32):
+    """Search staffing for ``inputs``; returns a Solution, or None if infeasible.
+
+    With a deadline the cheapest plan finishing in time wins (ties → shorter).
+    With only a budget the shortest plan within budget wins (ties → cheaper).
+    """
+    if deadline is None and budget is None:
+        raise ValueError("Give a deadline, a budget, or both")
+    i = inputs
+    base = calculate(i)
+    v, m = base.volume, base.money
+    fixed_days = i.days_finding + i.days_testing + i.days_meeting + i.days_compiling + i.days_buffer
+    total_qa_time = base.qa.total_qa_time
+    qa_floor = _qa_days(total_qa_time, max_reviewers * max_reviewer_hours * 60)
+
+    best = None  # (objective tuple, n, cw, bw, block_days)
+    evaluated = 0
+    for n_lo in range(1, max_workers + 1, block):
+        n, cw, bw = worker_splits(n_lo, min(n_lo + block - 1, max_workers), v.cat_c_required > 0)
+        evaluated += len(n)
+
+        wbp = funnel_arrays(n, i.retention_rate, i.pass_rate, i.invite_take_rate)["workers_before_pass"]
+        qual_cost = wbp * i.qual_time / 60 * i.worker_hourly
+        cost = m.worker_cost + qual_cost + m.reviewer_cost + m.tech_cost
+        if budget is not None and cost.min() > budget:
+            break  # qual_cost only grows with n
+
+        w = workload_arrays(v.cat_a_required, v.cat_b_required, v.cat_c_required,
+                            i.time_a, i.time_b, i.time_c, i.hours_per_worker_day, cw, bw)
+        days_data = np.ceil(np.maximum(np.maximum(w["days_c_worker"], w["days_b_worker"]), 1)).astype(np.int64)
+        block_days = np.maximum(days_data, qa_floor)
+        duration = fixed_days + block_days
+
+        ok = np.ones(len(n), dtype=bool)
+        if deadline is not None:
+            ok &= duration <= deadline
+        if budget is not None:
+            ok &= cost <= budget
+        if not ok.any():
+            continue
+
+        # Lexicographic pick: objective, then the other metric, then fewer workers
+        primary, secondary = (cost, duration) if deadline is not None else (duration, cost)
+        idx = np.flatnonzero(ok)
+        k = idx[np.lexsort((n[idx], secondary[idx], primary[idx]))[0]]
+        candidate = ((primary[k], secondary[k], n[k]), int(n[k]), int(cw[k]), int(bw[k]), int(block_days[k]))
+        if best is None or candidate[0] < best[0]:
+            best = candidate
+        if deadline is not None:
+            break  # cheapest feasible block found; larger teams only cost more
+
+    if best is None:
+        return None
+    _, n, cw, bw, block_days = best
+    num_reviewers, reviewer_hours_day = _reviewers_for(total_qa_time, block_days, max_reviewers, max_reviewer_hours)
+    chosen = replace(i, target_workers=n, cat_c_workers=cw, cat_b_only_workers=bw,
+                     num_reviewers=num_reviewers, reviewer_hours_day=reviewer_hours_day)
+    return Solution(chosen, calculate(chosen), evaluated)
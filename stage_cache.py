@@ -0,0 +1,54 @@
+"""Bounded memo for the calculator stages and section tables.
+
+Each stage is keyed on its own arguments only, so changing e.g. the timeline
+buffer recomputes the Timeline stage and its table while Volume, QA and the
+LLM token math are served from the cache. Cached values are shared between
+sessions — treat them as read-only.
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class StageRun:
+    stage: str
+    hit: bool
+    seconds: float
+
+
+class StageCache:
+    """Thread-safe LRU of stage results, evicting the oldest beyond ``maxsize``."""
+
+    def __init__(self, maxsize=512):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, name, fn, *args, log=None):
+        """Return ``fn(*args)``, computing it only on a miss; appends a StageRun to ``log``."""
+        # Types are part of the key so 2 and 2.0 don't share an entry (they format differently)
+        key = (name, args, tuple(type(a) for a in args))
+        start = time.perf_counter()
+        with self._lock:
+            hit = key in self._entries
+            if hit:
+                self._entries.move_to_end(key)
+                value = self._entries[key]
+        if not hit:
+            value = fn(*args)
+            with self._lock:
+                self._entries[key] = value
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        if log is not None:
+            log.append(StageRun(name, hit, time.perf_counter() - start))
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,107 @@
+"""Cold-start benchmark: how soon a fresh server process paints and finishes the page.
+
+    python startup.py                 # 5 fresh processes, prints JSON, exits 1 over budget
+    python startup.py --repeat 10
+
+Each sample is a new Python process that imports Streamlit and runs app.py
+once through AppTest, like the first session on a newly started instance:
+  import_ms       importing Streamlit (paid before the server is up)
+  first_paint_ms  script start → first element queued for the browser
+  cold_run_ms     script start → end of the first run (every import, every section)
+  process_ms      process spawn → end of the first run, as seen from outside
+Script start is when the runner begins app.py, after the session is set up.
+Only the standard library is imported here, so nothing is preloaded for the
+child processes. bench.py records the same numbers next to its other results.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+APP_PATH = Path(__file__).with_name("app.py")
+BUDGET_MS = {"first_paint_ms": 250, "cold_run_ms": 2000, "process_ms": 3500}  # medians; about 2x a dev laptop
+
+
+def probe():
+    """One cold start in this process; returns the timings in ms."""
+    start = time.perf_counter()
+    from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+    from streamlit.testing.v1 import AppTest
+    imported = time.perf_counter()
+    # A running server has its script runner loaded before the first session arrives
+    AppTest.from_string("import streamlit as st").run()
+
+    marks = {}
+    enqueue, clear = ForwardMsgQueue.enqueue, ForwardMsgQueue.clear
+
+    def timing_enqueue(self, msg):
+        if "paint" not in marks and msg.WhichOneof("type") == "delta":
+            marks["paint"] = time.perf_counter()
+        return enqueue(self, msg)
+
+    def timing_clear(self, *args, **kwargs):
+        # The runner clears the queue as the script starts
+        marks.setdefault("script", time.perf_counter())
+        return clear(self, *args, **kwargs)
+
+    ForwardMsgQueue.enqueue, ForwardMsgQueue.clear = timing_enqueue, timing_clear
+    at = AppTest.from_file(str(APP_PATH), default_timeout=120)
+    at.run()
+    end = time.perf_counter()
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return {
+        "import_ms": (imported - start) * 1000,
+        "first_paint_ms": (marks["paint"] - marks["script"]) * 1000,
+        "cold_run_ms": (end - marks["script"]) * 1000,
+    }
+
+
+def measure(repeat=5):
+    """Median / min of each timing over ``repeat`` fresh processes, with its budget if it has one."""
+    env = {**os.environ}
+    # Keep the app's scenario store out of the working tree
+    env.setdefault("LOGISTICS_SCENARIO_DB", str(Path(tempfile.mkdtemp()) / "scenarios.db"))
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = subprocess.run([sys.executable, __file__, "--probe"], capture_output=True, text=True, env=env, check=True)
+        sample = json.loads(out.stdout.strip().splitlines()[-1])
+        sample["process_ms"] = (time.perf_counter() - start) * 1000
+        samples.append(sample)
+    return {
+        name: {"median_ms": statistics.median(s[name] for s in samples), "min_ms": min(s[name] for s in samples),
+               "repeat": repeat, "number": 1, **({"budget_ms": BUDGET_MS[name]} if name in BUDGET_MS else {})}
+        for name in samples[0]
+    }
+
+
+def over_budget(stats):
+    """"name: median > budget" for every timing past its budget."""
+    return [f"{name}: {s['median_ms']:.1f} > {s['budget_ms']} ms"
+            for name, s in stats.items() if "budget_ms" in s and s["median_ms"] > s["budget_ms"]]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the app's cold start in fresh processes.")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh processes to time (default: 5)")
+    parser.add_argument("--probe", action="store_true", help=argparse.SUPPRESS)  # one sample, in this process
+    args = parser.parse_args(argv)
+    if args.probe:
+        print(json.dumps(probe()))
+        return
+    stats = measure(args.repeat)
+    print(json.dumps(stats, indent=2))
+    for line in over_budget(stats):
+        print(f"OVER BUDGET {line}", file=sys.stderr)
+    if over_budget(stats):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Section tables and the cost summary HTML, built from calculator results.
+
+Each builder takes only the section results and raw inputs it displays, so the
+app can cache them per stage (see stage_cache.py).
+"""
+
+CATEGORIES = ["A (Simple)", "B (Reasoning)", "C (Synthesis)", "Total"]
+
+QUAL_TIMELINE = [
+    ("Day 1–2", "Platform pool filtering and invitation"),
+    ("Day 3–4", "Qualification test completion window (candidates have 36 hours to start once invited, must complete in one 45-minute session)"),
+    ("Day 5", "Automated scoring and flagging for manual review"),
+    ("Day 6", "Manual review of flagged submissions and final selection"),
+    ("Day 7", "Results communication and onboarding for qualified workers"),
+]
+
+
+def _frame(*args, **kwargs):
+    import pandas as pd  # deferred until a table is built, so the page paints first (see app.py)
+    return pd.DataFrame(*args, **kwargs)
+
+
+# ── 1. Volume ────────────────────────────────────────────────────────────────
+def volume_table(volume, total_deliverable, fail_a, fail_b, fail_c):
+    v = volume
+    return _frame({
+        "Category": CATEGORIES,
+        "Target": [v.cat_a_target, v.cat_b_target, v.cat_c_target, total_deliverable],
+        "Failure %": [f"{fail_a}%", f"{fail_b}%", f"{fail_c}%", "—"],
+        "Required": [v.cat_a_required, v.cat_b_required, v.cat_c_required, v.total_required],
+        "Buffer": [v.cat_a_required - v.cat_a_target, v.cat_b_required - v.cat_b_target,
+                   v.cat_c_required - v.cat_c_target, v.total_required - total_deliverable],
+    })
+
+
+# ── 2. Time ──────────────────────────────────────────────────────────────────
+def time_table(volume, time, time_a, time_b, time_c):
+    v, t = volume, time
+    return _frame({
+        "Category": CATEGORIES,
+        "Per Sub": [f"{time_a} min", f"{time_b} min", f"{time_c} min", "—"],
+        "Subs": [v.cat_a_required, v.cat_b_required, v.cat_c_required, v.total_required],
+        "Total Time": [f"{t.total_time_a} min", f"{t.total_time_b} min", f"{t.total_time_c} min", f"{t.total_annotation_time} min"],
+        "Hours": [f"{t.total_time_a/60:.1f}", f"{t.total_time_b/60:.1f}", f"{t.total_time_c/60:.1f}", f"{t.total_annotation_time/60:.1f}"],
+    })
+
+
+# ── 3. People ────────────────────────────────────────────────────────────────
+def workload_table(people, cat_c_workers, cat_b_only_workers):
+    """One row per worker type with at least one worker (may be empty)."""
+    p = people
+    rows = []
+    if cat_c_workers > 0:
+        rows.append({
+            "Worker Type": f"Cat C-qualified (×{cat_c_workers})",
+            "A subs": f"{p.a_per_c:.0f}", "B subs": f"{p.b_per_c:.0f}", "C subs": f"{p.c_per_c:.0f}",
+            "Total min": f"{p.time_c_worker:.0f}", "Days": f"{p.days_c_worker:.1f}",
+        })
+    if cat_b_only_workers > 0:
+        rows.append({
+            "Worker Type": f"Cat B-only (×{cat_b_only_workers})",
+            "A subs": f"{p.a_per_b:.0f}", "B subs": f"{p.b_per_b:.0f}", "C subs": "—",
+            "Total min": f"{p.time_b_worker:.0f}", "Days": f"{p.days_b_worker:.1f}",
+        })
+    return _frame(rows)
+
+
+# ── 4. QA ────────────────────────────────────────────────────────────────────
+def review_table(volume, qa, review_rate_a, review_rate_b, review_rate_c):
+    v, q = volume, qa
+    return _frame({
+        "Category": CATEGORIES,
+        "Required Subs": [v.cat_a_required, v.cat_b_required, v.cat_c_required, v.total_required],
+        "Review Rate": [f"{review_rate_a}%", f"{review_rate_b}%", f"{review_rate_c}%", f"{q.total_reviews}/{v.total_required}"],
+        "Reviews": [q.reviews_a, q.reviews_b, q.reviews_c, q.total_reviews],
+    })
+
+
+# ── 5. Money ─────────────────────────────────────────────────────────────────
+def budget_table(time, people, qa, tech, money, qual_time, worker_hourly, reviewer_hourly):
+    m = money
+    return _frame({
+        "Line Item": ["Worker Annotation", "Qualification Testing", "Expert Review", "Tech / Infrastructure", "TOTAL"],
+        "Formula": [
+            f"Total annotation time ÷ 60 × hourly rate → {time.total_annotation_time} min ÷ 60 × ${worker_hourly:.0f}",
+            f"Test-takers × qual time ÷ 60 × hourly rate → {people.workers_before_pass} × {qual_time} min ÷ 60 × ${worker_hourly:.0f}",
+            f"Reviewer rate × hours → ${reviewer_hourly:.0f} × {qa.total_qa_time / 60:.1f}h",
+            f"Infra ${tech.infra_cost:.0f} + LLM ${tech.total_llm_cost:.2f}",
+            "",
+        ],
+        "Cost": [f"${m.worker_cost:,.0f}", f"${m.qual_cost:,.0f}", f"${m.reviewer_cost:,.0f}", f"${m.tech_cost:,.2f}", f"${m.total_cost:,.2f}"],
+    })
+
+
+def tech_table(volume, tech, cost_filings, cost_auto_check, cost_database):
+    n, t = volume.total_required, tech
+    return _frame({
+        "Component": [
+            "Filings", "Automated checking", "Database",
+            f"LLM Submissions w/o SEC ({n}×)",
+            f"LLM Submissions w/ SEC ({n}×)",
+            f"LLM Evaluations ({t.num_evals}×)",
+            "Total LLM (conservative, w/ SEC)",
+            "TOTAL TECH",
+        ],
+        "Tokens In": [
+            "—", "—", "—",
+            f"{t.total_sub_in_nosec:,}", f"{t.total_sub_in_sec:,}", f"{t.total_eval_in:,}",
+            f"{t.total_sub_in_sec + t.total_eval_in:,}", "—",
+        ],
+        "Tokens Out": [
+            "—", "—", "—",
+            f"{t.total_sub_out_nosec:,}", f"{t.total_sub_out_sec:,}", f"{t.total_eval_out:,}",
+            f"{t.total_sub_out_sec + t.total_eval_out:,}", "—",
+        ],
+        "Cost": [
+            f"${cost_filings:.2f}", f"${cost_auto_check:.2f}", f"${cost_database:.2f}",
+            f"${t.cost_sub_nosec:.2f}", f"${t.cost_sub_sec:.2f}", f"${t.cost_eval:.2f}",
+            f"${t.total_llm_cost:.2f}", f"${t.tech_cost:.2f}",
+        ],
+    })
+
+
+# ── 6. Timeline ──────────────────────────────────────────────────────────────
+def timeline_table(timeline, qa_days_available, days_finding, days_testing, days_meeting, days_compiling, days_buffer):
+    return _frame([
+        ("Finding people", days_finding),
+        ("Testing / qualification", days_testing),
+        ("Data creation + checking", timeline.days_data),
+        ("QA review (parallel with creation)", qa_days_available),
+        ("Customer meeting", days_meeting),
+        ("Compiling & final check", days_compiling),
+        ("Buffer", days_buffer),
+    ], columns=["Phase", "Days"])
+
+
+# ── 7. Qualification timeline ────────────────────────────────────────────────
+def qual_timeline_table():
+    return _frame(QUAL_TIMELINE, columns=["Day", "Activity"])
+
+
+# ── Cost summary (white bg, black text, Arial font) ──────────────────────────
+def cost_summary_html(money):
+    m = money
+    return f"""
+<div style="background-color: #ffffff; padding: 24px 28px; border-radius: 12px; border: 1px solid #e0e0e0; margin-top: 8px;">
+  <h3 style="color: #000000; font-family: Arial, sans-serif; margin-top: 0; margin-bottom: 16px;">Cost Summary by Category</h3>
+  <table style="width: 100%; border-collapse: collapse; font-family: Arial, sans-serif; color: #000000;">
+    <thead>
+      <tr style="border-bottom: 2px solid #333333;">
+        <th style="text-align: left; padding: 10px 12px; font-weight: 700; background-color: #f5f5f5; color: #000000;">Category</th>
+        <th style="text-align: right; padding: 10px 12px; font-weight: 700; background-color: #f5f5f5; color: #000000;">Cost</th>
+      </tr>
+    </thead>
+    <tbody>
+      <tr style="border-bottom: 1px solid #e0e0e0;">
+        <td style="padding: 10px 12px; color: #000000;">Worker Annotation</td>
+        <td style="text-align: right; padding: 10px 12px; color: #000000;">${m.worker_cost:,.2f}</td>
+      </tr>
+      <tr style="border-bottom: 1px solid #e0e0e0;">
+        <td style="padding: 10px 12px; color: #000000;">Qualification Testing</td>
+        <td style="text-align: right; padding: 10px 12px; color: #000000;">${m.qual_cost:,.2f}</td>
+      </tr>
+      <tr style="border-bottom: 1px solid #e0e0e0;">
+        <td style="padding: 10px 12px; color: #000000;">Expert Review (QA)</td>
+        <td style="text-align: right; padding: 10px 12px; color: #000000;">${m.reviewer_cost:,.2f}</td>
+      </tr>
+      <tr style="border-bottom: 1px solid #e0e0e0;">
+        <td style="padding: 10px 12px; color: #000000;">Tech / Infrastructure</td>
+        <td style="text-align: right; padding: 10px 12px; color: #000000;">${m.tech_cost:,.2f}</td>
+      </tr>
+      <tr style="border-top: 2px solid #333333; background-color: #f5f5f5;">
+        <td style="padding: 10px 12px; font-weight: 700; color: #000000;">TOTAL</td>
+        <td style="text-align: right; padding: 10px 12px; font-weight: 700; color: #000000;">${m.total_cost:,.2f}</td>
+      </tr>
+    </tbody>
+  </table>
+</div>
+"""
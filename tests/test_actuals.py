@@ -0,0 +1,141 @@
+"""actuals: incremental ingest against a full read, checkpoints and re-planning."""
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import actuals
+from actuals import CATEGORIES, EVENTS, Checkpoint, ingest, load_checkpoint, replan, save_checkpoint
+from calculator import PlanInputs, calculate
+
+
+@pytest.fixture(autouse=True)
+def small_blocks(monkeypatch):
+    # Many blocks per update, so lines straddling a block edge are exercised
+    monkeypatch.setattr(actuals, "BLOCK_BYTES", 4096)
+
+
+def progress_log(n, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "timestamp": pd.date_range("2026-01-01", periods=n, freq="s").astype(str),
+        "event": rng.choice(["accepted", "Rejected", "review ", "bogus"], n, p=[0.6, 0.2, 0.19, 0.01]),
+        "category": rng.choice(["A", "B", "C", "c", " b", "Z"], n),
+        "minutes": np.round(rng.gamma(3, 10, n), 1),
+    })
+    df.loc[::37, "minutes"] = np.nan
+    return df
+
+
+def reference(df):
+    """Totals of the whole log in one pandas pass."""
+    event = df["event"].str.strip().str.lower()
+    category = df["category"].str.strip().str.upper()
+    ok = event.isin(EVENTS) & category.isin(CATEGORIES)
+    groups = df["minutes"][ok].groupby([event[ok], category[ok]]).agg(["size", "count", "sum"])
+    return {f"{e}/{c}": (int(r["size"]), int(r["count"]), float(r["sum"])) for (e, c), r in groups.iterrows()}, \
+        int((~ok).sum())
+
+
+def assert_totals(checkpoint, df):
+    totals, skipped = reference(df)
+    assert checkpoint.rows == len(df)
+    assert checkpoint.skipped == skipped
+    assert set(checkpoint.totals) == set(totals)
+    for key, (rows, timed, minutes) in totals.items():
+        assert checkpoint.totals[key][:2] == [rows, timed], key
+        assert checkpoint.totals[key][2] == pytest.approx(minutes), key
+
+
+def ingest_file(checkpoint, path):
+    with open(path, "rb") as log:
+        return ingest(checkpoint, log)
+
+
+def test_incremental_ingest_matches_a_full_read(tmp_path):
+    df = progress_log(6000)
+    path = tmp_path / "progress.csv"
+    df.iloc[:2000].to_csv(path, index=False)
+    checkpoint = ingest_file(Checkpoint(), path)
+    assert_totals(checkpoint, df.iloc[:2000])
+
+    # Appended in pieces, the last one cut mid-line
+    rest = df.iloc[2000:].to_csv(index=False, header=False)
+    cuts = [0, len(rest) // 3, len(rest) // 2 + 7, len(rest) - 5, len(rest)]
+    for start, end in zip(cuts, cuts[1:]):
+        with open(path, "a") as log:
+            log.write(rest[start:end])
+        checkpoint = ingest_file(checkpoint, path)
+        complete = df.iloc[:2000 + rest[:end].count("\n")]
+        assert_totals(checkpoint, complete)
+    assert_totals(checkpoint, df)
+    assert ingest_file(checkpoint, path) == checkpoint  # nothing new
+    full = ingest_file(Checkpoint(), path)
+    assert (full.offset, full.head, full.edge) == (checkpoint.offset, checkpoint.head, checkpoint.edge)
+
+
+def test_a_replaced_log_is_read_again(tmp_path):
+    path = tmp_path / "progress.csv"
+    progress_log(3000).to_csv(path, index=False)
+    checkpoint = ingest_file(Checkpoint(), path)
+    replaced = progress_log(500, seed=1)
+    replaced.to_csv(path, index=False)  # shorter
+    assert_totals(ingest_file(checkpoint, path), replaced)
+    longer = progress_log(4000, seed=2)
+    longer.to_csv(path, index=False)  # different start
+    assert_totals(ingest_file(checkpoint, path), longer)
+
+
+def test_header_checks():
+    assert ingest(Checkpoint(), io.BytesIO(b"event,categ")) == Checkpoint()
+    with pytest.raises(ValueError, match="minutes"):
+        ingest(Checkpoint(), io.BytesIO(b"event,category\naccepted,A\n"))
+
+
+def test_checkpoint_round_trip(tmp_path):
+    checkpoint = ingest(Checkpoint(), io.BytesIO(progress_log(300).to_csv(index=False).encode()))
+    path = tmp_path / "cache" / "actuals.json"
+    save_checkpoint(path, checkpoint)
+    assert load_checkpoint(path) == checkpoint
+    assert load_checkpoint(tmp_path / "missing.json") is None
+
+
+def test_server_logs_stay_in_the_log_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(actuals, "LOG_DIR", str(tmp_path))
+    (tmp_path / "b.csv").write_text("event,category,minutes\n")
+    (tmp_path / "a.csv").write_text("event,category,minutes\n")
+    (tmp_path / "notes.txt").write_text("")
+    assert actuals.server_logs() == ["a.csv", "b.csv"]
+    assert actuals.server_log_path("a.csv") == (tmp_path / "a.csv").resolve()
+    for name in ("../a.csv", "/etc/passwd", "notes.txt", "sub/a.csv"):
+        with pytest.raises(ValueError):
+            actuals.server_log_path(name)
+    monkeypatch.setattr(actuals, "LOG_DIR", None)
+    assert actuals.server_logs() == []
+    with pytest.raises(ValueError):
+        actuals.server_log_path("a.csv")
+
+
+def test_checkpoint_paths_differ_per_source():
+    assert actuals.checkpoint_path("upload:s1:log.csv") != actuals.checkpoint_path("upload:s2:log.csv")
+    assert actuals.checkpoint_path("x").parent == actuals.CHECKPOINT_DIR
+
+
+def test_replan_without_actuals_is_the_plan():
+    inputs = PlanInputs()
+    revised = replan(inputs, Checkpoint())
+    plan = calculate(inputs)
+    assert revised.estimate_at_completion == pytest.approx(plan.money.total_cost)
+    assert revised.progress["Accepted"].sum() == 0
+
+
+def test_replan_counts_accepted_work():
+    inputs = PlanInputs(total_deliverable=2000)
+    log = pd.DataFrame({"event": ["accepted"] * 300 + ["rejected"] * 100, "category": "B", "minutes": 30.0})
+    revised = replan(inputs, ingest(Checkpoint(), io.BytesIO(log.to_csv(index=False).encode())))
+    a, b = revised.progress.iloc[0], revised.progress.iloc[1]  # A, B, C, then the total
+    assert (a["Accepted"], b["Accepted"], b["Rejected"]) == (0, 300, 100)
+    assert b["Remaining"] == calculate(inputs).volume.cat_b_target - 300
+    assert revised.progress.iloc[-1]["Accepted"] == 300
+    assert sum(revised.spent.values()) > 0
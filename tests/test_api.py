@@ -0,0 +1,111 @@
+"""api: input normalization, the service cache and the HTTP handler."""
+import http.client
+import json
+import socket
+import threading
+import time
+
+import pytest
+
+from api import BOUNDS, BadRequest, CalculatorService, make_server, normalize
+from calculator import PlanInputs, calculate
+
+
+def test_widget_keys_and_field_names_normalize_alike():
+    assert normalize({"vol_total": 500, "p_cw": 10}) == normalize({"total_deliverable": 500.0, "cat_c_workers": 10})
+    assert normalize({}) == PlanInputs()
+    inputs = normalize({"vol_total": 500.0, "vol_fb": 26})
+    assert type(inputs.total_deliverable) is int and type(inputs.fail_b) is float
+
+
+def test_float_fields_take_fractions():
+    assert normalize({"fail_b": 26.5}).fail_b == 26.5
+    assert normalize({"hours_per_worker_day": 2.25}).hours_per_worker_day == 2.25
+    assert normalize({"num_evals": None}).num_evals is None
+
+
+@pytest.mark.parametrize("payload, message", [
+    ([], "JSON object"),
+    ({"nope": 1}, "Unknown assumption"),
+    ({"vol_total": 5, "total_deliverable": 5}, "given twice"),
+    ({"vol_total": "500"}, "finite number"),
+    ({"vol_total": True}, "finite number"),
+    ({"fail_a": float("nan")}, "finite number"),
+    ({"vol_total": 10 ** 400}, "finite number"),
+    ({"vol_total": 500.5}, "whole number"),
+    ({"num_evals": 1.5}, "whole number"),
+    ({"vol_total": 0}, "at least 1"),
+    ({"fail_b": 51}, "between 0 and 50"),
+    ({"retention_rate": 5}, "between 10 and 100"),
+    ({"reviewer_hours_day": 0.25}, "at least 0.5"),
+    ({"cost_database": -1}, "at least 0"),
+    ({"vol_a": 80, "vol_b": 60}, "must not exceed 100%"),
+    ({"cat_b_pct": 90}, "must not exceed 100%"),
+])
+def test_invalid_payloads_raise(payload, message):
+    with pytest.raises(BadRequest, match=message):
+        normalize(payload)
+
+
+def test_bounds_admit_the_defaults():
+    defaults = PlanInputs()
+    for name, (low, high) in BOUNDS.items():
+        value = getattr(defaults, name)
+        assert value >= low and (high is None or value <= high), name
+
+
+def test_service_caches_equal_plans_written_differently():
+    service = CalculatorService()
+    first = service.calculate({"vol_total": 500, "p_cw": 10})
+    second = service.calculate([{"total_deliverable": 500.0, "cat_c_workers": 10.0}])[0]
+    assert first is second
+    assert first["results"]["money"]["total_cost"] == calculate(normalize({"vol_total": 500, "p_cw": 10})).money.total_cost
+    assert service.metrics()["cache"]["hits"] == 1
+
+
+@pytest.fixture
+def server():
+    server = make_server(port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def post(server, body, headers=None):
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=10)
+    connection.request("POST", "/calculate", body=body, headers=headers or {})
+    response = connection.getresponse()
+    result = response.status, json.loads(response.read())
+    connection.close()
+    return result
+
+
+def test_http_calculate(server):
+    status, body = post(server, json.dumps({"vol_total": 500, "vol_fb": 26.5}))
+    assert status == 200
+    assert body["inputs"]["fail_b"] == 26.5
+    status, body = post(server, json.dumps({"vol_fb": 99}))
+    assert status == 400 and "between 0 and 50" in body["error"]
+    status, body = post(server, json.dumps({"vol_a": 80, "vol_b": 60}))
+    assert status == 400 and "must not exceed 100%" in body["error"]
+
+
+@pytest.mark.parametrize("length", ["-1", "abc"])
+def test_http_rejects_a_bad_content_length(server, length):
+    with socket.create_connection(("127.0.0.1", server.server_port), timeout=10) as sock:
+        sock.sendall(f"POST /calculate HTTP/1.1\r\nHost: x\r\nContent-Length: {length}\r\n\r\n".encode())
+        response = http.client.HTTPResponse(sock)
+        response.begin()
+        assert response.status == 400
+        assert json.loads(response.read()) == {"error": "Invalid Content-Length"}
+
+
+def test_http_rejects_a_huge_integer(server):
+    status, body = post(server, '{"vol_total": 1' + "0" * 400 + "}")
+    assert status == 400 and "finite number" in body["error"]
+    deadline = time.monotonic() + 5
+    while not server.service.metrics()["status"] and time.monotonic() < deadline:
+        time.sleep(0.01)  # the handler records the request after the response is written
+    assert server.service.metrics()["status"] == {"400": 1}
@@ -0,0 +1,63 @@
+"""batch.evaluate_batch against the scalar calculator.calculate."""
+from dataclasses import fields
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from batch import evaluate_batch, product_grid
+from calculator import PlanInputs, calculate
+
+INT_FIELDS = {f.name for f in fields(PlanInputs) if f.type is int}
+
+
+def random_plans(n, seed=0):
+    rng = np.random.default_rng(seed)
+    a = rng.integers(0, 21, n) * 5
+    b = np.array([rng.integers(0, (100 - x) // 5 + 1) * 5 for x in a])
+    return pd.DataFrame({
+        "total_deliverable": rng.integers(1, 200_000, n),
+        "cat_a_pct": a, "cat_b_pct": b,
+        "fail_a": rng.integers(0, 51, n), "fail_b": rng.integers(0, 51, n), "fail_c": rng.integers(0, 51, n),
+        "time_a": rng.integers(1, 100, n), "time_b": rng.integers(1, 100, n), "time_c": rng.integers(1, 200, n),
+        "hours_per_worker_day": rng.choice([0.5, 1.0, 1.5, 2.5, 7.5], n),
+        "target_workers": rng.integers(1, 300, n),
+        "cat_c_workers": rng.integers(0, 300, n), "cat_b_only_workers": rng.integers(0, 300, n),
+        "retention_rate": rng.integers(2, 21, n) * 5, "pass_rate": rng.integers(2, 21, n) * 5,
+        "invite_take_rate": rng.integers(2, 21, n) * 5,
+        "num_reviewers": rng.integers(1, 30, n), "reviewer_hours_day": rng.choice([0.5, 1.5, 5.0, 7.5], n),
+        "review_rate_a": rng.integers(0, 21, n) * 5, "review_rate_b": rng.integers(0, 21, n) * 5,
+        "review_rate_c": rng.integers(0, 21, n) * 5,
+        "worker_hourly": rng.choice([1.0, 20.0, 33.0], n),
+        "num_evals": np.where(rng.random(n) < 0.3, rng.integers(0, 1000, n), np.nan),
+    })
+
+
+def scalar(row):
+    """calculate() on one row, with the int fields back as ints."""
+    values = {k: int(v) if k in INT_FIELDS else float(v) for k, v in row.items() if k != "num_evals"}
+    values["num_evals"] = None if np.isnan(row["num_evals"]) else int(row["num_evals"])
+    return calculate(PlanInputs(**values)).to_dict()
+
+
+def test_matches_calculate_on_random_plans():
+    plans = random_plans(500)
+    out = evaluate_batch(plans)
+    for k, row in plans.iterrows():
+        for name, expected in scalar(row).items():
+            assert out.at[k, name] == pytest.approx(expected, rel=1e-9, abs=1e-9), (k, name)
+
+
+def test_widget_keys_and_missing_columns_take_the_defaults():
+    out = evaluate_batch(pd.DataFrame({"vol_total": [500], "project": ["x"]}))
+    expected = calculate(PlanInputs(total_deliverable=500)).to_dict()
+    assert out.at[0, "project"] == "x"
+    for name, value in expected.items():
+        assert out.at[0, name] == pytest.approx(value), name
+
+
+def test_product_grid():
+    grid = product_grid(total_deliverable=[100, 500], fail_b=range(10, 40, 10))
+    assert list(grid.columns) == ["total_deliverable", "fail_b"]
+    assert len(grid) == 6
+    assert grid.iloc[-1].tolist() == [500, 30]
@@ -0,0 +1,75 @@
+"""categories: the A/B/C table against calculate, and category table validation."""
+import pandas as pd
+import pytest
+
+from calculator import PlanInputs, calculate
+from categories import (Category, abc_categories, categories_from_frame, category_frame, plan_categories,
+                        tiers_from_frame)
+
+
+@pytest.mark.parametrize("inputs", [PlanInputs(), PlanInputs(total_deliverable=1234, fail_c=17, review_rate_b=35),
+                                    PlanInputs(cat_a_pct=60, cat_b_pct=40, cat_c_workers=3)])
+def test_abc_table_matches_the_three_category_plan(inputs):
+    plan = calculate(inputs)
+    categories, tiers = abc_categories(inputs)
+    cat_plan = plan_categories(inputs, categories, tiers)
+    v, q = plan.volume, plan.qa
+    assert cat_plan.categories["Target"].tolist() == [v.cat_a_target, v.cat_b_target, v.cat_c_target]
+    assert cat_plan.categories["Required"].tolist() == [v.cat_a_required, v.cat_b_required, v.cat_c_required]
+    assert cat_plan.total_required == v.total_required
+    assert cat_plan.total_reviews == q.total_reviews
+    assert cat_plan.qa_days_available == q.qa_days_available
+    assert cat_plan.money.worker_cost == pytest.approx(plan.money.worker_cost)
+    assert cat_plan.money.reviewer_cost == pytest.approx(plan.money.reviewer_cost)
+
+
+def frame(changes=()):
+    df = category_frame(abc_categories()[0]).astype({"Tier": float, "Mix %": float})
+    for (column, row), value in dict(changes).items():
+        df.loc[row, column] = value
+    return df
+
+
+def test_frame_round_trip():
+    assert categories_from_frame(frame()) == abc_categories()[0]
+
+
+def test_blank_rows_are_skipped_and_blank_cells_default():
+    df = pd.concat([frame(), pd.DataFrame({"Category": [None]})], ignore_index=True)
+    df.loc[0, "Tier"] = None
+    categories = categories_from_frame(df)
+    assert len(categories) == 3
+    assert categories[0].tier == 1
+
+
+@pytest.mark.parametrize("changes, message", [
+    ({("Tier", 0): 1.5}, "whole number"),
+    ({("Tier", 2): 0}, "whole number"),
+    ({("Mix %", 0): 90}, "must not exceed 100%"),
+    ({("Category", 1): "A"}, "Duplicate"),
+    ({("Failure %", 1): 120}, "between 0 and 100"),
+])
+def test_invalid_rows_raise(changes, message):
+    with pytest.raises(ValueError, match=message):
+        categories_from_frame(frame(changes))
+
+
+def test_mix_under_100_leaves_the_remainder_to_the_last_category():
+    categories = categories_from_frame(frame({("Mix %", 0): 10}))
+    plan = plan_categories(PlanInputs(total_deliverable=1000), categories, ((1, 5), (2, 5)))
+    assert plan.categories["Target"].tolist() == [100, 500, 400]
+
+
+def test_unqualified_categories_are_reported():
+    categories = (Category("A", 50, 0, 10, 0, 1), Category("X", 50, 0, 10, 0, 3))
+    plan = plan_categories(PlanInputs(), categories, ((1, 4), (2, 2)))
+    assert plan.unassigned == ("X",)
+
+
+def test_tiers_from_frame():
+    df = pd.DataFrame({"Tier": [1.0, 2.0, None], "Workers": [4.0, 8.0, 3.0]})
+    assert tiers_from_frame(df) == ((1, 4), (2, 8))
+    for tier, workers, message in ((1.5, 4, "whole number >= 1"), (0, 4, "whole number >= 1"),
+                                   (1, 2.7, "whole number >= 0"), (1, -1, "whole number >= 0")):
+        with pytest.raises(ValueError, match=message):
+            tiers_from_frame(pd.DataFrame({"Tier": [tier], "Workers": [workers]}))
@@ -0,0 +1,40 @@
+"""cli.run: files in, priced plans out, with defaults for anything left out."""
+import json
+
+import pandas as pd
+import pytest
+
+from calculator import PlanInputs, calculate
+from cli import main, run
+
+EXPECTED = [calculate(PlanInputs(total_deliverable=500)), calculate(PlanInputs(target_workers=20))]
+
+
+def check(out):
+    assert len(out) == 2
+    for k, plan in enumerate(EXPECTED):
+        assert out.at[k, "total_cost"] == pytest.approx(plan.money.total_cost)
+        assert out.at[k, "workers_to_invite"] == plan.people.workers_to_invite
+        assert out.at[k, "sequential_days"] == plan.timeline.sequential_days
+
+
+def test_json_lines_rows_with_different_keys(tmp_path):
+    plans = tmp_path / "plans.jsonl"
+    plans.write_text("\n".join(json.dumps(row) for row in ({"vol_total": 500}, {"p_tw": 20})) + "\n")
+    assert run(plans, tmp_path / "out.csv") == 2
+    check(pd.read_csv(tmp_path / "out.csv"))
+
+
+def test_blank_csv_cells_take_the_defaults(tmp_path):
+    plans = tmp_path / "plans.csv"
+    plans.write_text("id,vol_total,p_tw,tc_num_evals\nfirst,500,,\nsecond,,20,\n")
+    run(plans, tmp_path / "out.csv", chunksize=1)
+    out = pd.read_csv(tmp_path / "out.csv")
+    check(out)
+    assert out["id"].tolist() == ["first", "second"]
+    assert out["total_deliverable"].tolist() == [500, 100]
+
+
+def test_unsupported_files_are_usage_errors(tmp_path):
+    with pytest.raises(SystemExit):
+        main([str(tmp_path / "plans.txt"), "-o", str(tmp_path / "out.csv")])
@@ -0,0 +1,59 @@
+"""export: sheets and columns of the stacked tables, and the Excel / Parquet files."""
+import io
+import zipfile
+from dataclasses import fields
+
+import pandas as pd
+import pytest
+
+from calculator import PlanInputs
+from export import evaluate_plans, export_tables, section_tables, to_excel, to_parquet_zip
+
+SHEETS = ["Summary", "Inputs", "Results", "Volume", "Time", "Workload", "Reviews", "Budget", "Tech",
+          "Timeline", "Qualification"]
+
+
+@pytest.fixture(scope="module")
+def plans():
+    return evaluate_plans({"Base": PlanInputs(), "Big": PlanInputs(total_deliverable=5000)})
+
+
+@pytest.fixture(scope="module")
+def sheets(plans):
+    return export_tables(plans)
+
+
+def test_every_table_is_stacked_with_a_scenario_column(plans, sheets):
+    assert list(sheets) == SHEETS
+    for name, df in sheets.items():
+        assert df.columns[0] == "Scenario", name
+    assert sheets["Summary"]["Scenario"].tolist() == ["Base", "Big"]
+    assert sheets["Summary"]["Total Budget ($)"].tolist() == [p.money.total_cost for p in plans.values()]
+    assert list(sheets["Inputs"].columns[1:]) == [f.name for f in fields(PlanInputs)]
+    assert list(sheets["Results"].columns[1:]) == list(plans["Base"].to_dict())
+    volume = section_tables(plans["Big"])["Volume"]
+    stacked = sheets["Volume"]
+    assert len(stacked) == 2 * len(volume)
+    assert stacked[stacked["Scenario"] == "Big"].drop(columns="Scenario").reset_index(drop=True).equals(volume)
+
+
+def test_excel_workbook(sheets):
+    pytest.importorskip("openpyxl")
+    book = pd.read_excel(io.BytesIO(to_excel(sheets)), sheet_name=None)
+    assert list(book) == SHEETS
+    for name, df in sheets.items():
+        assert list(book[name].columns) == list(df.columns), name
+        assert len(book[name]) == len(df), name
+    assert book["Summary"]["Total Budget ($)"].tolist() == pytest.approx(sheets["Summary"]["Total Budget ($)"].tolist())
+
+
+def test_parquet_bundle(sheets):
+    pytest.importorskip("pyarrow")
+    with zipfile.ZipFile(io.BytesIO(to_parquet_zip(sheets))) as bundle:
+        assert bundle.namelist() == [f"{name.lower()}.parquet" for name in SHEETS]
+        for name, df in sheets.items():
+            back = pd.read_parquet(io.BytesIO(bundle.read(f"{name.lower()}.parquet")))
+            assert list(back.columns) == list(df.columns), name
+            assert len(back) == len(df), name
+        results = pd.read_parquet(io.BytesIO(bundle.read("results.parquet")))
+        pd.testing.assert_frame_equal(results, sheets["Results"], check_dtype=False)
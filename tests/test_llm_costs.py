@@ -0,0 +1,53 @@
+"""llm_costs: cache and batch pricing against hand-counted tokens."""
+import pytest
+
+from calculator import PlanInputs, calculate
+from llm_costs import APP_MODEL, CachePricing, CallType, ModelPrice, default_calls, plan_llm, setup_options
+
+PRICING = CachePricing(cache_read=0.1, cache_write=1.25, batch_discount=50)
+
+
+def test_no_cache_no_batch_is_the_naive_cost():
+    inputs = PlanInputs()
+    plan = calculate(inputs)
+    calls = default_calls(inputs, plan.volume.total_required, plan.tech.num_evals)
+    df = plan_llm(calls, (), inputs.llm_price_input, inputs.llm_price_output, PRICING)
+    assert df["Planned ($)"].tolist() == pytest.approx(df["Naive ($)"].tolist())
+    assert df["Naive ($)"].sum() == pytest.approx(plan.tech.total_llm_cost)
+    assert df["Savings ($)"].tolist() == pytest.approx([0.0] * len(df))
+
+
+def test_cache_counts_one_write_per_context_and_reads_for_the_rest():
+    # 10 filings × 4 questions; 75% of the 30 repeat calls hit the cache
+    call = CallType("SEC", calls=40, shared_tokens=1000, unique_tokens=100, output_tokens=50,
+                    calls_per_context=4, cache_hit_pct=75, cached=True)
+    row = plan_llm((call,), (), 2.0, 10.0, PRICING).iloc[0]
+    hits = 22  # floor(30 × 0.75)
+    writes = 40 - hits
+    assert row["Cached In"] == hits * 1000
+    assert row["Cache Writes"] == writes * 1000
+    assert row["Uncached In"] == 40 * 100
+    assert row["Output"] == 40 * 50
+    expected = (40 * 100 * 2.0 + hits * 1000 * 2.0 * 0.1 + writes * 1000 * 2.0 * 1.25 + 40 * 50 * 10.0) / 1e6
+    assert row["Planned ($)"] == pytest.approx(expected)
+
+
+def test_batch_discount_and_other_models():
+    call = CallType("Evals", calls=1000, shared_tokens=0, unique_tokens=500, output_tokens=100,
+                    model="small", batched=True)
+    small = ModelPrice("small", 0.5, 1.5)
+    row = plan_llm((call,), (small,), 3.0, 15.0, PRICING).iloc[0]
+    assert row["Planned ($)"] == pytest.approx((1000 * 500 * 0.5 + 1000 * 100 * 1.5) / 1e6 * 0.5)
+    assert row["Naive ($)"] == pytest.approx((1000 * 500 * 3.0 + 1000 * 100 * 15.0) / 1e6)
+    with pytest.raises(ValueError, match="No price"):
+        plan_llm((CallType("x", 1, 0, 1, 1, model="missing"),), (), 1.0, 1.0)
+
+
+def test_setup_options_are_sorted_and_complete():
+    call = CallType("SEC", 40, 1000, 100, 50, calls_per_context=4)
+    options = setup_options(call, (ModelPrice("small", 0.5, 1.5),), 2.0, 10.0, PRICING)
+    assert len(options) == 2 * 2 * 2
+    assert options["Cost ($)"].is_monotonic_increasing
+    cheapest = options.iloc[0]
+    assert (cheapest["Model"], cheapest["Cache"], cheapest["Batch"]) == ("small", True, True)
+    assert set(options["Model"]) == {APP_MODEL, "small"}
@@ -0,0 +1,76 @@
+"""pareto.frontier against a brute-force evaluation of the full grid."""
+from dataclasses import asdict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from batch import evaluate_batch
+from calculator import PlanInputs, calculate
+from pareto import frontier, pareto_mask, point_inputs, review_rates
+from solver import HOURS_STEP, worker_splits
+
+MAX_WORKERS, MAX_REVIEWERS, MAX_HOURS = 20, 4, 4.0
+SCALES = (50, 100, 150)
+
+
+def full_grid(inputs):
+    """Every configuration frontier() covers, evaluated one row each."""
+    n, cw, bw = worker_splits(1, MAX_WORKERS, calculate(inputs).volume.cat_c_required > 0)
+    team = pd.DataFrame({"target_workers": n, "cat_c_workers": cw, "cat_b_only_workers": bw})
+    reviewers, hours = np.meshgrid(np.arange(1, MAX_REVIEWERS + 1),
+                                   np.arange(1, int(MAX_HOURS / HOURS_STEP) + 1) * HOURS_STEP)
+    review = pd.DataFrame({"num_reviewers": reviewers.ravel(), "reviewer_hours_day": hours.ravel()})
+    policy = pd.DataFrame([(scale, *review_rates(inputs, scale)) for scale in SCALES],
+                          columns=["policy", "review_rate_a", "review_rate_b", "review_rate_c"])
+    grid = team.merge(review, how="cross").merge(policy, how="cross")
+    fixed = {k: v for k, v in asdict(inputs).items() if k not in grid.columns}
+    fixed["num_evals"] = np.nan if fixed["num_evals"] is None else fixed["num_evals"]
+    return evaluate_batch(grid.assign(**fixed))
+
+
+def brute_mask(cost, duration):
+    """O(n²): not beaten on both cost and duration by any other point."""
+    cost, duration = np.asarray(cost), np.asarray(duration)
+    beaten = ((cost[None, :] <= cost[:, None]) & (duration[None, :] <= duration[:, None])
+              & ((cost[None, :] < cost[:, None]) | (duration[None, :] < duration[:, None])))
+    return ~beaten.any(axis=1)
+
+
+def test_pareto_mask_matches_pairwise_dominance():
+    rng = np.random.default_rng(0)
+    cost, duration = rng.integers(0, 30, 400).astype(float), rng.integers(0, 30, 400)
+    mask = pareto_mask(cost, duration)
+    front = set(zip(cost[mask], duration[mask]))
+    assert front == set(zip(cost[brute_mask(cost, duration)], duration[brute_mask(cost, duration)]))
+    assert mask.sum() == len(front)  # one point per tie
+
+
+@pytest.mark.parametrize("inputs", [PlanInputs(), PlanInputs(total_deliverable=3000, fail_b=30),
+                                    PlanInputs(total_deliverable=700, cat_a_pct=10, cat_b_pct=80)])
+def test_frontier_matches_brute_force(inputs):
+    result = frontier(inputs, MAX_WORKERS, MAX_REVIEWERS, MAX_HOURS, SCALES)
+    grid = full_grid(inputs)
+    assert result.configurations == len(grid)
+    for scale in SCALES:
+        block = grid[grid["policy"] == scale]
+        front = block[brute_mask(block["total_cost"].to_numpy(), block["sequential_days"].to_numpy())]
+        points = result.points[result.points["Review policy"] == scale]
+        assert sorted(zip(points["total_cost"].round(6), points["sequential_days"])) == \
+            sorted(set(zip(front["total_cost"].round(6), front["sequential_days"])))
+
+
+def test_frontier_points_reproduce_with_calculate():
+    inputs = PlanInputs(total_deliverable=1500)
+    for point in frontier(inputs, MAX_WORKERS, MAX_REVIEWERS, MAX_HOURS, SCALES).points.to_dict("records"):
+        plan = calculate(point_inputs(inputs, point))
+        assert plan.money.total_cost == pytest.approx(point["total_cost"])
+        assert plan.timeline.sequential_days == point["sequential_days"]
+
+
+def test_review_rates_snap_to_the_slider():
+    inputs = PlanInputs(review_rate_a=30, review_rate_b=50, review_rate_c=60)
+    assert review_rates(inputs, 100) == (30, 50, 60)
+    assert review_rates(inputs, 50) == (15, 25, 30)
+    assert review_rates(inputs, 150) == (45, 75, 90)
+    assert review_rates(inputs, 250) == (75, 100, 100)
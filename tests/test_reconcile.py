@@ -0,0 +1,76 @@
+"""reconcile: exact splits add up, and the float chain agrees with them on valid plans."""
+from decimal import Decimal
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from calculator import PlanInputs, calculate
+from reconcile import exact, gross_up, largest_remainder, reconcile, spread
+
+
+def random_inputs(n, seed=0):
+    rng = np.random.default_rng(seed)
+    for _ in range(n):
+        a = int(rng.integers(0, 101))
+        yield PlanInputs(
+            total_deliverable=int(rng.integers(1, 100_000)), cat_a_pct=a, cat_b_pct=int(rng.integers(0, 101 - a)),
+            fail_a=round(float(rng.uniform(0, 50)), 1), fail_b=round(float(rng.uniform(0, 50)), 1),
+            fail_c=round(float(rng.uniform(0, 50)), 1),
+            time_a=int(rng.integers(1, 90)), time_b=int(rng.integers(1, 90)), time_c=int(rng.integers(1, 120)),
+            cat_c_workers=int(rng.integers(1, 80)), cat_b_only_workers=int(rng.integers(0, 80)),
+            review_rate_a=int(rng.integers(0, 101)), review_rate_b=int(rng.integers(0, 101)),
+            review_rate_c=int(rng.integers(0, 101)), num_reviewers=int(rng.integers(1, 10)),
+        )
+
+
+def test_exact_reads_floats_as_typed():
+    assert exact(6.3) == Fraction(63, 10)
+    assert exact(7) == 7
+
+
+@pytest.mark.parametrize("total, weights", [(100, (30, 50, 20)), (7, (1, 1, 1)), (1, (0.1, 0.2, 0.7)),
+                                            (12345, (33.3, 33.3, 33.4)), (5, (0, 0)), (0, (1, 2))])
+def test_largest_remainder_adds_up(total, weights):
+    shares = largest_remainder(total, weights)
+    assert sum(shares) == (total if sum(weights) else 0)
+    assert all(share >= 0 for share in shares)
+    quotas = [total * exact(w) / sum(exact(w) for w in weights) if sum(weights) else 0 for w in weights]
+    assert all(abs(share - quota) < 1 for share, quota in zip(shares, quotas))
+
+
+def test_gross_up_matches_the_calculator():
+    plan = calculate(PlanInputs(total_deliverable=1000, fail_a=6, fail_b=26, fail_c=34))
+    v = plan.volume
+    assert [gross_up(t, f) for t, f in ((v.cat_a_target, 6), (v.cat_b_target, 26), (v.cat_c_target, 34))] == \
+        [v.cat_a_required, v.cat_b_required, v.cat_c_required]
+
+
+@pytest.mark.parametrize("totals, workers", [((21, 37, 20), 8), ((5, 0, 3), 4), ((0, 0, 0), 3), ((9, 9), 0)])
+def test_spread_puts_every_submission_on_one_worker(totals, workers):
+    counts = spread(totals, workers)
+    assert counts.shape == (workers, len(totals))
+    if workers:
+        assert counts.sum(axis=0).tolist() == list(totals)
+        assert (counts.max(axis=0) - counts.min(axis=0)).max() <= 1
+        assert counts.sum(axis=1).max() - counts.sum(axis=1).min() <= 1
+
+
+def test_valid_plans_reconcile_without_errors():
+    for inputs in random_inputs(200):
+        plan = calculate(inputs)
+        rec = reconcile(plan)
+        assert not rec.errors, (inputs, rec.errors)
+        assert sum(rec.targets) == inputs.total_deliverable
+        allocation = rec.allocation
+        assert allocation["A subs"].sum() == plan.volume.cat_a_required
+        assert allocation["B subs"].sum() == plan.volume.cat_b_required
+        assert allocation["C subs"].sum() == plan.volume.cat_c_required
+        assert abs(rec.total_cost - Decimal(repr(plan.money.total_cost))) <= Decimal("0.01")
+
+
+def test_contradictions_are_errors():
+    over = reconcile(calculate(PlanInputs(cat_a_pct=70, cat_b_pct=50)))
+    assert {c.name for c in over.errors} >= {"Category mix", "Targets add up"}
+    no_c = reconcile(calculate(PlanInputs(cat_c_workers=0, cat_b_only_workers=5)))
+    assert [c.name for c in no_c.errors] == ["Every submission assigned"]
@@ -0,0 +1,59 @@
+"""risk: seeded Monte Carlo percentiles and three-point spreads."""
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from calculator import PlanInputs, calculate
+from risk import Distribution, percentiles, simulate, spread, summarize
+
+INPUTS = PlanInputs(total_deliverable=2000)
+
+
+def test_seeded_runs_repeat():
+    distributions = {"fail_b": spread("pert", 26, 30, 50), "time_c": spread("triangular", 60, 20, 40)}
+    a, b = simulate(INPUTS, distributions, 5000, seed=7), simulate(INPUTS, distributions, 5000, seed=7)
+    assert np.array_equal(a["total_cost"], b["total_cost"])
+    assert not np.array_equal(a["total_cost"], simulate(INPUTS, distributions, 5000, seed=8)["total_cost"])
+
+
+def test_percentiles_follow_the_drawn_input():
+    # Cost only grows with the failure rate, so its median is the cost at the median draw
+    trials, seed = 1001, 3
+    distribution = Distribution("uniform", 20, 25, 30)
+    results = simulate(INPUTS, {"fail_b": distribution}, trials, seed)
+    draws = distribution.sample(np.random.default_rng(seed), trials)
+    table = percentiles(results)
+    median_plan = calculate(replace(INPUTS, fail_b=float(np.median(draws))))
+    assert table.at["total_cost", "P50"] == pytest.approx(median_plan.money.total_cost)
+    assert table.at["total_cost", "P50"] <= table.at["total_cost", "P90"] <= table.at["total_cost", "P99"]
+    assert table.at["total_cost", "Mean"] == pytest.approx(results["total_cost"].mean())
+
+
+def test_no_spread_is_the_point_plan():
+    plan = calculate(INPUTS)
+    table, cost_hist, _ = summarize(INPUTS, (("fail_b", spread("pert", INPUTS.fail_b, 0, 0)),), 1000, seed=1, bins=10)
+    assert table.loc["total_cost"].tolist() == pytest.approx([plan.money.total_cost] * 4)
+    assert table.loc["sequential_days"].tolist() == pytest.approx([plan.timeline.sequential_days] * 4)
+    assert cost_hist["Trials"].sum() == 1000
+
+
+def test_draws_stay_in_range():
+    results = simulate(INPUTS, {"retention_rate": Distribution("uniform", 50, 90, 150)}, 2000, seed=0)
+    worst = calculate(replace(INPUTS, retention_rate=100))
+    assert results["workers_before_retention"].min() == worst.people.workers_before_retention
+
+
+@pytest.mark.parametrize("low, high", [(np.nan, 50), (30, None), (None, np.nan)])
+def test_cleared_spread_cells_mean_no_spread(low, high):
+    d = spread("pert", 20, low, high)
+    assert d.mode == 20
+    assert d.low == (20 if low is None or np.isnan(low) else 14)
+    assert d.high == (20 if high is None or np.isnan(high) else 30)
+
+
+def test_invalid_distributions():
+    with pytest.raises(ValueError, match="low <= mode <= high"):
+        Distribution("pert", 5, 4, 6)
+    with pytest.raises(ValueError, match="Unknown distribution"):
+        Distribution("normal", 1, 2, 3)
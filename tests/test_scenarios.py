@@ -0,0 +1,51 @@
+"""scenarios.ScenarioStore: SQLite save / load / delete round trip."""
+import pytest
+
+from calculator import PlanInputs, calculate
+from scenarios import COMPARE_LINES, ScenarioStore, input_hash
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ScenarioStore(str(tmp_path / "scenarios.db"))
+
+
+def test_save_load_round_trip(store):
+    inputs = PlanInputs(total_deliverable=750, fail_b=27.5, num_evals=40)
+    store.save("Q3", inputs)
+    assert store.names() == ["Q3"]
+    assert store.load("Q3") == inputs
+    assert store.results(["Q3"])["Q3"] == pytest.approx(calculate(inputs).to_dict())
+    with pytest.raises(KeyError):
+        store.load("missing")
+
+
+def test_overwrite_and_delete(store, tmp_path):
+    store.save("a", PlanInputs())
+    store.save("b", PlanInputs())  # same inputs, one cached result
+    store.save("a", PlanInputs(total_deliverable=300))
+    assert store.load("a").total_deliverable == 300
+    store.delete("a")
+    assert store.names() == ["b"]
+    assert store.load("b") == PlanInputs()
+    reopened = ScenarioStore(str(tmp_path / "scenarios.db"))
+    assert reopened.names() == ["b"]
+    store.delete("b")
+    assert store.names() == [] and store.results(["b"]) == {}
+
+
+def test_compare_against_the_first(store):
+    base, bigger = PlanInputs(), PlanInputs(total_deliverable=200)
+    store.save("base", base)
+    store.save("bigger", bigger)
+    table = store.compare(["base", "bigger"])
+    assert list(table.columns) == ["base", "bigger", "Δ bigger"]
+    assert list(table.index) == list(COMPARE_LINES.values())
+    delta = calculate(bigger).money.total_cost - calculate(base).money.total_cost
+    assert table.at["TOTAL", "Δ bigger"] == pytest.approx(delta)
+    assert len(store.budget_lines(["base", "bigger"])) == 8
+
+
+def test_input_hash_is_stable():
+    assert input_hash(PlanInputs()) == input_hash(PlanInputs())
+    assert input_hash(PlanInputs()) != input_hash(PlanInputs(fail_a=7))
@@ -0,0 +1,66 @@
+"""scheduler.schedule: the swap search and projects the pool cannot finish."""
+import itertools
+
+import numpy as np
+import pytest
+
+from calculator import PlanInputs
+from scheduler import Pool, Project, _scores, _swaps, _work, schedule, simulate
+
+POOL = Pool(cat_c_workers=10, cat_b_only_workers=5, hours_per_worker_day=2.0, num_reviewers=2, reviewer_hours_day=4.0)
+PROJECTS = (
+    Project("big", PlanInputs(total_deliverable=900), due_day=60, late_fee=100.0),
+    Project("urgent", PlanInputs(total_deliverable=200), due_day=12, late_fee=500.0),
+    Project("late start", PlanInputs(total_deliverable=300), due_day=30, release_day=5, late_fee=50.0),
+    Project("capped", PlanInputs(total_deliverable=400), due_day=25, late_fee=200.0, max_workers=4),
+)
+
+
+@pytest.mark.parametrize("objective", ["lateness", "cost"])
+def test_swap_search_ends_at_a_local_optimum(objective):
+    plan = schedule(PROJECTS, POOL, objective, time_limit=30)
+    work = _work(PROJECTS)
+    order = np.array([[p.name for p in PROJECTS].index(name) for name in plan.order])
+    best = _scores(work, simulate(work, POOL, order)[0], objective, 1000)[0]
+    neighbours = _scores(work, simulate(work, POOL, _swaps(order, 2000))[0], objective, 1000)
+    assert min(neighbours) >= best
+    # Four projects: check against every order too
+    every = _scores(work, simulate(work, POOL, np.array(list(itertools.permutations(range(4)))))[0], objective, 1000)
+    assert best == min(every)
+    assert plan.unfinished == ()
+    if objective == "lateness":
+        assert plan.total_days_late == best[0]
+    else:
+        assert plan.total_late_fees == pytest.approx(best[0])
+
+
+def test_schedule_table_is_consistent():
+    plan = schedule(PROJECTS, POOL, time_limit=30)
+    table = plan.projects.set_index("Project")
+    assert sorted(table["Priority"]) == [1, 2, 3, 4]
+    assert (table["Days Late"] == np.maximum(table["Finish"] - table["Due"], 0)).all()
+    assert plan.makespan == table["Finish"].max()
+    assert table.at["late start", "Data Start"] == 5 + PlanInputs().days_finding + PlanInputs().days_testing + 1
+    assert (plan.usage.groupby("Day")["Cat C workers"].sum() <= POOL.cat_c_workers + 1e-9).all()
+
+
+def test_projects_the_pool_cannot_finish_are_reported():
+    no_c = Pool(cat_c_workers=0, cat_b_only_workers=5, hours_per_worker_day=2.0, num_reviewers=1, reviewer_hours_day=4.0)
+    ab_only = PlanInputs(total_deliverable=100, cat_a_pct=50, cat_b_pct=50)
+    projects = (Project("needs C", PlanInputs(total_deliverable=100), due_day=40),
+                Project("A/B only", ab_only, due_day=40))
+    plan = schedule(projects, no_c, max_days=200, time_limit=5)
+    assert plan.unfinished == ("needs C",)
+    assert plan.makespan == -1
+    table = plan.projects.set_index("Project")
+    assert table.at["needs C", "Finish"] == -1 and table.at["A/B only", "Finish"] > 0
+    assert set(plan.gantt.loc[plan.gantt["Project"] == "needs C", "Phase"]) == {"Setup"}
+
+
+def test_invalid_requests():
+    with pytest.raises(ValueError, match="unique"):
+        schedule(PROJECTS[:1] * 2, POOL)
+    with pytest.raises(ValueError, match="objective"):
+        schedule(PROJECTS, POOL, "speed")
+    with pytest.raises(ValueError, match="No projects"):
+        schedule((), POOL)
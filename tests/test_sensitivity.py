@@ -0,0 +1,36 @@
+"""sensitivity.tornado against one calculate() per perturbed input."""
+from dataclasses import replace
+
+import pytest
+
+from calculator import PlanInputs, calculate
+from sensitivity import SENSITIVITY_FIELDS, tornado, tornado_bars
+
+
+def test_every_bar_matches_calculate():
+    inputs = PlanInputs(total_deliverable=1500)
+    df = tornado(inputs, pct=20).set_index("field")
+    assert df.attrs["base"]["total_cost"] == pytest.approx(calculate(inputs).money.total_cost)
+    for name in SENSITIVITY_FIELDS:
+        for side in ("low", "high"):
+            plan = calculate(replace(inputs, **{name: df.at[name, side]}))
+            assert df.at[name, f"total_cost {side}"] == pytest.approx(plan.money.total_cost), (name, side)
+            assert df.at[name, f"sequential_days {side}"] == plan.timeline.sequential_days, (name, side)
+
+
+def test_rates_stay_within_the_widget_ranges():
+    inputs = PlanInputs(fail_a=48, fail_b=50, retention_rate=95, review_rate_c=100)
+    df = tornado(inputs, pct=10).set_index("field")
+    assert df.at["fail_a", "high"] == 50
+    assert df.at["fail_b", "high"] == 50
+    assert df.at["retention_rate", "high"] == 100
+    assert df.at["review_rate_c", "high"] == 100
+    assert df.at["fail_a", "low"] == pytest.approx(43.2)
+
+
+def test_bars_rank_by_swing():
+    df = tornado(PlanInputs())
+    bars = tornado_bars(df, "total_cost", top=5)
+    assert len(bars) == 10
+    top = df.sort_values("total_cost swing", ascending=False)["Input"].head(5).tolist()
+    assert bars["Input"].iloc[:5].tolist() == top
@@ -0,0 +1,71 @@
+"""solver.solve against a brute-force search of the same staffing grid."""
+from dataclasses import asdict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from batch import evaluate_batch
+from calculator import PlanInputs, calculate
+from solver import HOURS_STEP, solve, worker_splits
+
+MAX_WORKERS, MAX_REVIEWERS, MAX_HOURS = 30, 4, 4.0
+PLANS = [PlanInputs(total_deliverable=600), PlanInputs(total_deliverable=2000, fail_b=30),
+         PlanInputs(total_deliverable=900, cat_a_pct=40, cat_b_pct=60)]
+
+
+def every_staffing(inputs):
+    """Every worker split × reviewer count × hours/day the solver searches, evaluated."""
+    n, cw, bw = worker_splits(1, MAX_WORKERS, calculate(inputs).volume.cat_c_required > 0)
+    reviewers, hours = np.meshgrid(np.arange(1, MAX_REVIEWERS + 1),
+                                   np.arange(1, int(MAX_HOURS / HOURS_STEP) + 1) * HOURS_STEP)
+    team = pd.DataFrame({"target_workers": n, "cat_c_workers": cw, "cat_b_only_workers": bw})
+    review = pd.DataFrame({"num_reviewers": reviewers.ravel(), "reviewer_hours_day": hours.ravel()})
+    grid = team.merge(review, how="cross")
+    fixed = {k: v for k, v in asdict(inputs).items() if k not in grid.columns}
+    fixed["num_evals"] = np.nan if fixed["num_evals"] is None else fixed["num_evals"]
+    return evaluate_batch(grid.assign(**fixed))
+
+
+def solved(inputs, deadline=None, budget=None):
+    return solve(inputs, deadline, budget, max_workers=MAX_WORKERS, max_reviewers=MAX_REVIEWERS,
+                 max_reviewer_hours=MAX_HOURS)
+
+
+@pytest.mark.parametrize("inputs", PLANS)
+def test_deadline_gives_the_cheapest_plan_in_time(inputs):
+    grid = every_staffing(inputs)
+    for deadline in np.unique(grid["sequential_days"])[::3]:
+        feasible = grid[grid["sequential_days"] <= deadline]
+        cheapest = feasible["total_cost"].min()
+        solution = solved(inputs, deadline=deadline)
+        assert solution.results.money.total_cost == pytest.approx(cheapest)
+        assert solution.results.timeline.sequential_days == \
+            feasible.loc[np.isclose(feasible["total_cost"], cheapest), "sequential_days"].min()
+    assert solved(inputs, deadline=grid["sequential_days"].min() - 1) is None
+
+
+@pytest.mark.parametrize("inputs", PLANS)
+def test_budget_gives_the_fastest_plan_within_it(inputs):
+    grid = every_staffing(inputs)
+    for budget in np.quantile(grid["total_cost"], [0.0, 0.1, 0.5, 1.0]):
+        feasible = grid[grid["total_cost"] <= budget]
+        fastest = feasible["sequential_days"].min()
+        solution = solved(inputs, budget=budget)
+        assert solution.results.timeline.sequential_days == fastest
+        assert solution.results.money.total_cost == \
+            pytest.approx(feasible.loc[feasible["sequential_days"] == fastest, "total_cost"].min())
+    assert solved(inputs, budget=grid["total_cost"].min() - 1) is None
+
+
+def test_solution_staffing_is_consistent():
+    solution = solved(PLANS[0], deadline=40, budget=1e9)
+    x = solution.inputs
+    assert x.target_workers == x.cat_c_workers + x.cat_b_only_workers
+    assert x.num_reviewers <= MAX_REVIEWERS and x.reviewer_hours_day <= MAX_HOURS
+    assert solution.results == calculate(x)
+
+
+def test_needs_a_goal():
+    with pytest.raises(ValueError):
+        solve(PlanInputs())
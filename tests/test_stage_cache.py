@@ -0,0 +1,56 @@
+"""stage_cache.StageCache: hits, misses and LRU eviction."""
+import threading
+
+from stage_cache import StageCache
+
+
+def counting(calls):
+    def fn(*args):
+        calls.append(args)
+        return sum(args)
+    return fn
+
+
+def test_hits_and_misses_are_logged():
+    calls, log = [], []
+    cache = StageCache(maxsize=8)
+    fn = counting(calls)
+    assert cache.get("add", fn, 1, 2, log=log) == 3
+    assert cache.get("add", fn, 1, 2, log=log) == 3
+    assert cache.get("other", fn, 1, 2, log=log) == 3  # the stage name is part of the key
+    assert cache.get("add", fn, 1.0, 2, log=log) == 3.0  # so are the argument types
+    assert [(run.stage, run.hit) for run in log] == [("add", False), ("add", True), ("other", False), ("add", False)]
+    assert len(calls) == 3 and len(cache) == 3
+
+
+def test_least_recently_used_entry_is_evicted():
+    calls = []
+    cache = StageCache(maxsize=2)
+    fn = counting(calls)
+    cache.get("s", fn, 1)
+    cache.get("s", fn, 2)
+    cache.get("s", fn, 1)  # 1 is now the most recent
+    cache.get("s", fn, 3)  # evicts 2
+    assert len(cache) == 2
+    log = []
+    cache.get("s", fn, 1, log=log)
+    cache.get("s", fn, 3, log=log)
+    cache.get("s", fn, 2, log=log)
+    assert [run.hit for run in log] == [True, True, False]
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_concurrent_gets_stay_bounded():
+    cache = StageCache(maxsize=16)
+
+    def work(offset):
+        for k in range(200):
+            assert cache.get("s", lambda x: x * 2, (k + offset) % 40) == (k + offset) % 40 * 2
+
+    threads = [threading.Thread(target=work, args=(t,)) for t in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(cache) <= 16